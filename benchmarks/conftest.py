@@ -0,0 +1,48 @@
+"""Benchmark configuration, the benchmarks use the pytest-benchmark plugin"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+# Size of the messages used to measure throughput
+MESSAGE_SIZE = 4096
+
+
+@pytest.fixture(scope="session")
+def message():
+    """Pseudo-random data of MESSAGE_SIZE bytes, the same in every run"""
+    return bytes((index * 7919 + (index >> 5)) & 0xFF for index in range(MESSAGE_SIZE))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_caches(tmp_path_factory):
+    """Keep the libraries compiled by the "cc" engine out of the user's cache
+    and stop calculated tables being loaded from the table cache, so that
+    they are really calculated"""
+    # pylint: disable=import-outside-toplevel
+    from crcengine import cc, tablestore
+
+    cc.set_cache_dir(str(tmp_path_factory.mktemp("cc_cache")))
+    tablestore.set_table_cache_dir(None)
+    yield
+    cc.set_cache_dir(None)
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    """Record the throughput of the benchmarks that process a message"""
+    # pylint: disable=unused-argument
+    for bench in output_json["benchmarks"]:
+        num_bytes = bench["extra_info"].get("bytes")
+        if num_bytes:
+            bench["extra_info"]["mb_per_s"] = num_bytes / bench["stats"]["min"] / 1e6
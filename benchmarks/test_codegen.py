@@ -0,0 +1,29 @@
+"""End to end time taken by generate_code"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+import crcengine
+
+# pylint: disable=missing-function-docstring
+
+
+@pytest.mark.parametrize("language, strategy", [("C", "table"), ("C", "slice8"),
+                                                ("C", "nibble"), ("Python", "table")])
+@pytest.mark.parametrize("algorithm_name", ["crc16-xmodem", "crc32", "crc64-ecma"])
+def test_generate_code(benchmark, tmp_path, algorithm_name, language, strategy):
+    benchmark.group = f"codegen-{language}-{strategy}"
+    benchmark(crcengine.generate_code, algorithm_name, str(tmp_path), language=language,
+              strategy=strategy)
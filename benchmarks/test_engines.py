@@ -0,0 +1,43 @@
+"""Throughput of each calculation engine for each class of CRC width"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+import crcengine
+
+from .conftest import MESSAGE_SIZE
+
+# pylint: disable=missing-function-docstring
+
+# An algorithm of each width class, the narrow and odd widths take different
+# paths through the engines from the byte-multiple ones
+WIDTH_ALGORITHMS = {
+    5: "crc5-usb",
+    8: "crc8",
+    15: "crc15-can",
+    16: "crc16-xmodem",
+    24: "crc24-flexray16-a",
+    32: "crc32",
+    64: "crc64-ecma",
+}
+
+
+@pytest.mark.parametrize("width", list(WIDTH_ALGORITHMS))
+@pytest.mark.parametrize("engine", list(crcengine.available_calculation_engines()))
+def test_engine_throughput(benchmark, message, engine, width):
+    algorithm = crcengine.new(WIDTH_ALGORITHMS[width], engine)
+    benchmark.group = f"engine-{width}"
+    benchmark.extra_info["bytes"] = MESSAGE_SIZE
+    benchmark(algorithm, message)
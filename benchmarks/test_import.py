@@ -0,0 +1,35 @@
+"""Time taken by "import crcengine", in a new interpreter each time"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import subprocess
+import sys
+
+import pytest
+
+# pylint: disable=missing-function-docstring
+
+# The interpreter's own start up is included for comparison
+STATEMENTS = {
+    "interpreter": "pass",
+    "import": "import crcengine",
+    "first_use": "import crcengine; crcengine.new('crc32')(b'123456789')",
+}
+
+
+@pytest.mark.parametrize("statement", list(STATEMENTS))
+def test_import(benchmark, statement):
+    benchmark.group = "import"
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", STATEMENTS[statement]],),
+                       kwargs={"check": True}, rounds=20, warmup_rounds=2)
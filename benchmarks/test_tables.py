@@ -0,0 +1,54 @@
+"""Time taken to build the lookup tables"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+from crcengine import calc
+
+# pylint: disable=missing-function-docstring
+
+# Polynomials outside the catalogue, whose tables are not shipped with the
+# package and so have to be calculated
+POLYNOMIALS = {
+    8: 0x9B,
+    16: 0x8BB7,
+    32: 0x741B8CD7,
+    64: 0x1B,
+}
+
+TABLE_FUNCS = {
+    "lsb": calc.create_lsb_table,
+    "msb": calc.create_msb_table,
+    "msb_individual": calc.create_msb_table_individual,
+}
+
+
+@pytest.mark.parametrize("width", list(POLYNOMIALS))
+@pytest.mark.parametrize("table_func", list(TABLE_FUNCS))
+def test_table_build(benchmark, table_func, width):
+    benchmark.group = f"table-{table_func}"
+    # The table functions share cached tables, which are discarded before
+    # each call
+    table = benchmark.pedantic(TABLE_FUNCS[table_func], args=(POLYNOMIALS[width], width),
+                               setup=calc.clear_caches, rounds=50, warmup_rounds=1)
+    assert len(table) == 256
+
+
+def test_table_load(benchmark):
+    """Loading the table shipped for a built-in algorithm"""
+    benchmark.group = "table-lsb"
+    table = benchmark.pedantic(calc.create_lsb_table, args=(0x04C11DB7, 32),
+                               setup=calc.clear_caches, rounds=50, warmup_rounds=1)
+    assert table[1] == 0x77073096
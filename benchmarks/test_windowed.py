@@ -0,0 +1,49 @@
+"""Windowed calculation over ranges of bits that are not whole bytes"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+import crcengine
+
+from .conftest import MESSAGE_SIZE
+
+# pylint: disable=missing-function-docstring
+
+# (start bit, length in bits) of windows within the message
+WINDOWS = {
+    "within_byte": (3, 4),
+    "unaligned": (3, 8 * MESSAGE_SIZE - 8),
+    "aligned": (0, 8 * MESSAGE_SIZE),
+}
+
+
+@pytest.mark.parametrize("window", list(WINDOWS))
+@pytest.mark.parametrize("algorithm_name", ["crc16-xmodem", "crc32"])
+def test_windowed(benchmark, message, algorithm_name, window):
+    windowed = crcengine.calc.windowed_crc(crcengine.lookup_params(algorithm_name))
+    start_bit, length_bits = WINDOWS[window]
+    benchmark.group = f"windowed-{algorithm_name}"
+    benchmark.extra_info["bytes"] = length_bits // 8
+    benchmark(windowed.calculate, message, start_bit, length_bits)
+
+
+@pytest.mark.parametrize("algorithm_name", ["crc16-xmodem", "crc32"])
+def test_windowed_ranges(benchmark, message, algorithm_name):
+    """A frame with a field excluded from the calculation"""
+    windowed = crcengine.calc.windowed_crc(crcengine.lookup_params(algorithm_name))
+    ranges = [(0, 13), (21, 8 * MESSAGE_SIZE - 21)]
+    benchmark.group = f"windowed-{algorithm_name}"
+    benchmark.extra_info["bytes"] = MESSAGE_SIZE - 1
+    benchmark(windowed.calculate_ranges, message, ranges)
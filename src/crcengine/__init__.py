@@ -18,14 +18,7 @@ Package exports
 # You should have received a copy of the GNU General Public License
 # along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
 
-try:
-    # python 3.8 onwards
-    from importlib import metadata as importlib_metadata  # type:ignore
-except ImportError:
-    # python 3.7 support
-    import importlib_metadata  # type:ignore
-
-__version__ = importlib_metadata.version('crcengine')
+import importlib
 
 from .algorithms import (
     AlgorithmNotFoundError,
@@ -37,35 +30,52 @@ from .algorithms import (
     register_algorithm_params,
     unregister_algorithm,
 )
+from .arith import bit_reverse_byte, bit_reverse_n
 from .calc import (
     available_calculation_engines,
-    bit_reverse_byte,
-    bit_reverse_n,
+    cache_info,
+    calculate_multi,
+    clear_caches,
     create,
     create_from_params,
     create_generic,
     create_lsb_table,
     create_msb_table,
+    CrcStream,
     generic_crc,
     get_bits_max_value,
+    MultiCrcStream,
     new,
+    stream,
     table_crc,
 )
 
-from .codegen import (
-    generate_code,
-    generate_test
+from .combine import (
+    append_zeros,
+    calculate_variants,
+    combine,
 )
 
+from .tablestore import set_table_cache_dir
+
 
+# Some of these are loaded on first use by __getattr__ below
+# pylint: disable=undefined-all-variable
 __all__ = [
     "AlgorithmNotFoundError",
     "algorithms_available",
+    "append_zeros",
     "available_calculation_engines",
     "bit_reverse_byte",
     "bit_reverse_n",
+    "cache_info",
+    "calculate_multi",
+    "calculate_variants",
+    "clear_caches",
     "codegen",
+    "combine",
     "CrcParams",
+    "CrcStream",
     "create",
     "create_from_params",
     "create_generic",
@@ -76,10 +86,52 @@ __all__ = [
     "generate_test",
     "get_algorithm_params",
     "get_bits_max_value",
+    "instrument",
     "lookup_params",
+    "MultiCrcStream",
     "new",
+    "parallel_crc",
     "register_algorithm",
     "register_algorithm_params",
+    "set_table_cache_dir",
+    "stream",
     "table_crc",
     "unregister_algorithm",
 ]
+
+# Attributes that are only loaded when first accessed, mapped to the module
+# that provides them. These pull in dependencies (jinja2 for code generation,
+# process pools for parallel calculation) that are not needed simply to
+# calculate CRCs, so deferring them keeps "import crcengine" fast
+_LAZY_ATTRIBUTES = {
+    "codegen": "codegen",
+    "generate_code": "codegen",
+    "generate_test": "codegen",
+    "instrument": "instrument",
+    "parallel_crc": "parallel",
+}
+
+
+def __getattr__(name):
+    # pylint: disable=import-outside-toplevel
+    if name == "__version__":
+        try:
+            # python 3.8 onwards
+            from importlib import metadata as importlib_metadata  # type:ignore
+        except ImportError:
+            # python 3.7 support
+            import importlib_metadata  # type:ignore
+        version = importlib_metadata.version("crcengine")
+        globals()["__version__"] = version
+        return version
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = module if name == module_name else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
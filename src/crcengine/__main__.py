@@ -18,16 +18,27 @@
 # along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
 
 import argparse
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import glob
+import io
+import json
+import mmap
+import os
+import stat
 import sys
 
 import crcengine
-from crcengine import codegen
+
+# Size of the pieces in which input is read and processed
+_CHUNK_SIZE = 1 << 20
 
 
 def main():
     """Main entry point for command line"""
     parser = make_arg_parser()
-    process_cmdline(parser)
+    sys.exit(process_cmdline(parser))
 
 
 def process_cmdline(parser, args=None):
@@ -35,16 +46,19 @@ def process_cmdline(parser, args=None):
 
     :param parser: Argparse parser
     :param args: commandline arguments to process (None will default to reading sys.argv)
-    :return:
+    :return: exit status
     """
     args = parser.parse_args(args)
+    if args.command == "calculate" and args.jobs > 1 and (args.string is not None or args.stdin):
+        parser.error("--jobs cannot be used with -s or --stdin")
     if args.command == "calculate":
-        do_calculate(args)
-    elif args.command == "generate":
-        do_generate(args)
-    else:
-        parser.print_help(sys.stderr)
-        raise ValueError("Subcommand must be specified")
+        return do_calculate(args)
+    if args.command == "generate":
+        return do_generate(args)
+    if args.command == "bench":
+        return do_bench(args)
+    parser.print_help(sys.stderr)
+    raise ValueError("Subcommand must be specified")
 
 
 def make_arg_parser():
@@ -60,6 +74,7 @@ def make_arg_parser():
     calculate = _add_calculate_parser(subparsers)
     generate = _add_generate_parser(subparsers)
     _add_shared_options([calculate, generate])
+    _add_bench_parser(subparsers)
     return parser
 
 
@@ -76,21 +91,71 @@ def _add_shared_options(parsers):
             metavar="ALGO",
             dest="algorithm",
             required=True,
-            help="Use algorithm ALGO",
+            help="Use algorithm ALGO, calculate accepts a comma separated list of "
+                 "algorithms which are calculated in a single pass over the input",
         )
 
 
 def _add_generate_parser(subparsers):
     """Add parser for generate command"""
     generate = subparsers.add_parser(
-        "generate", help="Generate C code to calculate a specific CRC"
+        "generate", help="Generate C or Python code to calculate a specific CRC"
     )
     generate.add_argument(
         "-d", metavar="DIRECTORY", dest="output_dir", help="Output directory"
     )
+    generate.add_argument(
+        "--language", choices=["C", "Python"], default="C", help="Language to generate"
+    )
+    generate.add_argument(
+        "--strategy", choices=["table", "slice8", "nibble"], default="table",
+        help="Calculation strategy for C code, slice8 is faster but has 8 times the table size, "
+             "nibble is slower but the table is 16 times smaller"
+    )
     return generate
 
 
+def _add_bench_parser(subparsers):
+    """Add parser for bench command"""
+    bench = subparsers.add_parser(
+        "bench", help="Measure the speed of the calculation engines"
+    )
+    bench.add_argument(
+        "-a",
+        action="store",
+        metavar="ALGO",
+        dest="algorithms",
+        help="Comma separated list of the algorithms to measure, default: "
+             "crc8,crc16-xmodem,crc32,crc64-ecma",
+    )
+    bench.add_argument(
+        "--engines",
+        action="store",
+        metavar="ENGINES",
+        help="Comma separated list of the engines to measure, default: all",
+    )
+    bench.add_argument(
+        "--sizes",
+        action="store",
+        metavar="SIZES",
+        help="Comma separated list of message sizes, which may have a K, M or G suffix, "
+             "default: powers of 4 from 16 to 1G",
+    )
+    bench.add_argument(
+        "--min-time", type=float, default=0.1, metavar="SECONDS",
+        help="Minimum duration of each measurement",
+    )
+    bench.add_argument(
+        "--max-call-time", type=float, default=1.0, metavar="SECONDS",
+        help="Skip sizes for which a single call of an engine is estimated to take longer",
+    )
+    bench.add_argument(
+        "--json", action="store", metavar="FILE", dest="json_file",
+        help="Write the results and a description of the machine to FILE as JSON",
+    )
+    return bench
+
+
 def _add_calculate_parser(subparsers):
     """Add parser for calculate command
 
@@ -113,42 +178,302 @@ def _add_calculate_parser(subparsers):
         help="Calculate CRC of STRING",
     )
     grp.add_argument("--stdin", action="store_true", help="Read input from STDIN")
+    grp.add_argument(
+        "paths",
+        nargs="*",
+        default=[],
+        metavar="PATH",
+        help="Calculate the CRC of each file, of the files matching a glob pattern or of the "
+             "files in a directory and its subdirectories, printing \"<crc>  <path>\" lines",
+    )
+    grp.add_argument(
+        "--check",
+        action="store",
+        metavar="MANIFEST",
+        help="Read \"<crc>  <path>\" lines from MANIFEST and check the CRC of each file",
+    )
     calculate.add_argument(
         "--hex-prefix", action="store_true", help="Prefix result with 0x"
     )
+    calculate.add_argument(
+        "--jobs",
+        action="store",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Split FILE into ranges processed by N worker processes, or process N of the "
+             "PATH or MANIFEST files at a time. With several algorithms FILE is read once "
+             "for each algorithm",
+    )
     return calculate
 
 
-# '''
-# def read_in_chunks(file_object, chunk_size=1024):
-#     """Lazy function (generator) to read a file piece by piece.
-#     Default chunk size: 1k."""
-#     while True:
-#         data = file_object.read(chunk_size)
-#         if not data:
-#             break
-#         yield data
-# '''
-
-
 def do_calculate(args):
     """Perform the calculate command
 
     :param args: arguments as produced by parse_args()
-    :return:
+    :return: exit status
     """
-    algo = crcengine.new(args.algorithm)
+    names = args.algorithm.split(",")
+    if len(names) > 1:
+        # All the algorithms are calculated in one pass over the input
+        crc_stream = crcengine.MultiCrcStream(names)
+    else:
+        crc_stream = crcengine.new(args.algorithm).stream()
     prefix = "0x" if args.hex_prefix else ""
+    if args.paths:
+        return _calculate_paths(crc_stream, args.paths, prefix, args.jobs)
+    if args.check:
+        if len(names) > 1:
+            print("crcengine: --check needs a single algorithm", file=sys.stderr)
+            return 2
+        return _check_manifest(crc_stream, args.check, args.jobs)
+    if args.file and args.jobs > 1:
+        # Each algorithm has its own pass over the file, split between the
+        # workers
+        results = {name: crcengine.parallel_crc(name, args.file, jobs=args.jobs)
+                   for name in names}
+        for line in _format_results(results, prefix, len(names) > 1):
+            print(line)
+        return 0
     if args.string:
-        data = args.string.encode()
+        crc_stream.update(args.string.encode())
     elif args.file:
-        # This is a bit stupid for now just to get it working, ideally calculation would be chunked
         with open(args.file, "rb") as file:
-            data = file.read()
+            _calculate_file(crc_stream, file)
     else:
-        data = sys.stdin.read().encode()
-    result = algo.calculate(data)
-    print(f"{prefix}{result:x}")
+        _calculate_file(crc_stream, sys.stdin.buffer)
+    for line in _format_results(_crcvalues(crc_stream, names), prefix, len(names) > 1):
+        print(line)
+    return 0
+
+
+def _calculate_paths(template, patterns, prefix, jobs):
+    """Print the CRC of every file named by `patterns`, for each algorithm of
+    the `template` stream"""
+    status = 0
+    for path, result in _map_ordered(partial(_calculate_path, template), _expand_paths(patterns),
+                                     jobs):
+        if isinstance(result, OSError):
+            _report_error(path, result)
+            status = 1
+        elif isinstance(result, crcengine.MultiCrcStream):
+            for line in _format_results(result.crcvalues, prefix, True, path):
+                print(line)
+        else:
+            print(f"{_format_crc(result.name, result.crcvalue, prefix)}  {path}")
+    return status
+
+
+def _crcvalues(crc_stream, names):
+    """CRC values of a CrcStream or MultiCrcStream keyed by algorithm name"""
+    if isinstance(crc_stream, crcengine.MultiCrcStream):
+        return crc_stream.crcvalues
+    return {names[0]: crc_stream.crcvalue}
+
+
+def _format_results(results, prefix, tagged, path=None):
+    """Generate the output lines for a dict of results keyed by algorithm
+    name. Tagged lines name the algorithm, in the BSD style
+    "<algorithm> (<path>) = <crc>", otherwise only the CRC is given"""
+    for name, result in results.items():
+        if not tagged:
+            yield f"{prefix}{result:x}"
+        elif path is None:
+            yield f"{name} = {_format_crc(name, result, prefix)}"
+        else:
+            yield f"{name} ({path}) = {_format_crc(name, result, prefix)}"
+
+
+def _format_crc(name, crc, prefix):
+    """Format a CRC as hexadecimal padded to the width of the algorithm, so
+    that the CRCs in a list of results line up"""
+    num_digits = (crcengine.lookup_params(name).width + 3) // 4
+    return f"{prefix}{crc:0{num_digits}x}"
+
+
+def _check_manifest(template, manifest, jobs):
+    """Check the CRCs of the files listed in `manifest`, printing the result
+    for each file in the same way as sha256sum --check"""
+    try:
+        entries, num_improper = _read_manifest(manifest)
+    except OSError as excep:
+        _report_error(manifest, excep)
+        return 1
+    num_failed = 0
+    num_unreadable = 0
+    for (path, expected), result in _map_ordered(partial(_calculate_entry, template), entries,
+                                                 jobs):
+        if isinstance(result, OSError):
+            _report_error(path, result)
+            print(f"{path}: FAILED open or read")
+            num_unreadable += 1
+        elif result.crcvalue != expected:
+            print(f"{path}: FAILED")
+            num_failed += 1
+        else:
+            print(f"{path}: OK")
+    for count, singular, plural in (
+            (num_improper, "line is improperly formatted", "lines are improperly formatted"),
+            (num_unreadable, "listed file could not be read", "listed files could not be read"),
+            (num_failed, "computed checksum did NOT match", "computed checksums did NOT match"),
+    ):
+        if count:
+            print(f"crcengine: WARNING: {count} {singular if count == 1 else plural}",
+                  file=sys.stderr)
+    return 1 if num_improper or num_failed or num_unreadable else 0
+
+
+def _read_manifest(manifest):
+    """Read the (path, CRC) entries of a manifest
+
+    :return: list of entries and the number of lines that could not be read
+    """
+    with open(manifest, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    entries = []
+    num_improper = 0
+    for line in lines:
+        # "<crc> <path>" where the path may be marked as binary by a "*"
+        value, _, path = line.partition(" ")
+        if path[:1] in (" ", "*"):
+            path = path[1:]
+        try:
+            entries.append((path, int(value, 16)))
+        except ValueError:
+            num_improper += bool(line.strip())
+    return entries, num_improper
+
+
+def _expand_paths(patterns):
+    """Generate the paths of the files named by `patterns`, which may be
+    files, glob patterns or directories, whose files are generated
+    recursively in sorted order"""
+    for pattern in patterns:
+        if glob.escape(pattern) != pattern:
+            # Shells expand patterns, but those that don't (on Windows), or
+            # that were quoted, are expanded here
+            paths = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        else:
+            paths = [pattern]
+        for path in paths:
+            if os.path.isdir(path):
+                for dir_path, dir_names, file_names in os.walk(path):
+                    dir_names.sort()
+                    for file_name in sorted(file_names):
+                        yield os.path.join(dir_path, file_name)
+            else:
+                yield path
+
+
+def _calculate_path(template, path):
+    """Return a copy of the `template` stream updated with the contents of
+    the file at `path`, or the OSError that prevented reading it"""
+    try:
+        with open(path, "rb") as file:
+            return _calculate_file(template.copy(), file)
+    except OSError as excep:
+        return excep
+
+
+def _calculate_entry(template, entry):
+    """_calculate_path for a (path, expected CRC) manifest entry"""
+    return _calculate_path(template, entry[0])
+
+
+def _map_ordered(func, items, jobs):
+    """Generate (item, func(item)) for each of `items` in order, calling func
+    in `jobs` threads. Only a few items are read ahead of the result being
+    generated, so `items` can be a long generator"""
+    if jobs <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+    with ThreadPoolExecutor(jobs) as executor:
+        pending = collections.deque()
+        for item in items:
+            pending.append((item, executor.submit(func, item)))
+            if len(pending) >= 2 * jobs:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+
+
+def _report_error(path, excep):
+    print(f"crcengine: {path}: {excep.strerror or excep}", file=sys.stderr)
+
+
+def _calculate_file(crc_stream, file):
+    """Update a CrcStream or MultiCrcStream with the contents of a binary
+    file object
+
+    :return: `crc_stream`
+    """
+    for chunk in _read_chunks(file):
+        crc_stream.update(chunk)
+    return crc_stream
+
+
+def _read_chunks(file):
+    """Generate the contents of a binary file object as a series of
+    memoryviews, without holding more than one chunk in memory. Regular files
+    are memory mapped, other files such as pipes are read into a buffer that
+    is reused for every chunk, so each chunk is only valid until the next is
+    requested
+    """
+    try:
+        file_stat = os.fstat(file.fileno())
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # Not backed by a file descriptor, e.g. io.BytesIO
+        file_stat = None
+    # Some special files (in /proc for example) report a size of 0 whatever
+    # their contents, so empty files are read in the same way as pipes
+    if file_stat is not None and stat.S_ISREG(file_stat.st_mode) and file_stat.st_size:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            for start in range(0, len(view), _CHUNK_SIZE):
+                with view[start:start + _CHUNK_SIZE] as chunk:
+                    yield chunk
+        return
+    buffer = bytearray(_CHUNK_SIZE)
+    with memoryview(buffer) as view:
+        while True:
+            num_bytes = file.readinto(buffer)
+            if not num_bytes:
+                break
+            with view[:num_bytes] as chunk:
+                yield chunk
+
+
+def do_bench(args):
+    """Perform the bench command
+
+    :param args: arguments as produced by parse_args()
+    :return: exit status
+    """
+    from crcengine import bench  # pylint: disable=import-outside-toplevel
+    options = {}
+    if args.algorithms:
+        options["algorithms"] = args.algorithms.split(",")
+    if args.engines:
+        options["engines"] = args.engines.split(",")
+        unknown = set(options["engines"]) - set(crcengine.available_calculation_engines())
+        if unknown:
+            print(f"crcengine: unknown engines: {', '.join(sorted(unknown))}", file=sys.stderr)
+            return 2
+    if args.sizes:
+        options["sizes"] = [bench.parse_size(size) for size in args.sizes.split(",")]
+    print(bench.TABLE_HEADING)
+    results = bench.run_benchmarks(
+        min_time=args.min_time, max_call_time=args.max_call_time,
+        report=lambda entry, result: print(bench.format_result(entry, result), flush=True),
+        **options)
+    if args.json_file:
+        with open(args.json_file, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    return 0
 
 
 def do_generate(args):
@@ -157,7 +482,8 @@ def do_generate(args):
     :param args:  arguments as produced by parse_args()
     :return:
     """
-    codegen.generate_code(args.algorithm, output_dir=args.output_dir)
+    crcengine.generate_code(args.algorithm, output_dir=args.output_dir,
+                            language=args.language, strategy=args.strategy)
 
 
 if __name__ == "__main__":
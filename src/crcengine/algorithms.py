@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Dict, Iterable, NamedTuple, Tuple, Union
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
 # Some of these polynomials are used for many algorithms, so they are collected
 # here
 _CRC16_CCITT_POLY = 0x1021
@@ -69,7 +69,19 @@ _ALGORITHMS = {
     # pylint: disable=line-too-long
     # ======================== sub-byte =======================================
     # Token CRC in USB https://web.archive.org/web/20160326215031/http://www.usb.org/developers/whitepapers/crcdes.pdf
+    # The following sub-byte algorithms are from the CRC RevEng catalogue
+    # https://reveng.sourceforge.io/crc-catalogue/1-15.htm
+    # ETSI TS 100 909 for GSM
+    "crc3-gsm": (0x3, 3, 0, False, False, 0x7, 0x4),
+    # ITU-T G.704
+    "crc4-g-704": (0x3, 4, 0, True, True, 0, 0x7),
+    "crc4-interlaken": (0x3, 4, 0xf, False, False, 0xf, 0xb),
+    # EPCglobal Class-1 Generation-2 RFID
+    "crc5-epc": (0x09, 5, 0x09, False, False, 0, 0x00),
     "crc5-usb": (0x05, 5, 0x1f, True, True,  0x1f,  0x19),
+    "crc6-cdma2000-a": (0x27, 6, 0x3f, False, False, 0, 0x0d),
+    # JEDEC MultiMediaCard, also used by SD cards
+    "crc7-mmc": (0x09, 7, 0, False, False, 0, 0x75),
     # =========================  8-bit ========================================
     "crc8": (0xD5, 8, 0, False, False, 0, 0xBC),
     "crc8-autosar": (0x2F, 8, _U8_MAX, False, False, _U8_MAX, 0xDF),
@@ -124,6 +136,8 @@ _ALGORITHMS = {
 
 
 _registered_algorithms: Dict[str, _FieldsT] = {}
+# Functions called with the algorithm name whenever a registration changes
+_registration_hooks: List[Callable[[str], None]] = []
 
 
 class AlgorithmNotFoundError(Exception):
@@ -206,6 +220,7 @@ def register_algorithm(name, polynomial, width, seed, reflect, xor_out, check=0)
         xor_out & poly_mask,
         check,
     )
+    _notify_registration(name)
 
 
 def register_algorithm_params(name: str, params: CrcParams, check=None) -> None:
@@ -220,6 +235,7 @@ def register_algorithm_params(name: str, params: CrcParams, check=None) -> None:
         params.xor_out & poly_mask,
         check,
     )
+    _notify_registration(name)
 
 
 def unregister_algorithm(name: str) -> None:
@@ -228,3 +244,19 @@ def unregister_algorithm(name: str) -> None:
         del _registered_algorithms[name]
     except KeyError as excep:
         raise AlgorithmNotFoundError from excep
+    _notify_registration(name)
+
+
+def add_registration_hook(hook: Callable[[str], None]) -> None:
+    """Add a function to be called with the name of an algorithm whenever it
+    is registered or unregistered, allowing anything derived from a previous
+    definition of that name to be invalidated
+
+    :param hook: function accepting the algorithm name
+    """
+    _registration_hooks.append(hook)
+
+
+def _notify_registration(name: str) -> None:
+    for hook in _registration_hooks:
+        hook(name)
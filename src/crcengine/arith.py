@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+Bit reversal and arithmetic on polynomials over GF(2) modulo a CRC
+polynomial, shared by the calculation, combination and code generation
+modules. This module does not depend on any other part of the package
+"""
+# This file is part of CrcEngine, a python library for CRC calculation
+#
+# Copyright 2021 Garden Tools software
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+
+from functools import lru_cache
+from typing import Tuple
+
+# Number of powers x^(2^k) held for each polynomial, this is enough for
+# messages of up to 2^64 bytes
+_NUM_POWERS = 67
+
+# Table of bit-reversed bytes, bit_reverse_byte(n) for each byte value n
+REV8BITS = (
+    0x00, 0x80, 0x40, 0xC0, 0x20, 0xA0, 0x60, 0xE0,
+    0x10, 0x90, 0x50, 0xD0, 0x30, 0xB0, 0x70, 0xF0,
+    0x08, 0x88, 0x48, 0xC8, 0x28, 0xA8, 0x68, 0xE8,
+    0x18, 0x98, 0x58, 0xD8, 0x38, 0xB8, 0x78, 0xF8,
+    0x04, 0x84, 0x44, 0xC4, 0x24, 0xA4, 0x64, 0xE4,
+    0x14, 0x94, 0x54, 0xD4, 0x34, 0xB4, 0x74, 0xF4,
+    0x0C, 0x8C, 0x4C, 0xCC, 0x2C, 0xAC, 0x6C, 0xEC,
+    0x1C, 0x9C, 0x5C, 0xDC, 0x3C, 0xBC, 0x7C, 0xFC,
+    0x02, 0x82, 0x42, 0xC2, 0x22, 0xA2, 0x62, 0xE2,
+    0x12, 0x92, 0x52, 0xD2, 0x32, 0xB2, 0x72, 0xF2,
+    0x0A, 0x8A, 0x4A, 0xCA, 0x2A, 0xAA, 0x6A, 0xEA,
+    0x1A, 0x9A, 0x5A, 0xDA, 0x3A, 0xBA, 0x7A, 0xFA,
+    0x06, 0x86, 0x46, 0xC6, 0x26, 0xA6, 0x66, 0xE6,
+    0x16, 0x96, 0x56, 0xD6, 0x36, 0xB6, 0x76, 0xF6,
+    0x0E, 0x8E, 0x4E, 0xCE, 0x2E, 0xAE, 0x6E, 0xEE,
+    0x1E, 0x9E, 0x5E, 0xDE, 0x3E, 0xBE, 0x7E, 0xFE,
+    0x01, 0x81, 0x41, 0xC1, 0x21, 0xA1, 0x61, 0xE1,
+    0x11, 0x91, 0x51, 0xD1, 0x31, 0xB1, 0x71, 0xF1,
+    0x09, 0x89, 0x49, 0xC9, 0x29, 0xA9, 0x69, 0xE9,
+    0x19, 0x99, 0x59, 0xD9, 0x39, 0xB9, 0x79, 0xF9,
+    0x05, 0x85, 0x45, 0xC5, 0x25, 0xA5, 0x65, 0xE5,
+    0x15, 0x95, 0x55, 0xD5, 0x35, 0xB5, 0x75, 0xF5,
+    0x0D, 0x8D, 0x4D, 0xCD, 0x2D, 0xAD, 0x6D, 0xED,
+    0x1D, 0x9D, 0x5D, 0xDD, 0x3D, 0xBD, 0x7D, 0xFD,
+    0x03, 0x83, 0x43, 0xC3, 0x23, 0xA3, 0x63, 0xE3,
+    0x13, 0x93, 0x53, 0xD3, 0x33, 0xB3, 0x73, 0xF3,
+    0x0B, 0x8B, 0x4B, 0xCB, 0x2B, 0xAB, 0x6B, 0xEB,
+    0x1B, 0x9B, 0x5B, 0xDB, 0x3B, 0xBB, 0x7B, 0xFB,
+    0x07, 0x87, 0x47, 0xC7, 0x27, 0xA7, 0x67, 0xE7,
+    0x17, 0x97, 0x57, 0xD7, 0x37, 0xB7, 0x77, 0xF7,
+    0x0F, 0x8F, 0x4F, 0xCF, 0x2F, 0xAF, 0x6F, 0xEF,
+    0x1F, 0x9F, 0x5F, 0xDF, 0x3F, 0xBF, 0x7F, 0xFF,
+)
+
+
+def bit_reverse_byte(byte: int) -> int:
+    """Bit-bashing reversal of a byte"""
+    result = 0
+    for i in range(8):
+        if byte & (1 << i):
+            result |= 1 << (7 - i)
+    return result & 0xFF
+
+
+def bit_reverse_n(value: int, num_bits: int) -> int:
+    """Mirror the bits in an integer
+
+    :param value: the integer to reverse
+    :param num_bits: the number of bits  to reverse
+    :return: mirrored value
+    """
+    # This left shift will introduce zeroes in the least-significant bits, which
+    # will be ignored as 0 most sig bits once we bit reverse
+    value <<= (8 - num_bits) & 7
+    num_bytes = (num_bits + 7) >> 3
+    result = 0
+    for _ in range(num_bytes):
+        result <<= 8
+        result |= REV8BITS[value & 0xFF]
+        value >>= 8
+    return result
+
+
+def multiply_mod(value1: int, value2: int, poly: int, width: int) -> int:
+    """Multiply two polynomials over GF(2) modulo the CRC polynomial. Each
+    polynomial is represented with the highest order coefficient in the most
+    significant bit
+
+    :param value1: first polynomial, of less than `width` bits
+    :param value2: second polynomial, of less than `width` bits
+    :param poly: CRC polynomial, excluding the x^width term
+    :param width: polynomial width in bits
+    :return: the product
+    """
+    ms_bit = 1 << (width - 1)
+    result_mask = (1 << width) - 1
+    product = 0
+    # Horner's scheme: multiply the product by x for each bit of value1
+    # and add value2 wherever that bit is set
+    for bit in range(width - 1, -1, -1):
+        if product & ms_bit:
+            product = ((product << 1) ^ poly) & result_mask
+        else:
+            product <<= 1
+        if (value1 >> bit) & 1:
+            product ^= value2
+    return product
+
+
+@lru_cache(maxsize=256)
+def xpow8n_mod(poly: int, width: int, num_bytes: int) -> int:
+    """Calculate x^(8 * num_bytes) modulo the CRC polynomial, which is the
+    operator that advances a calculation register over `num_bytes` zero bytes.
+    Results are cached so that repeatedly combining pieces of the same length
+    is cheap
+
+    :param poly: CRC polynomial, excluding the x^width term
+    :param width: polynomial width in bits
+    :param num_bytes: number of bytes
+    :return: x^(8 * num_bytes) mod poly
+    """
+    powers = xpow2k_mod(poly, width)
+    result = 1
+    num_bits = 8 * num_bytes
+    k = 0
+    while num_bits:
+        if num_bits & 1:
+            result = multiply_mod(result, powers[k], poly, width)
+        num_bits >>= 1
+        k += 1
+    return result
+
+
+@lru_cache(maxsize=None)
+def xpow2k_mod(poly: int, width: int) -> Tuple[int, ...]:
+    """Calculate x^(2^k) modulo the CRC polynomial for each k, so that any
+    power of x can be formed from at most one product per bit of the exponent
+    """
+    # x^1, which for a 1-bit polynomial (x + 1) is already reduced to 1
+    power = 2 if width > 1 else 1
+    powers = [power]
+    for _ in range(1, _NUM_POWERS):
+        power = multiply_mod(power, power, poly, width)
+        powers.append(power)
+    return tuple(powers)
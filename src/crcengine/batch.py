@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Calculation of the CRCs of many equal-length messages at once using NumPy
+"""
+# This file is part of CrcEngine, a python library for CRC calculation
+#
+# Copyright 2021 Garden Tools software
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .algorithms import CrcParams, lookup_params
+from .arith import REV8BITS, bit_reverse_n
+from .calc import get_table
+
+
+def calculate_batch(params: Union[str, CrcParams], messages):
+    """Calculate the CRC of each row of a 2-dimensional array of bytes.
+
+    The registers for all the messages are advanced together one column at a
+    time using the lookup table of the table engine, so the number of python
+    level operations depends on the message length but not on the number of
+    messages. NumPy must be installed to use this function.
+
+    :param params: CRC parameters or the name of an algorithm
+    :param messages: array of shape (n, length) of uint8, or anything
+                     convertible to one
+    :return: array of n CRC values using the smallest unsigned integer type
+             that holds `params.width` bits
+    """
+    if np is None:
+        raise ImportError("calculate_batch requires numpy to be installed")
+    if isinstance(params, str):
+        params = lookup_params(params)
+    messages = np.asarray(messages, dtype=np.uint8)
+    if messages.ndim != 2:
+        raise ValueError(f"messages must be 2-dimensional, not {messages.ndim}-dimensional")
+    dtype = _register_dtype(params.width)
+    # Each column is read in turn, so lay the columns out contiguously
+    columns = np.ascontiguousarray(messages.T)
+
+    if params.reflect_in:
+        table = np.array(get_table(params.polynomial, params.width, True), dtype=dtype)
+        register = np.full(messages.shape[0], bit_reverse_n(params.seed, params.width),
+                           dtype=dtype)
+        register = _update_reflected(register, columns, table, params.width)
+    else:
+        table = np.array(get_table(params.polynomial, params.width, False), dtype=dtype)
+        register = np.full(messages.shape[0], params.seed, dtype=dtype)
+        register = _update_msbf(register, columns, table, params.width)
+
+    if params.reflect_in != params.reflect_out:
+        register = _reverse_bits(register, params.width)
+    return register ^ dtype(params.xor_out)
+
+
+def _update_reflected(register, columns, table, width):
+    if width <= 8:
+        # Every bit of the register is replaced on each step
+        for column in columns:
+            register = table[register ^ column]
+        return register
+    byte_shift = register.dtype.type(8)
+    byte_mask = register.dtype.type(0xFF)
+    for column in columns:
+        register = (register >> byte_shift) ^ table[(register & byte_mask) ^ column]
+    return register
+
+
+def _update_msbf(register, columns, table, width):
+    if width <= 8:
+        # Every bit of the register is replaced on each step, a register
+        # narrower than 8 bits is aligned with the top of the input byte
+        lshift = register.dtype.type(8 - width)
+        for column in columns:
+            register = table[(register << lshift) ^ column]
+        return register
+    dtype = register.dtype.type
+    byte_shift = dtype(8)
+    msb_rshift = dtype(width - 8)
+    result_mask = dtype((1 << width) - 1)
+    for column in columns:
+        register = (((register << byte_shift) & result_mask)
+                    ^ table[(register >> msb_rshift) ^ column])
+    return register
+
+
+def _reverse_bits(register, width):
+    """Vectorised equivalent of :func:`crcengine.arith.bit_reverse_n`"""
+    dtype = register.dtype.type
+    rev8bits = np.array(REV8BITS, dtype=register.dtype)
+    byte_shift = dtype(8)
+    byte_mask = dtype(0xFF)
+    value = register << dtype((8 - width) & 7)
+    result = np.zeros_like(register)
+    for _ in range((width + 7) >> 3):
+        if register.dtype.itemsize > 1:
+            result <<= byte_shift
+        result |= rev8bits[value & byte_mask]
+        if register.dtype.itemsize > 1:
+            value >>= byte_shift
+    return result
+
+
+def _register_dtype(width: int):
+    """Smallest unsigned NumPy type that holds `width` bits"""
+    if width <= 8:
+        return np.uint8
+    if width <= 16:
+        return np.uint16
+    if width <= 32:
+        return np.uint32
+    return np.uint64
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+"""
+Measurement of the throughput of the calculation engines, as run by
+``crcengine bench``
+"""
+# This file is part of CrcEngine, a python library for CRC calculation
+#
+# Copyright 2021 Garden Tools software
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+
+from contextlib import contextmanager
+import datetime
+from functools import lru_cache
+import os
+import platform
+import random
+from timeit import default_timer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import calc, cc
+
+DEFAULT_ALGORITHMS = ("crc8", "crc16-xmodem", "crc32", "crc64-ecma")
+# Powers of 4 from 16 bytes to 1 GiB
+DEFAULT_SIZES = tuple(4 ** exponent for exponent in range(2, 16))
+# Each measurement is repeated this many times and the fastest taken
+_REPEATS = 3
+# The data is a repeated random pattern of this size, which is quicker to
+# produce than random data of the full size
+_PATTERN_SIZE = 4096
+_SIZE_UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+# The cached functions holding the tables, engines and loaded libraries used
+# when creating an engine
+_CACHED_FUNCS = (
+    (calc, ("get_table", "get_slice_tables", "get_nibble_table", "_cached_engine",
+            "_compiled_functions")),
+    (cc, ("get_update_func",)),
+)
+
+TABLE_HEADING = f"{'algorithm':<16}{'engine':<14}{'size':>8}{'MB/s':>12}{'ns/call':>16}"
+
+ReportFunc = Callable[[Dict[str, Any], Optional[Dict[str, Any]]], None]
+
+
+def run_benchmarks(algorithms: Iterable[str] = DEFAULT_ALGORITHMS,
+                   engines: Optional[Iterable[str]] = None,
+                   sizes: Iterable[int] = DEFAULT_SIZES, min_time=0.1, max_call_time=1.0,
+                   report: Optional[ReportFunc] = None) -> Dict[str, Any]:
+    """Measure the time taken by each calculation engine to calculate the
+    CRCs of messages of each size, for each algorithm.
+
+    Each measurement calls the engine repeatedly for at least `min_time`
+    seconds. Sizes for which a single call is estimated, from the previous
+    size, to take longer than `max_call_time` seconds are skipped, so that
+    sweeping up to large sizes does not take hours for the slow engines.
+    The creation time of each engine is measured without the cached tables
+    and engines, see :func:`crcengine.clear_caches`, which are left as they
+    were afterwards.
+
+    :param algorithms: names of the algorithms to measure
+    :param engines: names of the engines to measure, by default all of
+        :func:`crcengine.available_calculation_engines`
+    :param sizes: message sizes in bytes
+    :param min_time: minimum duration of each measurement in seconds
+    :param max_call_time: longest estimated time of a single call to measure
+    :param report: function called with the entry for an algorithm and
+        engine and the result for a size as each measurement is made, and
+        with None in place of the result when the engine has been created
+    :return: dict holding "metadata" describing the machine and the
+        "results", one entry for each algorithm and engine with its creation
+        time and a list of results for each size, that can be saved as JSON
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    if engines is None:
+        engines = calc.available_calculation_engines()
+    entries, calculators = _create_engines(algorithms, engines, report)
+    generator = random.Random(0)
+    pattern = bytes(generator.getrandbits(8) for _ in range(_PATTERN_SIZE))
+    # Sizes are measured in increasing order, so that only the data for one
+    # size is held at a time and the time for the next size can be estimated
+    for size in sorted(sizes):
+        skipped = [_is_too_slow(entry["sizes"], size, max_call_time) for entry in entries]
+        # The data is only made if an engine will use it, as the sizes that
+        # every engine skips may be too large to hold in memory
+        data = None if all(skipped) else _make_data(pattern, size)
+        for entry, calculator, skip in zip(entries, calculators, skipped):
+            if skip:
+                result = {"size": size, "skipped": True}
+            else:
+                result = _measure(calculator, data, min_time)
+            entry["sizes"].append(result)
+            if report:
+                report(entry, result)
+        del data
+    return {"metadata": _metadata(min_time), "results": entries}
+
+
+def parse_size(text: str) -> int:
+    """Convert a size such as "16", "4K", "1M" or "1G" into a number of
+    bytes, the units are powers of 1024"""
+    text = text.strip().upper().rstrip("B")
+    multiplier = _SIZE_UNITS.get(text[-1:], 1)
+    if multiplier != 1:
+        text = text[:-1]
+    size = int(text) * multiplier
+    if size < 1:
+        raise ValueError(f"Invalid size {text}")
+    return size
+
+
+def format_size(size: int) -> str:
+    """Inverse of :func:`parse_size`, using the largest exact unit"""
+    for unit, multiplier in sorted(_SIZE_UNITS.items(), key=lambda item: -item[1]):
+        if size and size % multiplier == 0:
+            return f"{size // multiplier}{unit}"
+    return str(size)
+
+
+def _create_engines(algorithms: Iterable[str], engines: Iterable[str],
+                    report: Optional[ReportFunc]) -> Tuple[List[Dict[str, Any]], List[Callable]]:
+    """Create and time the creation of each engine for each algorithm
+
+    :return: the result entries and the calculation function for each
+    """
+    entries = []
+    calculators = []
+    for algorithm in algorithms:
+        for engine in engines:
+            create_ns, calculator = _time_creation(algorithm, engine)
+            entry = {"algorithm": algorithm, "engine": engine, "create_ns": create_ns,
+                     "sizes": []}
+            entries.append(entry)
+            calculators.append(calculator)
+            if report:
+                report(entry, None)
+    return entries, calculators
+
+
+def _time_creation(algorithm: str, engine: str) -> Tuple[int, Callable]:
+    """Time the creation of an engine without any cached tables, engines
+    or loaded libraries
+
+    :return: creation time in nanoseconds and the engine's calculation function
+    """
+    with _empty_caches():
+        start = default_timer()
+        calculator = calc.new(algorithm, engine)
+        create_ns = round((default_timer() - start) * 1e9)
+    return create_ns, calculator
+
+
+@contextmanager
+def _empty_caches():
+    """Replace the cached functions with ones having empty caches, restoring
+    the originals, and so the caller's cached entries, on exit"""
+    originals = [(module, name, getattr(module, name))
+                 for module, names in _CACHED_FUNCS for name in names]
+    try:
+        for module, name, func in originals:
+            setattr(module, name, lru_cache(maxsize=func.cache_info().maxsize)(func.__wrapped__))
+        yield
+    finally:
+        for module, name, func in originals:
+            setattr(module, name, func)
+
+
+def _make_data(pattern: bytes, size: int) -> bytes:
+    repeats, remainder = divmod(size, len(pattern))
+    return pattern * repeats + pattern[:remainder]
+
+
+def _is_too_slow(previous: Sequence[Dict[str, Any]], size: int, max_call_time: float) -> bool:
+    """Return True if a call for `size` bytes is estimated, from the results
+    of the previous sizes, to take longer than `max_call_time` seconds"""
+    measured = [result for result in previous if "ns_per_call" in result]
+    if not measured:
+        return False
+    last = measured[-1]
+    return last["ns_per_call"] * 1e-9 * size / max(last["size"], 1) > max_call_time
+
+
+def _measure(calculator: Callable, data: bytes, min_time: float) -> Dict[str, Any]:
+    size = len(data)
+    calls, seconds = _time_calls(calculator, data, min_time)
+    return {
+        "size": size,
+        "calls": calls,
+        "ns_per_call": seconds * 1e9,
+        "mb_per_s": size / seconds / 1e6,
+    }
+
+
+def _time_calls(calculator: Callable, data: bytes, min_time: float) -> Tuple[int, float]:
+    """Find the number of calls that take at least `min_time` seconds, then
+    repeat them
+
+    :return: number of calls in each repetition and the shortest time per call
+    """
+    calls = 1
+    while True:
+        elapsed = _time_loop(calculator, data, calls)
+        if elapsed >= min_time:
+            break
+        # Aim just beyond min_time, growing by at most a factor of 10 in
+        # case the first calls were slowed by something else
+        calls = max(calls + 1, min(calls * 10, int(calls * 1.2 * min_time / max(elapsed, 1e-9))))
+    best = elapsed
+    for _ in range(_REPEATS - 1):
+        best = min(best, _time_loop(calculator, data, calls))
+    return calls, best / calls
+
+
+def _time_loop(calculator: Callable, data: bytes, calls: int) -> float:
+    iterations = range(calls)
+    start = default_timer()
+    for _ in iterations:
+        calculator(data)
+    return default_timer() - start
+
+
+def _metadata(min_time: float) -> Dict[str, Any]:
+    """Describe the machine and software so that results from different
+    runs can be compared"""
+    try:
+        from . import __version__ as version  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        # Not installed, so there is no package metadata
+        version = None
+    uname = platform.uname()
+    return {
+        "crcengine_version": version,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": uname.machine,
+        "processor": uname.processor,
+        "cpu_count": os.cpu_count(),
+        "c_compiler": cc.find_compiler(),
+        "min_time": min_time,
+        "repeats": _REPEATS,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def format_results(results: Dict[str, Any]) -> List[str]:
+    """Format the results of :func:`run_benchmarks` as lines of a table"""
+    lines = [TABLE_HEADING]
+    lines.extend(format_result(entry, None) for entry in results["results"])
+    for entry in results["results"]:
+        lines.extend(format_result(entry, result) for result in entry["sizes"])
+    return lines
+
+
+def format_result(entry: Dict[str, Any], result: Optional[Dict[str, Any]]) -> str:
+    """Format the result for one size, or the creation time of the engine if
+    `result` is None, as a line of the table produced by
+    :func:`format_results`"""
+    if result is None:
+        return f"{entry['algorithm']:<16}{entry['engine']:<14}{'create':>8}" \
+               f"{'':>12}{entry['create_ns']:>16}"
+    prefix = f"{entry['algorithm']:<16}{entry['engine']:<14}{format_size(result['size']):>8}"
+    if result.get("skipped"):
+        return f"{prefix}{'skipped':>12}"
+    return f"{prefix}{result['mb_per_s']:>12.2f}{result['ns_per_call']:>16.0f}"
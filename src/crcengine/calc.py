@@ -2,6 +2,9 @@
 """
 Implementation of CRC calculation in pure python
 """
+# pylint: disable=too-many-lines
+import binascii
+import struct
 import typing
 # This file is part of CrcEngine, a python library for CRC calculation
 #
@@ -20,16 +23,91 @@ import typing
 # You should have received a copy of the GNU General Public License
 # along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Iterable, Optional
+from functools import lru_cache
+import importlib
+import linecache
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
 import warnings
+import zlib
 
-from .algorithms import CrcParams, lookup_params
+from . import tablestore
+# bit_reverse_byte is also imported for code that uses it from this module
+from .arith import (  # noqa: F401 pylint: disable=unused-import
+    REV8BITS as _REV8BITS,
+    bit_reverse_byte,
+    bit_reverse_n,
+)
+from .algorithms import CrcParams, add_registration_hook, lookup_params
 
 _BYTEBITS = 8
 _DEFAULT_ENGINE = "table"
+# Maximum numbers of distinct lookup tables and engines that are kept
+_TABLE_CACHE_SIZE = 128
+_ENGINE_CACHE_SIZE = 128
+# Data given to a MultiCrcStream is passed to each algorithm in pieces of this
+# size, so that each piece is still in the processor's cache when it is read
+# by the next algorithm
+_MULTI_CHUNK_SIZE = 1 << 16
+
+# Set by crcengine.instrument while instrumentation is enabled, to wrap the
+# engines returned by new() and create_from_params()
+_engine_wrapper = None  # pylint: disable=invalid-name
+
+
+class _CrcEngine:
+    """Behaviour common to all the calculation engines.
+
+    Each engine performs its calculation in three steps on an internal
+    register, whose representation is specific to the engine:
+    ``_init_register()`` produces the starting register from the seed,
+    ``_update(register, data)`` feeds data through it and
+    ``_finalize(register)`` turns it into the CRC result. Keeping these
+    separate allows a calculation to be resumed by :class:`CrcStream`
+    """
+
+    params: CrcParams
+    name = ""
+
+    def calculate(self, data):
+        """Calculate the CRC of data
+
+        :param data: bytes string
+        :return: calculated CRC
+        """
+        return self._finalize(self._update(self._init_register(), data))
+
+    def stream(self, data=b"") -> "CrcStream":
+        """Create an object for incremental calculation of the CRC
+
+        :param data: optional initial data to process
+        :return: a :class:`CrcStream` using this engine
+        """
+        return CrcStream(self, data)
+
+    def calculate_batch(self, messages):
+        """Calculate the CRC of each row of a 2-dimensional array of bytes
+        using NumPy, see :func:`crcengine.batch.calculate_batch`
+
+        :param messages: array of shape (n, length) of uint8
+        :return: array of n CRC values
+        """
+        return _import_lazily("batch").calculate_batch(self.params, messages)
+
+    def _init_register(self) -> int:
+        raise NotImplementedError
 
+    def _update(self, register: int, data) -> int:
+        raise NotImplementedError
 
-class _ReflectedTableCrc:
+    def _finalize(self, register: int) -> int:
+        raise NotImplementedError
+
+    def __call__(self, data):
+        """calculate CRC"""
+        return self.calculate(data)
+
+
+class _ReflectedTableCrc(_CrcEngine):
     """Least-significant-bit first calculation of a CRC. Implies a ref_in
     calculations was specified with new data being shifted in from the MSB end
     of the calculation register.
@@ -39,7 +117,9 @@ class _ReflectedTableCrc:
     CRC
     """
 
-    def __init__(self, table, width, seed, xor_out=0, reverse_result=False, name=""):
+    # pylint: disable=too-many-arguments
+    def __init__(self, table, width, seed, xor_out=0, reverse_result=False, name="",
+                 params=None):
         """Initialize a table-based CRC instead of a specified polynomial,
         the information comes from a precomputed table of values
 
@@ -54,6 +134,7 @@ class _ReflectedTableCrc:
                                LSBit-first algorithm implements the practical
                                effect of `reflect_out` by default
         :param name:
+        :param params: the parameters the table was generated from
         """
         self._table = table
         self._default_seed = seed
@@ -62,37 +143,43 @@ class _ReflectedTableCrc:
         self._result_mask = (1 << width) - 1
         self._reverse_result = reverse_result
         self.name = name
+        self.params = params
 
-    def calculate(self, data: bytes):
-        """Perform CRC calculation on data
-
-        :param data: a string of bytes
-        :return: integer calculated CRC
-        """
+    def _init_register(self):
         # For the parameters to make sense in the normal usage, the seed has to
         # be reflected here because this algorithm corresponds to a reflection
         # of the input data, which is implemented by a reflection of the lookup
         # table for performance improvement i.e. all the intermediate CRC values
         # are reflected so the same has to be done for the seed
-        crc = bit_reverse_n(self._default_seed, self._width)
+        return bit_reverse_n(self._default_seed, self._width)
+
+    def _update(self, register, data):
+        crc = register
         for byte in data:
             crc = (crc >> 8) ^ self._table[(crc & 0xFF) ^ byte]
             crc &= self._result_mask
+        return crc
+
+    def _finalize(self, register):
+        crc = register
         if self._reverse_result:
             # This is a weird corner case where the output is reflected but the
             # input isn't
             crc = bit_reverse_n(crc, self._width)
         return crc ^ self._xor_out
 
-    def __call__(self, data):
-        """calculate CRC"""
-        return self.calculate(data)
 
+class _CrcMsbfTable(_CrcEngine):
+    """Most-significant-bit-first table-driven CRC calculation.
 
-class _CrcMsbfTable:
-    """Most-significant-bit-first table-driven CRC calculation"""
+    The register of a polynomial narrower than 8 bits is shifted to the top
+    of the byte that indexes the table, the table entries hold the result in
+    the low `width` bits
+    """
 
-    def __init__(self, table, width, seed, xor_out=0, reverse_result=False, name=""):
+    # pylint: disable=too-many-arguments
+    def __init__(self, table, width, seed, xor_out=0, reverse_result=False, name="",
+                 params=None):
         self._table = table
         self._seed = seed
         self._width = width
@@ -101,32 +188,202 @@ class _CrcMsbfTable:
         self._msb_lshift = width - 8
         self._reverse_result = reverse_result
         self.name = name
+        self.params = params
 
-    def calculate(self, data):
-        """Calculate a CRC on data
+    def _init_register(self):
+        return self._seed
 
-        :param data: bytes string
-        :return: calculated CRC
-        """
-        remainder = self._seed
+    def _update(self, register, data):
+        if self._msb_lshift < 0:
+            return self._update_narrow(register, data)
+        remainder = register
         for value in data:
             remainder = (remainder << 8) ^ self._table[
                 (remainder >> self._msb_lshift) ^ value
                 ]
             remainder &= self._result_mask
+        return remainder
+
+    def _update_narrow(self, register, data):
+        # Every bit of the register is shifted out by each byte, so the new
+        # register is just the table entry
+        remainder = register
+        table = self._table
+        lshift = -self._msb_lshift
+        for value in data:
+            remainder = table[(remainder << lshift) ^ value]
+        return remainder
+
+    def _finalize(self, register):
+        remainder = register
         if self._reverse_result:
             remainder = bit_reverse_n(remainder, self._width)
         return remainder ^ self._xor_out
 
-    def __call__(self, data):
-        return self.calculate(data)
+
+class _ReflectedSliceCrc(_ReflectedTableCrc):
+    """Slice-by-N variant of the reflected table algorithm, consuming 8 or 16
+    bytes of input on every iteration using N derived lookup tables.
+
+    The seed parameter is specified in the same way as for
+    :class:`_ReflectedTableCrc`
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, tables, width, seed, xor_out=0, reverse_result=False, name="",
+                 params=None):
+        """
+        :param tables: list of 8 or 16 lookup tables as produced by
+                       :func:`create_slice_tables` with `reflect=True`
+        """
+        super().__init__(tables[0], width, seed, xor_out, reverse_result, name, params)
+        self._tables = tables
+        self._update_words = (self._update_slice16 if len(tables) == 16
+                              else self._update_slice8)
+
+    def _update(self, register, data):
+        view = memoryview(data).cast("B")
+        body_len = len(view) - (len(view) % len(self._tables))
+        crc = self._update_words(register, view[:body_len])
+        table = self._table
+        for byte in view[body_len:]:
+            crc = (crc >> 8) ^ table[(crc & 0xFF) ^ byte]
+        return crc
+
+    def _update_slice8(self, crc, view):
+        # The register is at most 64 bits wide, so it overlaps entirely with
+        # the 8 input bytes of each little-endian word
+        tab0, tab1, tab2, tab3, tab4, tab5, tab6, tab7 = self._tables
+        for (word,) in struct.iter_unpack("<Q", view):
+            word ^= crc
+            crc = (tab7[word & 0xFF] ^ tab6[(word >> 8) & 0xFF]
+                   ^ tab5[(word >> 16) & 0xFF] ^ tab4[(word >> 24) & 0xFF]
+                   ^ tab3[(word >> 32) & 0xFF] ^ tab2[(word >> 40) & 0xFF]
+                   ^ tab1[(word >> 48) & 0xFF] ^ tab0[word >> 56])
+        return crc
+
+    def _update_slice16(self, crc, view):
+        # pylint: disable=too-many-locals
+        (tab0, tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11,
+         tab12, tab13, tab14, tab15) = self._tables
+        for low, high in struct.iter_unpack("<QQ", view):
+            low ^= crc
+            crc = (tab15[low & 0xFF] ^ tab14[(low >> 8) & 0xFF]
+                   ^ tab13[(low >> 16) & 0xFF] ^ tab12[(low >> 24) & 0xFF]
+                   ^ tab11[(low >> 32) & 0xFF] ^ tab10[(low >> 40) & 0xFF]
+                   ^ tab9[(low >> 48) & 0xFF] ^ tab8[low >> 56]
+                   ^ tab7[high & 0xFF] ^ tab6[(high >> 8) & 0xFF]
+                   ^ tab5[(high >> 16) & 0xFF] ^ tab4[(high >> 24) & 0xFF]
+                   ^ tab3[(high >> 32) & 0xFF] ^ tab2[(high >> 40) & 0xFF]
+                   ^ tab1[(high >> 48) & 0xFF] ^ tab0[high >> 56])
+        return crc
+
+
+class _CrcMsbfSlice(_CrcMsbfTable):
+    """Slice-by-N variant of the most-significant-bit-first table algorithm,
+    consuming 8 or 16 bytes of input on every iteration using N derived
+    lookup tables
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, tables, width, seed, xor_out=0, reverse_result=False, name="",
+                 params=None):
+        """
+        :param tables: list of 8 or 16 lookup tables as produced by
+                       :func:`create_slice_tables` with `reflect=False`
+        """
+        super().__init__(tables[0], width, seed, xor_out, reverse_result, name, params)
+        self._tables = tables
+        # Shift that aligns the most significant bit of the register with the
+        # most significant bit of a 64-bit big-endian input word
+        self._word_lshift = 64 - width
+        self._update_words = (self._update_slice16 if len(tables) == 16
+                              else self._update_slice8)
+
+    def _update(self, register, data):
+        if self._msb_lshift < 0:
+            # A single table lookup per byte is quicker than slicing for
+            # widths under 8 bits
+            return self._update_narrow(register, data)
+        view = memoryview(data).cast("B")
+        body_len = len(view) - (len(view) % len(self._tables))
+        remainder = self._update_words(register, view[:body_len])
+        return super()._update(remainder, view[body_len:])
+
+    def _update_slice8(self, crc, view):
+        tab0, tab1, tab2, tab3, tab4, tab5, tab6, tab7 = self._tables
+        lshift = self._word_lshift
+        for (word,) in struct.iter_unpack(">Q", view):
+            word ^= crc << lshift
+            crc = (tab7[word >> 56] ^ tab6[(word >> 48) & 0xFF]
+                   ^ tab5[(word >> 40) & 0xFF] ^ tab4[(word >> 32) & 0xFF]
+                   ^ tab3[(word >> 24) & 0xFF] ^ tab2[(word >> 16) & 0xFF]
+                   ^ tab1[(word >> 8) & 0xFF] ^ tab0[word & 0xFF])
+        return crc
+
+    def _update_slice16(self, crc, view):
+        # pylint: disable=too-many-locals
+        (tab0, tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11,
+         tab12, tab13, tab14, tab15) = self._tables
+        lshift = self._word_lshift
+        for high, low in struct.iter_unpack(">QQ", view):
+            high ^= crc << lshift
+            crc = (tab15[high >> 56] ^ tab14[(high >> 48) & 0xFF]
+                   ^ tab13[(high >> 40) & 0xFF] ^ tab12[(high >> 32) & 0xFF]
+                   ^ tab11[(high >> 24) & 0xFF] ^ tab10[(high >> 16) & 0xFF]
+                   ^ tab9[(high >> 8) & 0xFF] ^ tab8[high & 0xFF]
+                   ^ tab7[low >> 56] ^ tab6[(low >> 48) & 0xFF]
+                   ^ tab5[(low >> 40) & 0xFF] ^ tab4[(low >> 32) & 0xFF]
+                   ^ tab3[(low >> 24) & 0xFF] ^ tab2[(low >> 16) & 0xFF]
+                   ^ tab1[(low >> 8) & 0xFF] ^ tab0[low & 0xFF])
+        return crc
+
+
+class _ReflectedNibbleCrc(_ReflectedTableCrc):
+    """Variant of the reflected table algorithm using a 16 entry table,
+    processing each byte as two 4-bit halves. This is slower than using a
+    256 entry table but the table is 16 times smaller
+    """
+
+    def _update(self, register, data):
+        crc = register
+        table = self._table
+        for byte in data:
+            crc ^= byte
+            crc = (crc >> 4) ^ table[crc & 0xF]
+            crc = (crc >> 4) ^ table[crc & 0xF]
+        return crc
+
+
+class _CrcMsbfNibble(_CrcMsbfTable):
+    """Variant of the most-significant-bit-first table algorithm using a 16
+    entry table, processing each byte as two 4-bit halves
+    """
+
+    def _update(self, register, data):
+        remainder = register
+        table = self._table
+        if self._width < 4:
+            # As for _CrcMsbfTable._update_narrow, with 4 bits at a time
+            lshift = 4 - self._width
+            for value in data:
+                remainder = table[(remainder << lshift) ^ (value >> 4)]
+                remainder = table[(remainder << lshift) ^ (value & 0xF)]
+            return remainder
+        mask = self._result_mask
+        rshift = self._width - 4
+        for value in data:
+            remainder = ((remainder << 4) & mask) ^ table[(remainder >> rshift) ^ (value >> 4)]
+            remainder = ((remainder << 4) & mask) ^ table[(remainder >> rshift) ^ (value & 0xF)]
+        return remainder
 
 
-class _CrcGeneric:
+class _CrcGeneric(_CrcEngine):
     """Generic most-significant-bit-first table-driven CRC calculation, allows
     unusual (and probably not useful) combinations of parameters such as
     reflecting the input without reflecting the output
     """
+    # pylint: disable=too-many-instance-attributes
     def __init__(self, params: CrcParams, name=""):
         """
 
@@ -156,6 +413,7 @@ class _CrcGeneric:
         self._ref_in = params.reflect_in
         self._ref_out = params.reflect_out
         self.name = name
+        self.params = params
 
     def calculate(self, data, seed=None):
         """Calculate CRC of data
@@ -167,10 +425,16 @@ class _CrcGeneric:
         The fundamental logic of the algorithm is to read each byte from the
         input stream, and xor with the pol
         """
+        return self._finalize(self._update(self._init_register(seed), data))
+
+    def _init_register(self, seed=None):
         crc = seed if seed is not None else self._default_seed
         # if the poly is less than 8 bits wide, the calculation is performed
         # at the top end of the byte, so that whole bytes can be loaded
-        crc <<= self._crc_lshift
+        return crc << self._crc_lshift
+
+    def _update(self, register, data):
+        crc = register
         poly = self._poly << self._crc_lshift
         for byte in data:
             if self._ref_in:
@@ -182,16 +446,16 @@ class _CrcGeneric:
                 else:
                     crc <<= 1
             crc &= self._crc_mask
-        crc >>= self._crc_lshift
+        return crc
+
+    def _finalize(self, register):
+        crc = register >> self._crc_lshift
         if self._ref_out:
             crc = bit_reverse_n(crc, self._width)
         return crc ^ self._xor_out
 
-    def __call__(self, data):
-        return self.calculate(data)
 
-
-class _WindowedCrc:
+class _WindowedCrc(_CrcEngine):
     """Generic most-significant-bit-first table-driven CRC calculation with
     an optional range of bit positions on the input to process.
     Allows unusual (and probably not very useful) combinations of parameters such as
@@ -201,7 +465,7 @@ class _WindowedCrc:
     def __init__(self, params: CrcParams, name="") -> None:
         self._width = params.width
         self._default_seed = params.seed
-        self._params = params
+        self.params = params
         self._result_mask = (1 << params.width) - 1
 
         # If the width is less than 8 bits, the CRC poly needs
@@ -222,6 +486,10 @@ class _WindowedCrc:
         self._crc_mask = (1 << (params.width + self._crc_lshift)) - 1
         self._ref_in = params.reflect_in
         self._ref_out = params.reflect_out
+        # MSB-first table for the polynomial aligned with the top of the
+        # calculation register, which is at least 8 bits wide
+        self._table = get_table(params.polynomial << self._crc_lshift,
+                                params.width + self._crc_lshift, False)
         self.name = name
 
     def calculate(self, data: bytes, start_bit=0, length_bits=None, seed=None) -> int:
@@ -236,13 +504,46 @@ class _WindowedCrc:
         :param seed: optional seed value
         :return: calculated CRC
         """
-        # pylint: disable=too-many-locals
-        residual = seed if seed is not None else self._default_seed
-        num_input_bits = _BYTEBITS * len(data)
-
         if length_bits is None:
-            length_bits = num_input_bits - start_bit
-
+            length_bits = _BYTEBITS * len(data) - start_bit
+        self._check_window(data, start_bit, length_bits)
+        residual = self._update_window(self._init_register(seed), data, start_bit, length_bits)
+        return self._finalize(residual)
+
+    def calculate_ranges(self, data, ranges, seed=None) -> int:
+        """Calculate the CRC of several ranges of bits, which are processed in
+        order as if they were one contiguous stream of bits. For example a
+        header excluding a field that changes in transit
+
+        :param data: byte string containing the ranges, may be None if every
+                     range names its own buffer
+        :param ranges: sequence of (`start_bit`, `length_bits`) pairs of
+                       ranges in `data`, or (`buffer`, `start_bit`,
+                       `length_bits`) triples of ranges in other buffers. Bit
+                       numbering is as for :meth:`calculate`
+        :param seed: optional seed value
+        :return: calculated CRC
+        """
+        # Check every range first, so that an error is not reported part way
+        # through the calculation
+        windows = []
+        for window in ranges:
+            if len(window) == 2:
+                buffer, (start_bit, length_bits) = data, window
+            else:
+                buffer, start_bit, length_bits = window
+            if buffer is None:
+                raise ValueError(f"Range {window} does not name a buffer and data is None.")
+            self._check_window(buffer, start_bit, length_bits)
+            windows.append((buffer, start_bit, length_bits))
+        residual = self._init_register(seed)
+        for buffer, start_bit, length_bits in windows:
+            residual = self._update_window(residual, buffer, start_bit, length_bits)
+        return self._finalize(residual)
+
+    @staticmethod
+    def _check_window(data, start_bit, length_bits):
+        num_input_bits = _BYTEBITS * len(data)
         if (start_bit >= num_input_bits) or (start_bit < 0):
             raise ValueError(f"Start bit {start_bit} is out of range.")
         if length_bits < 0:
@@ -250,37 +551,87 @@ class _WindowedCrc:
         if start_bit + length_bits > num_input_bits:
             raise ValueError(f"Parameter length_bits {length_bits} is out of range.")
 
+    def _init_register(self, seed=None):
+        residual = seed if seed is not None else self._default_seed
+        # if the poly is less than 8 bits wide, the calculation is performed
+        # at the top end of the byte, so that whole bytes can be loaded
+        return residual << self._crc_lshift
+
+    def _update(self, register, data):
+        if not data:
+            return register
+        return self._update_window(register, data, 0, _BYTEBITS * len(data))
+
+    def _update_window(self, residual, data, start_bit, length_bits):
+        if length_bits == 0:
+            return residual
         first_byte, first_bit = divmod(start_bit, _BYTEBITS)
         last_byte, last_bit = divmod(start_bit + length_bits - 1, 8)
+        # Range of the bytes that are entirely within the window, these are
+        # processed using the lookup table and only the partial bytes at each
+        # end of the window are processed a bit at a time
+        body_start = first_byte + 1 if first_bit else first_byte
+        body_end = last_byte + 1 if last_bit == _BYTEBITS - 1 else last_byte
+        if first_bit:
+            residual = self._update_partial_byte(residual, data, first_byte, first_byte,
+                                                 first_bit, last_byte, last_bit)
+        if body_start < body_end:
+            residual = self._update_bytes(residual, memoryview(data)[body_start:body_end])
+        if body_start <= last_byte == body_end:
+            residual = self._update_partial_byte(residual, data, last_byte, first_byte,
+                                                 first_bit, last_byte, last_bit)
+        return residual
+
+    def _update_bytes(self, residual, view):
+        """Process whole bytes, using a table calculated for the polynomial
+        shifted to the top of the register"""
+        table = self._table
+        crc_mask = self._crc_mask
+        msb_rshift = self._msb_lshift
+        if self._ref_in:
+            rev8bits = _REV8BITS
+            if crc_mask == 0xFF:
+                for byte in view:
+                    residual = table[residual ^ rev8bits[byte]]
+            else:
+                for byte in view:
+                    residual = (((residual << 8) & crc_mask)
+                                ^ table[(residual >> msb_rshift) ^ rev8bits[byte]])
+        elif crc_mask == 0xFF:
+            for byte in view:
+                residual = table[residual ^ byte]
+        else:
+            for byte in view:
+                residual = ((residual << 8) & crc_mask) ^ table[(residual >> msb_rshift) ^ byte]
+        return residual
+
+    def _update_partial_byte(self, residual, data, index, first_byte, first_bit, last_byte,
+                             last_bit):
+        # pylint: disable=too-many-arguments
+        input_bits, input_width = self._get_input_bits(
+            data, index, first_byte, first_bit, last_byte, last_bit
+        )
+        poly = self.params.polynomial << self._crc_lshift
+        # Shift the input data to align with the top bit of the rolling
+        # CRC value
+        residual ^= input_bits << self._msb_lshift
+        # XOR the poly, this is fewer than 8 bits since it is a partial first
+        # or last byte
+        for _ in range(input_width):
+            if residual & self._msbit_mask:
+                residual = (residual << 1) ^ poly
+            else:
+                residual <<= 1
+            residual &= self._crc_mask
+        return residual
 
-        check_range = range(first_byte, last_byte + 1)
-        # if the poly is less than 8 bits wide, the calculation is performed
-        # at the top end of the byte, so that whole bytes can be loaded
-        residual <<= self._crc_lshift
-        poly = self._params.polynomial << self._crc_lshift
-        # Since we are checking a slice of the byte stream, it's clearer to
-        # iterate over the index of the list  rather than the data itself
-        for index in check_range:
-            input_bits, input_width = self._get_input_bits(
-                data, index, first_byte, first_bit, last_byte, last_bit
-            )
-            # Shift the input data to align with the top bit of the rolling
-            # CRC value
-            residual ^= input_bits << self._msb_lshift
-            # XOR the poly, this is usually 8 bits, unless it is a partial first
-            # or last byte
-            for _ in range(input_width):
-                if residual & self._msbit_mask:
-                    residual = (residual << 1) ^ poly
-                else:
-                    residual <<= 1
-                residual &= self._crc_mask
+    def _finalize(self, register):
         # For small polynomials undo any shift we did at the start
-        assert residual & ((1 << self._crc_lshift) - 1) == 0
-        residual >>= self._crc_lshift
+        assert register & ((1 << self._crc_lshift) - 1) == 0
+        residual = register >> self._crc_lshift
         if self._ref_out:
             residual = bit_reverse_n(residual, self._width)
-        return residual ^ self._params.xor_out
+        return residual ^ self.params.xor_out
 
     def _get_input_bits(self, data, index, first_byte, first_bit, last_byte, last_bit):
         input_byte = data[index]
@@ -303,11 +654,8 @@ class _WindowedCrc:
             block_width -= first_bit
         return input_byte, block_width
 
-    def __call__(self, data):
-        return self.calculate(data)
-
 
-class _GenericReflectingLsbCrc:
+class _GenericReflectingLsbCrc(_CrcEngine):
     """General purpose CRC calculation using LSB algorithm. Mainly here for
     reference, since the other algorithms cover all useful calculation combinations
     """
@@ -323,6 +671,7 @@ class _GenericReflectingLsbCrc:
         self._ref_in = ref_in
         self._ref_out = ref_out
         self.name = name
+        self.params = CrcParams(polynomial, width, seed, ref_in, ref_out, xor_out)
 
     def calculate(self, data, seed=None):
         """Calculate a CRC on data
@@ -331,8 +680,13 @@ class _GenericReflectingLsbCrc:
         :param seed: Optional seed
         :return: calculated CRC
         """
-        crc = seed if seed is not None else self._seed
+        return self._finalize(self._update(self._init_register(seed), data))
+
+    def _init_register(self, seed=None):
+        return seed if seed is not None else self._seed
 
+    def _update(self, register, data):
+        crc = register
         if self._ref_in:
             poly = bit_reverse_n(self._poly, self._width)
         else:
@@ -347,53 +701,377 @@ class _GenericReflectingLsbCrc:
                 else:
                     crc >>= 1
             crc &= self._result_mask
+        return crc
+
+    def _finalize(self, register):
+        crc = register
         if self._ref_out:
             crc = bit_reverse_n(crc, self._width)
         return crc ^ self._xor_out
 
-    def __call__(self, data):
-        """Calculate CRC for data"""
-        return self.calculate(data)
+
+class _NativeCrc(_CrcEngine):
+    """CRC calculation performed by a function written in C, either one of
+    those included in the python standard library, see :func:`native_crc`,
+    or one compiled from generated code, see :func:`cc_crc`
+    """
+
+    def __init__(self, params: CrcParams, update_func, name=""):
+        """
+        :param params: CRC parameters
+        :param update_func: function taking the calculation register and the
+                            data, returning the updated register
+        :param name:
+        """
+        self._update_func = update_func
+        self._width = params.width
+        self._xor_out = params.xor_out
+        # The reflected implementations hold the register reflected, as
+        # _ReflectedTableCrc does
+        if params.reflect_in:
+            self._initial = bit_reverse_n(params.seed, params.width)
+        else:
+            self._initial = params.seed
+        self._reverse_result = params.reflect_in != params.reflect_out
+        self.name = name
+        self.params = params
+
+    def _init_register(self):
+        return self._initial
+
+    def _update(self, register, data):
+        return self._update_func(register, data)
+
+    def _finalize(self, register):
+        crc = register
+        if self._reverse_result:
+            crc = bit_reverse_n(crc, self._width)
+        return crc ^ self._xor_out
+
+
+class _CompiledCrc(_CrcEngine):
+    """CRC calculation by python functions generated and compiled for one set
+    of parameters, see :func:`compiled_crc`
+    """
+
+    def __init__(self, params: CrcParams, functions: "_CompiledFunctions", name=""):
+        self._functions = functions
+        self.name = name
+        self.params = params
+
+    def calculate(self, data):
+        return self._functions.calculate(data)
+
+    def _init_register(self):
+        return self._functions.initial_register
+
+    def _update(self, register, data):
+        return self._functions.update(register, data)
+
+    def _finalize(self, register):
+        return self._functions.finalize(register)
+
+
+class _CompiledFunctions(NamedTuple):
+    """Functions compiled from the source produced by
+    :func:`crcengine.codegen.generate_engine_source`"""
+
+    initial_register: int
+    update: Callable[[int, Any], int]
+    finalize: Callable[[int], int]
+    calculate: Callable[[Any], int]
+
+
+def _zlib_crc32_update(register, data):
+    # zlib.crc32 takes and returns its register inverted
+    return zlib.crc32(data, register ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+
+
+def _binascii_crc_hqx_update(register, data):
+    return binascii.crc_hqx(data, register)
+
+
+# Standard library functions able to update a calculation register, keyed by
+# (polynomial, width, reflect_in). Any seed, xor_out and reflect_out can be
+# applied around them
+_NATIVE_UPDATE_FUNCS = {
+    (0x04C11DB7, 32, True): _zlib_crc32_update,
+    (0x1021, 16, False): _binascii_crc_hqx_update,
+}
+
+
+class CrcStream:
+    """Incremental CRC calculation in the style of the objects provided by
+    :mod:`hashlib`. Instances are obtained from :func:`stream` or the
+    ``stream()`` method of a calculation engine.
+
+    Data can be supplied in pieces with :meth:`update`, the CRC of all the
+    data supplied so far is available at any point from :attr:`crcvalue`
+    """
+    # The stream drives the internal register interface of its engine
+    # pylint: disable=protected-access
+
+    def __init__(self, engine: _CrcEngine, data=b"") -> None:
+        """
+        :param engine: calculation engine used to process the data
+        :param data: optional initial data to process
+        """
+        self._engine = engine
+        self._register = engine._init_register()
+        if data:
+            self.update(data)
+
+    @property
+    def name(self) -> str:
+        """Name of the CRC algorithm"""
+        return self._engine.name
+
+    @property
+    def digest_size(self) -> int:
+        """Size of the result returned by :meth:`digest` in bytes"""
+        return (self._engine.params.width + 7) // 8
+
+    @property
+    def crcvalue(self) -> int:
+        """CRC of the data supplied so far"""
+        return self._engine._finalize(self._register)
+
+    def update(self, data) -> None:
+        """Add data to the calculation
+
+        :param data: bytes-like object
+        """
+        self._register = self._engine._update(self._register, data)
+
+    def digest(self) -> bytes:
+        """Return the CRC of the data supplied so far as bytes. The byte order
+        is little-endian for algorithms with a reflected output and big-endian
+        otherwise, which is the order in which the CRC is normally appended to
+        the data it protects
+        """
+        byteorder = "little" if self._engine.params.reflect_out else "big"
+        return self.crcvalue.to_bytes(self.digest_size, byteorder)
+
+    def hexdigest(self) -> str:
+        """Return :meth:`digest` as a string of hexadecimal digits"""
+        return self.digest().hex()
+
+    def copy(self) -> "CrcStream":
+        """Return a copy of the stream. The copy shares the engine (and its
+        lookup tables) with the original, only the calculation state is
+        duplicated
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone._engine = self._engine
+        clone._register = self._register
+        return clone
+
+
+class MultiCrcStream:
+    """Incremental calculation of several CRC algorithms over the same data,
+    which is read once for all of them. Each piece of data supplied to
+    :meth:`update` is processed by every algorithm in turn, in chunks small
+    enough to remain in the processor's cache
+    """
+
+    def __init__(self, names: Iterable[str], data=b"", calc_engine=_DEFAULT_ENGINE) -> None:
+        """
+        :param names: names of the CRC algorithms
+        :param data: optional initial data to process
+        :param calc_engine: back-end calculation engine to use
+        """
+        self._streams = {name: new(name, calc_engine).stream() for name in names}
+        if data:
+            self.update(data)
+
+    @property
+    def crcvalues(self) -> Dict[str, int]:
+        """CRC of the data supplied so far for each algorithm, keyed by
+        algorithm name"""
+        return {name: crc_stream.crcvalue for name, crc_stream in self._streams.items()}
+
+    def update(self, data) -> None:
+        """Add data to the calculation of every algorithm
+
+        :param data: bytes-like object
+        """
+        streams = self._streams.values()
+        with memoryview(data) as view, view.cast("B") as view:
+            for start in range(0, len(view), _MULTI_CHUNK_SIZE):
+                with view[start:start + _MULTI_CHUNK_SIZE] as chunk:
+                    for crc_stream in streams:
+                        crc_stream.update(chunk)
+
+    def copy(self) -> "MultiCrcStream":
+        """Return a copy of the stream, duplicating only the calculation
+        state"""
+        clone = self.__class__.__new__(self.__class__)
+        clone._streams = {  # pylint: disable=protected-access
+            name: crc_stream.copy() for name, crc_stream in self._streams.items()
+        }
+        return clone
 
 
 def new(name: str, calc_engine=_DEFAULT_ENGINE):
-    """Create a new CRC calculation instance"""
+    """Create a new CRC calculation instance.
+
+    Instances are cached and shared between callers asking for the same
+    algorithm and engine, so they should not be modified
+    """
     params = lookup_params(name)
-    # the check field is not part of the definition, remove it before
-    # creating the algorithm
-    algorithm = create_from_params(params, calc_engine)
-    algorithm.name = name
+    algorithm = _cached_engine(params, calc_engine, name)
+    if _engine_wrapper is not None:
+        return _engine_wrapper(algorithm, calc_engine)
     return algorithm
 
 
+def stream(name: str, data=b"", calc_engine=_DEFAULT_ENGINE) -> CrcStream:
+    """Create an object for incremental calculation of the CRC algorithm
+    `name`, in the style of :func:`hashlib.new`
+
+    :param name: name of CRC algorithm
+    :param data: optional initial data to process
+    :param calc_engine: back-end calculation engine to use
+    :return: a :class:`CrcStream`
+    """
+    return new(name, calc_engine).stream(data)
+
+
+def calculate_multi(names: Iterable[str], data, calc_engine=_DEFAULT_ENGINE) -> Dict[str, int]:
+    """Calculate the CRC of `data` for several algorithms, reading the data
+    once for all of them, see :class:`MultiCrcStream`
+
+    :param names: names of the CRC algorithms
+    :param data: bytes-like object
+    :param calc_engine: back-end calculation engine to use
+    :return: dict of CRC values keyed by algorithm name
+    """
+    return MultiCrcStream(names, data, calc_engine).crcvalues
+
+
 @typing.no_type_check
 def table_crc(params: CrcParams):
     """Return a table-based CRC algorithm corresponding to `params`
     """
-    if params.reflect_in:
-        table = create_lsb_table(params.polynomial, params.width)
-        crc_class = _ReflectedTableCrc
-    else:
-        table = create_msb_table(params.polynomial, params.width)
-        crc_class = _CrcMsbfTable
+    table = get_table(params.polynomial, params.width, params.reflect_in)
+    crc_class = _ReflectedTableCrc if params.reflect_in else _CrcMsbfTable
 
     reverse_result = params.reflect_in != params.reflect_out
     algorithm = crc_class(table, params.width, params.seed, xor_out=params.xor_out,
-                          reverse_result=reverse_result)
+                          reverse_result=reverse_result, params=params)
     return algorithm
 
 
+def slice8_crc(params: CrcParams):
+    """Return a slice-by-8 table-based CRC algorithm corresponding to `params`
+    """
+    return _slice_crc(params, 8)
+
+
+def slice16_crc(params: CrcParams):
+    """Return a slice-by-16 table-based CRC algorithm corresponding to `params`
+    """
+    return _slice_crc(params, 16)
+
+
+def _slice_crc(params: CrcParams, num_slices: int):
+    tables = get_slice_tables(params.polynomial, params.width, params.reflect_in, num_slices)
+    crc_class = _ReflectedSliceCrc if params.reflect_in else _CrcMsbfSlice
+    reverse_result = params.reflect_in != params.reflect_out
+    return crc_class(tables, params.width, params.seed, xor_out=params.xor_out,
+                     reverse_result=reverse_result, params=params)
+
+
+def nibble_crc(params: CrcParams):
+    """Return a CRC algorithm corresponding to `params` that uses a 16 entry
+    lookup table, for when memory is more important than speed
+    """
+    table = get_nibble_table(params.polynomial, params.width, params.reflect_in)
+    crc_class = _ReflectedNibbleCrc if params.reflect_in else _CrcMsbfNibble
+    reverse_result = params.reflect_in != params.reflect_out
+    return crc_class(table, params.width, params.seed, xor_out=params.xor_out,
+                     reverse_result=reverse_result, params=params)
+
+
+def native_crc(params: CrcParams):
+    """Return a CRC algorithm using a C implementation from the python
+    standard library when one exists for `params`, which are
+    :func:`zlib.crc32` for the reflected CRC32 polynomial and
+    :func:`binascii.crc_hqx` for the non-reflected CCITT polynomial, with any
+    seed, xor_out or output reflection. Other parameters result in a
+    table-based algorithm as produced by :func:`table_crc`
+    """
+    update_func = _NATIVE_UPDATE_FUNCS.get((params.polynomial, params.width, params.reflect_in))
+    if update_func is None:
+        return table_crc(params)
+    return _NativeCrc(params, update_func)
+
+
+def compiled_crc(params: CrcParams):
+    """Return a table-based CRC algorithm whose calculation is performed by
+    python functions generated specifically for `params` and compiled at
+    runtime. The parameters are constants in the generated code, so there is
+    less work per byte than for :func:`table_crc`. The generated functions
+    are cached for each set of parameters
+    """
+    return _CompiledCrc(params, _compiled_functions(params))
+
+
+@lru_cache(maxsize=_ENGINE_CACHE_SIZE)
+def _compiled_functions(params: CrcParams) -> _CompiledFunctions:
+    # Code generation requires jinja2, which is slow to import so it is only
+    # loaded when needed
+    source = _import_lazily("codegen").generate_engine_source(params, table_name="TABLE")
+    filename = f"<crcengine compiled {params}>"
+    # Register the source so that it is shown in tracebacks
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace = {
+        "TABLE": get_table(params.polynomial, params.width, params.reflect_in),
+        "bit_reverse_n": bit_reverse_n,
+    }
+    exec(compile(source, filename, "exec"), namespace)  # pylint: disable=exec-used
+    return _CompiledFunctions(namespace["INITIAL_REGISTER"], namespace["crc_update"],
+                              namespace["crc_finalize"], namespace["crc_calculate"])
+
+
+def cc_crc(params: CrcParams):
+    """Return a CRC algorithm using C code generated for the polynomial of
+    `params`, which is compiled with the local C compiler the first time it
+    is needed and cached on disk, see :mod:`crcengine.cc`. If there is no C
+    compiler the result is a table-based algorithm as produced by
+    :func:`table_crc`
+    """
+    update_func = _import_lazily("cc").get_update_func(params.polynomial, params.width,
+                                                       params.reflect_in)
+    if update_func is None:
+        return table_crc(params)
+    return _NativeCrc(params, update_func)
+
+
 def create_from_params(params: CrcParams, calc_engine=_DEFAULT_ENGINE):
     """Create a CRC calculation algorithm instance based on `params` using
     calculation engine `calc_engine` as the back end
 
+    Instances are cached and shared between callers asking for the same
+    parameters and engine, so they should not be modified
+
     :param params:
     :param calc_engine:
     :return:
     """
+    algorithm = _cached_engine(params, calc_engine, "")
+    if _engine_wrapper is not None:
+        return _engine_wrapper(algorithm, calc_engine)
+    return algorithm
+
+
+@lru_cache(maxsize=_ENGINE_CACHE_SIZE)
+def _cached_engine(params: CrcParams, calc_engine: str, name: str):
     params.validate()
     creator_fun = _CREATOR_FUNCS[calc_engine]
-    return creator_fun(params)
+    algorithm = creator_fun(params)
+    algorithm.name = name
+    return algorithm
 
 
 def create(poly=None, width=None, seed=None,  # pylint: disable=too-many-arguments
@@ -426,15 +1104,17 @@ def create(poly=None, width=None, seed=None,  # pylint: disable=too-many-argumen
 
 
 def _create_old(poly, width, seed, ref_in, ref_out, name, xor_out, ):
+    params = CrcParams(poly, width, seed, ref_in, ref_out, xor_out)
     if ref_in:
-        table = create_lsb_table(poly, width)
+        table = get_table(poly, width, True)
         algorithm = _ReflectedTableCrc(
             table, width, seed, reverse_result=(ref_in != ref_out), xor_out=xor_out, name=name,
+            params=params,
         )
     else:
-        table = create_msb_table(poly, width)
+        table = get_table(poly, width, False)
         algorithm = _CrcMsbfTable(
-            table, width, seed, reverse_result=ref_out, xor_out=xor_out, name=name
+            table, width, seed, reverse_result=ref_out, xor_out=xor_out, name=name, params=params
         )
     return algorithm
 
@@ -467,8 +1147,8 @@ def generic_crc(params: CrcParams):
 
 
 def windowed_crc(params: CrcParams):
-    """Create generic non-table-driven CRC calculator that allows a start-bit
-    and bit-length window to be specified on the CRC calculation
+    """Create a CRC calculator that allows a start-bit and bit-length window
+    to be specified on the CRC calculation
 
     :return: A CRC calculation engine
     """
@@ -520,6 +1200,12 @@ def create_msb_table_individual(poly, width):
 
 _CREATOR_FUNCS = {
     "table": table_crc,
+    "slice8": slice8_crc,
+    "slice16": slice16_crc,
+    "nibble": nibble_crc,
+    "native": native_crc,
+    "compiled": compiled_crc,
+    "cc": cc_crc,
     "generic": generic_crc,
     "generic_msbf": generic_crc,
     "generic_lsbf": _create_reflecting_lsbf,
@@ -538,6 +1224,161 @@ def create_msb_table(poly, width):
     """Calculate a CRC lookup table for the selected algorithm definition
     :return: list of CRC values
     """
+    return list(get_table(poly, width, False))
+
+
+def create_lsb_table(poly, width):
+    """Calculate a CRC lookup table for the selected algorithm definition
+    producing a table that can be used for the lsbit algorithm
+
+    :return: table of reflected
+    """
+    return list(get_table(poly, width, True))
+
+
+def create_slice_tables(poly, width, reflect, num_slices=8):
+    """Calculate the lookup tables for a slice-by-N CRC calculation.
+    Table 0 is the ordinary table as produced by :func:`create_lsb_table` or
+    :func:`create_msb_table`, table `n` holds the CRC of each byte value
+    followed by `n` zero bytes
+
+    :param poly: polynomial
+    :param width: polynomial width in bits
+    :param reflect: produce tables for the reflected (lsbit first) algorithm
+    :param num_slices: number of tables to produce
+    :return: list of `num_slices` tables
+    """
+    return [list(table) for table in get_slice_tables(poly, width, reflect, num_slices)]
+
+
+@lru_cache(maxsize=_TABLE_CACHE_SIZE)
+def get_table(poly: int, width: int, reflect: bool) -> Tuple[int, ...]:
+    """Return the lookup table for a polynomial. Tables are cached, so the
+    result is shared and returned as a tuple; use :func:`create_lsb_table` or
+    :func:`create_msb_table` to obtain a list that can be modified
+
+    :param poly: polynomial
+    :param width: polynomial width in bits
+    :param reflect: return the table for the reflected (lsbit first) algorithm
+    :return: 256 entry table
+    """
+    return get_slice_tables(poly, width, reflect, 1)[0]
+
+
+@lru_cache(maxsize=_TABLE_CACHE_SIZE)
+def get_slice_tables(poly: int, width: int, reflect: bool,
+                     num_slices: int) -> Tuple[Tuple[int, ...], ...]:
+    """Return the lookup tables for a slice-by-N calculation, as
+    :func:`create_slice_tables` but cached and shared in the same way as
+    :func:`get_table`.
+
+    Tables for the built-in algorithms are loaded from the precomputed tables
+    shipped with the package, other tables are loaded from the table cache
+    directory when one is enabled (see
+    :func:`crcengine.tablestore.set_table_cache_dir`) or calculated
+    """
+    tables = tablestore.load_tables(poly, width, reflect, num_slices)
+    if tables is None:
+        tables = calculate_tables(poly, width, reflect, num_slices)
+        tablestore.save_tables(poly, width, reflect, tables)
+    return tables
+
+
+@lru_cache(maxsize=_TABLE_CACHE_SIZE)
+def get_nibble_table(poly: int, width: int, reflect: bool) -> Tuple[int, ...]:
+    """Return the 16 entry lookup table used to process 4 bits at a time,
+    cached in the same way as :func:`get_table`
+
+    :param poly: polynomial
+    :param width: polynomial width in bits
+    :param reflect: return the table for the reflected (lsbit first) algorithm
+    :return: 16 entry table
+    """
+    if reflect:
+        poly = bit_reverse_n(poly, width)
+    elif width < 4:
+        # Calculate with the polynomial at the top of a nibble, as is done by
+        # _calculate_msb_table for widths under 8
+        lshift = 4 - width
+        return tuple(value >> lshift for value in get_nibble_table(poly << lshift, 4, False))
+    ms_bit = 1 << (width - 1)
+    result_mask = (1 << width) - 1
+    table = []
+    for nibble in range(16):
+        crc = nibble if reflect else nibble << (width - 4)
+        for _ in range(4):
+            if reflect:
+                crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+            else:
+                crc = ((crc << 1) ^ poly if crc & ms_bit else crc << 1) & result_mask
+        table.append(crc)
+    return tuple(table)
+
+
+def calculate_tables(poly: int, width: int, reflect: bool,
+                     num_slices: int) -> Tuple[Tuple[int, ...], ...]:
+    """Calculate the lookup tables for a slice-by-N calculation without
+    making use of any cached or stored tables
+    """
+    if reflect:
+        table = tuple(_calculate_lsb_table(poly, width))
+    else:
+        table = tuple(_calculate_msb_table(poly, width))
+    tables = [table]
+    if reflect:
+        for _ in range(1, num_slices):
+            tables.append(tuple((value >> 8) ^ table[value & 0xFF] for value in tables[-1]))
+    elif width < 8:
+        lshift = 8 - width
+        for _ in range(1, num_slices):
+            tables.append(tuple(table[value << lshift] for value in tables[-1]))
+    else:
+        result_mask = (1 << width) - 1
+        msb_rshift = width - 8
+        for _ in range(1, num_slices):
+            tables.append(tuple(((value << 8) & result_mask) ^ table[value >> msb_rshift]
+                                for value in tables[-1]))
+    return tuple(tables)
+
+
+def cache_info() -> Dict[str, Any]:
+    """Report the statistics of the lookup table and engine caches
+
+    :return: dict of :func:`functools.lru_cache` statistics, keyed by
+             "tables", "slice_tables", "nibble_tables", "engines" and
+             "compiled" (the functions generated for the "compiled" engine)
+    """
+    # pylint: disable=no-value-for-parameter
+    return {
+        "tables": get_table.cache_info(),
+        "slice_tables": get_slice_tables.cache_info(),
+        "nibble_tables": get_nibble_table.cache_info(),
+        "engines": _cached_engine.cache_info(),
+        "compiled": _compiled_functions.cache_info(),
+    }
+
+
+def clear_caches() -> None:
+    """Discard all cached lookup tables and calculation engines"""
+    get_table.cache_clear()
+    get_slice_tables.cache_clear()
+    get_nibble_table.cache_clear()
+    _cached_engine.cache_clear()
+    _compiled_functions.cache_clear()
+
+
+def _on_registration_change(_name: str) -> None:
+    """Registration hook, discards engines which may have been created for a
+    previous definition of a registered algorithm name"""
+    _cached_engine.cache_clear()
+
+
+def _calculate_msb_table(poly, width):
+    if width < 8:
+        # Calculate with the polynomial at the top of a byte, this leaves the
+        # low bits of every entry clear
+        lshift = 8 - width
+        return [value >> lshift for value in _calculate_msb_table(poly << lshift, 8)]
     ms_bit = 1 << (width - 1)
     result_mask = (1 << width) - 1
     # Preallocate entries to 0
@@ -575,12 +1416,7 @@ def create_msb_table(poly, width):
     return table
 
 
-def create_lsb_table(poly, width):
-    """Calculate a CRC lookup table for the selected algorithm definition
-    producing a table that can be used for the lsbit algorithm
-
-    :return: table of reflected
-    """
+def _calculate_lsb_table(poly, width):
     table = 256 * [0]
     crc = 1
     # `i` is the index of the table that is being computed this loop
@@ -614,32 +1450,11 @@ def create_lsb_table(poly, width):
     return table
 
 
-def bit_reverse_byte(byte: int) -> int:
-    """Bit-bashing reversal of a byte"""
-    result = 0
-    for i in range(8):
-        if byte & (1 << i):
-            result |= 1 << (7 - i)
-    return result & 0xFF
-
-
-def bit_reverse_n(value: int, num_bits: int) -> int:
-    """Mirror the bits in an integer
-
-    :param value: the integer to reverse
-    :param num_bits: the number of bits  to reverse
-    :return: mirrored value
-    """
-    # This left shift will introduce zeroes in the least-significant bits, which
-    # will be ignored as 0 most sig bits once we bit reverse
-    value <<= (8 - num_bits) & 7
-    num_bytes = (num_bits + 7) >> 3
-    result = 0
-    for _ in range(num_bytes):
-        result <<= 8
-        result |= _REV8BITS[value & 0xFF]
-        value >>= 8
-    return result
+def _import_lazily(module_name: str):
+    """Import a module of the package that itself depends on this module,
+    such as codegen, when it is first needed. This keeps those modules out of
+    "import crcengine" and the module dependencies free of cycles"""
+    return importlib.import_module(f".{module_name}", __package__)
 
 
 def get_bits_max_value(nbits):
@@ -648,8 +1463,7 @@ def get_bits_max_value(nbits):
     return (1 << nbits) - 1
 
 
-# Table of bit-reversed bytes, initialised on loading
-_REV8BITS = [bit_reverse_byte(_n) for _n in range(256)]
+add_registration_hook(_on_registration_change)
 
 
 def _calc_end_mask(last_bit: int):
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+Calculation using C code generated by :mod:`crcengine.codegen` and compiled
+on demand with the local C compiler, as used by the "cc" calculation engine.
+
+The compiled shared libraries are cached on disk, in the directory given by
+:func:`set_cache_dir` or the ``CRCENGINE_CC_CACHE_DIR`` environment variable,
+by default in the user's cache directory. A library only depends on the
+polynomial, width and input reflection, the seed, output reflection and xor
+are applied by the engine so that all the variants of a polynomial share one
+library.
+"""
+# This file is part of CrcEngine, a python library for CRC calculation
+#
+# Copyright 2021 Garden Tools software
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+
+import ctypes
+from functools import lru_cache
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Callable, List, Optional
+import warnings
+
+from . import codegen
+
+_CACHE_DIR_ENV = "CRCENGINE_CC_CACHE_DIR"
+_COMPILE_FLAGS = ["-std=c99", "-O2", "-shared", "-fPIC"]
+# The generation strategy used for the compiled code
+_STRATEGY = "slice8"
+_LIBRARY_SUFFIX = ".dll" if sys.platform == "win32" else ".so"
+
+_CTYPES_REGISTERS = {8: ctypes.c_uint8, 16: ctypes.c_uint16, 32: ctypes.c_uint32,
+                     64: ctypes.c_uint64}
+
+# None means the environment has not yet been consulted
+_cache_dir: Optional[str] = None  # pylint: disable=invalid-name
+
+UpdateFunc = Callable[[int, object], int]
+
+
+def set_cache_dir(path: Optional[str]) -> None:
+    """Set the directory holding the compiled libraries, overriding the
+    ``CRCENGINE_CC_CACHE_DIR`` environment variable
+
+    :param path: cache directory, or None to restore the default
+    """
+    global _cache_dir  # pylint: disable=global-statement
+    _cache_dir = os.fspath(path) if path else None
+
+
+def get_cache_dir() -> str:
+    """Return the directory holding the compiled libraries"""
+    if _cache_dir:
+        return _cache_dir
+    path = os.environ.get(_CACHE_DIR_ENV)
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "crcengine", "cc")
+
+
+def find_compiler() -> Optional[str]:
+    """Return the path of the C compiler, which is taken from the ``CC``
+    environment variable or is the first of cc, gcc and clang that is found,
+    or None if there is no compiler"""
+    candidates = [os.environ["CC"]] if os.environ.get("CC") else ["cc", "gcc", "clang"]
+    for candidate in candidates:
+        path = shutil.which(candidate)
+        if path:
+            return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_update_func(poly: int, width: int, reflect: bool) -> Optional[UpdateFunc]:
+    """Return a function updating a calculation register with data using
+    compiled C code, compiling it first if it is not in the cache
+
+    The register is held in the same way as by the table engines, that is
+    bit-reversed when `reflect` is set
+
+    :return: function taking the register and a bytes-like object and
+             returning the new register, or None if the code could not be
+             compiled
+    """
+    compiler = find_compiler()
+    if compiler is None:
+        return None
+    crc_id = f"crc_{'lsb' if reflect else 'msb'}_{width}_{poly:x}"
+    command = [compiler, *_COMPILE_FLAGS]
+    params = {"name": crc_id, "poly": poly, "width": width, "seed": 0, "ref_in": reflect,
+              "ref_out": reflect, "xor_out": 0}
+    try:
+        with tempfile.TemporaryDirectory() as source_dir:
+            codegen.generate_code(params, source_dir, strategy=_STRATEGY)
+            path = os.path.join(get_cache_dir(), f"{crc_id}_{_source_hash(source_dir, command)}"
+                                                 f"{_LIBRARY_SUFFIX}")
+            if not os.path.exists(path):
+                _compile(os.path.join(source_dir, f"{crc_id}.c"), command, path)
+        library = ctypes.CDLL(path)
+    except (OSError, subprocess.CalledProcessError) as excep:
+        warnings.warn(f"Compiling C code for {crc_id} failed, using the table engine: {excep}",
+                      RuntimeWarning)
+        return None
+    register_type = _CTYPES_REGISTERS[codegen._get_datatype_bits(width)]  # pylint: disable=protected-access
+    update = getattr(library, f"{crc_id}_update")
+    update.argtypes = [register_type, ctypes.c_void_p, ctypes.c_size_t]
+    update.restype = register_type
+    return _make_update_func(update)
+
+
+def _make_update_func(c_update) -> UpdateFunc:
+    def update_func(register, data):
+        if isinstance(data, bytes):
+            # bytes are passed as a pointer to their contents
+            return c_update(register, data, len(data))
+        with _BufferPointer(data) as (pointer, length):
+            return c_update(register, pointer, length)
+    return update_func
+
+
+def _compile(source_path: str, command: List[str], path: str) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # Build under a temporary name, so that another process never loads a
+    # partially written library
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=_LIBRARY_SUFFIX)
+    os.close(fd)
+    try:
+        subprocess.run([*command, "-o", temp_path, source_path],
+                       check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _source_hash(source_dir: str, command: List[str]) -> str:
+    """Hash of the generated source files and the compiler command, which
+    determine the compiled library, so that any change in the generated code
+    or compiler produces a new library"""
+    digest = hashlib.sha256(" ".join(command).encode())
+    for name in sorted(os.listdir(source_dir)):
+        digest.update(name.encode())
+        with open(os.path.join(source_dir, name), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+
+class _PyBuffer(ctypes.Structure):
+    """The C ``Py_buffer`` structure"""
+    # pylint: disable=too-few-public-methods
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("strides", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("suboffsets", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+class _BufferPointer:
+    """Context manager giving the address and length of the contents of any
+    object supporting the buffer protocol. Contiguous ones, including
+    read-only ones such as memory mapped files, are not copied"""
+
+    def __init__(self, data):
+        self._data = data
+        self._buffer = _PyBuffer()
+        self._copy = None
+
+    def __enter__(self):
+        if _get_buffer is not None:
+            try:
+                _get_buffer(ctypes.py_object(self._data), ctypes.byref(self._buffer), 0)
+                return self._buffer.buf, self._buffer.len
+            except BufferError:
+                # Not contiguous, so the data has to be copied
+                pass
+        # Also copied when not running on CPython
+        self._copy = memoryview(self._data).tobytes()
+        return self._copy, len(self._copy)
+
+    def __exit__(self, *exc_info):
+        if self._copy is None:
+            _release_buffer(ctypes.byref(self._buffer))
+
+
+try:
+    _get_buffer = ctypes.pythonapi.PyObject_GetBuffer
+    _get_buffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+    _get_buffer.restype = ctypes.c_int
+    _release_buffer = ctypes.pythonapi.PyBuffer_Release
+    _release_buffer.argtypes = [ctypes.POINTER(_PyBuffer)]
+    _release_buffer.restype = None
+except AttributeError:
+    _get_buffer = None  # pylint: disable=invalid-name
@@ -29,30 +29,69 @@ from collections import namedtuple
 
 from jinja2 import Environment, FileSystemLoader
 
-from .algorithms import get_algorithm_params
-from .calc import bit_reverse_n, create_lsb_table, create_msb_table
+from .algorithms import CrcParams, get_algorithm_params, lookup_params
+from .arith import bit_reverse_n, xpow2k_mod
+from .calc import (
+    create_lsb_table,
+    create_msb_table,
+    create_slice_tables,
+    generic_crc,
+    get_nibble_table,
+    table_crc,
+)
 
 # Generated file information
 _GenFile = namedtuple("_GenFile", ["template", "output"])
 
+# Calculation strategies for generated C code, mapped to the number of lookup
+# tables they use
+_C_STRATEGIES = {"table": 1, "slice8": 8, "nibble": 1}
+
 
 def generate_code(
-    crc_name_params, output_dir="out/", language="C", seed_parameter=False, func_name=None
+    crc_name_params, output_dir="out/", language="C", seed_parameter=False, func_name=None,
+    strategy="table"
 ):
-    """Generate code implementing a specific CRC. Currently only language=C is
-    supported"""
+    """Generate code implementing a specific CRC. The supported languages are
+    "C" and "Python".
+
+    For C the `strategy` selects how the calculation is done, "table" uses a
+    single 256 entry table and processes one byte per iteration, "slice8"
+    uses eight 256 entry tables and processes 8 bytes per iteration, which is
+    several times faster on 32 and 64-bit processors at the cost of 8 times
+    the table size. "nibble" uses a 16 entry table and processes 4 bits at a
+    time, for devices where memory is scarce, at about half the speed of
+    "table".
+
+    The Python output is a standalone module with no dependencies, which
+    provides one-shot and incremental (``_init``, ``_update``, ``_final``)
+    functions that process 8 bytes at a time and a ``self_check()`` function
+    comparing against the algorithm's check value"""
     if isinstance(crc_name_params, str):
         # crc_params is an algorithm name, so replace it with the parameters
-        crc_name_params = get_algorithm_params(crc_name_params)
+        crc_name_params = get_algorithm_params(crc_name_params,
+                                               include_check=language == "Python")
 
     env = _get_jinja_environment()
-    template_params = _get_template_params(
-        crc_name_params, output_dir, seed_parameter, func_name, language
-    )
+    if language == "C":
+        template_params = _get_template_params(
+            crc_name_params, output_dir, seed_parameter, func_name, language, strategy
+        )
+    elif language == "Python":
+        template_params = _get_python_template_params(
+            crc_name_params, output_dir, seed_parameter, func_name
+        )
+    else:
+        raise ValueError(f"Unsupported language {language!r}, expected 'C' or 'Python'")
     _generate_output_files(env, template_params)
 
 
-def _get_template_params(crc_params, output_dir, seed_parameter, func_name, language):
+def _get_template_params(crc_params, output_dir, seed_parameter, func_name, language,
+                         strategy="table"):
+    # pylint: disable=too-many-arguments
+    if strategy not in _C_STRATEGIES:
+        raise ValueError(f"Unsupported strategy {strategy!r}, expected one of "
+                         f"{', '.join(_C_STRATEGIES)}")
     datatype_bits = _get_datatype_bits(crc_params["width"])
     crc_id = crc_params["name"].replace("-", "_").replace("/", "_")
     result_mask = (1 << crc_params["width"]) - 1
@@ -70,6 +109,7 @@ def _get_template_params(crc_params, output_dir, seed_parameter, func_name, lang
         "language": language,
         "table_name": f"{crc_id}_table",
         "value_rows": _generate_table_text(crc_params, datatype_bits),
+        "strategy": strategy,
         "output_dir": output_dir,
         "reflect": crc_params["ref_in"],
         "includes": ["#include <stdint.h>"],
@@ -79,6 +119,8 @@ def _get_template_params(crc_params, output_dir, seed_parameter, func_name, lang
         "requires_result_mask": crc_params["width"] != datatype_bits,
         "header_macro": f"{crc_id.upper()}_H",
         "msb_shift": crc_params["width"] - 8,
+        "nibble_shift": crc_params["width"] - 4,
+        "word_lshift": 64 - crc_params["width"],
         "gen_files": [
             _GenFile("c_template", f"{crc_id}.c"),
             _GenFile("h_template", f"{crc_id}.h"),
@@ -100,25 +142,154 @@ def _get_template_params(crc_params, output_dir, seed_parameter, func_name, lang
         template_params["seed"] = f"0x{seed:0x}{lit_sufx}"
     if crc_params["xor_out"]:
         template_params["xor_out"] = f"0x{crc_params['xor_out']:0x}{lit_sufx}"
+    template_params.update(_get_combine_params(crc_params, datatype_bits, lit_sufx))
+    if _C_STRATEGIES[strategy] > 1:
+        template_params["slice_value_rows"] = _generate_table_text(
+            crc_params, datatype_bits, _C_STRATEGIES[strategy], indent_width=8)
+    elif strategy == "nibble":
+        template_params["value_rows"] = _make_text_from_table(
+            get_nibble_table(crc_params["poly"], crc_params["width"], crc_params["ref_in"]),
+            value_width=datatype_bits // 4)
     return template_params
 
 
-def generate_test(name, output_dir):
+def _get_combine_params(crc_params, datatype_bits, lit_sufx):
+    """Template parameters for the initial register and the functions that
+    combine CRCs and append zeros, these work on the calculation register so
+    values are bit-reversed for reflected algorithms"""
+    width = crc_params["width"]
+    reflect = crc_params["ref_in"]
+    poly = crc_params["poly"]
+
+    def to_register(value):
+        return bit_reverse_n(value, width) if reflect else value
+
+    seed_register = to_register(crc_params["seed"])
+    # x^(8 * 2^k), which advances the register over 2^k zero bytes, for every
+    # bit of a 64-bit size_t
+    powers = [to_register(power) for power in xpow2k_mod(poly, width)[3:3 + 64]]
+    combine_params = {
+        "init_register": f"0x{seed_register:x}{lit_sufx}",
+        "top_bit": f"0x{1 << (width - 1):x}{lit_sufx}",
+        "register_poly": f"0x{to_register(poly):x}{lit_sufx}",
+        "power_rows": _make_text_from_table(powers, value_width=datatype_bits // 4,
+                                            indent_width=8),
+    }
+    combine_constant = seed_register ^ crc_params["xor_out"]
+    if combine_constant:
+        combine_params["combine_constant"] = f"0x{combine_constant:x}{lit_sufx}"
+    return combine_params
+
+
+def _get_python_template_params(crc_params, output_dir, seed_parameter, func_name):
+    width = crc_params["width"]
+    crc_id = crc_params["name"].replace("-", "_").replace("/", "_")
+    if "check" in crc_params:
+        check = crc_params["check"]
+    else:
+        check = generic_crc(CrcParams(crc_params["poly"], width, crc_params["seed"],
+                                      crc_params["ref_in"], crc_params["ref_out"],
+                                      crc_params["xor_out"]))(b"123456789")
+    # Widths under 8 bits need only a single table lookup per byte, which is
+    # quicker than slice-by-8
+    narrow = width < 8
+    tables = create_slice_tables(crc_params["poly"], width, crc_params["ref_in"],
+                                 1 if narrow else 8)
+    template_params = {
+        "preamble": "Auto-generated by CrcEngine",
+        "algorithm_name": crc_params["name"],
+        "function_name": func_name or crc_id,
+        "output_dir": output_dir,
+        "polynomial": f"0x{crc_params['poly']:x}",
+        "width": width,
+        "algorithm_seed": f"0x{crc_params['seed']:x}",
+        "reflect": crc_params["ref_in"],
+        "reflect_out": crc_params["ref_out"],
+        "reverse_result": crc_params["ref_in"] != crc_params["ref_out"],
+        "xor_out_value": f"0x{crc_params['xor_out']:x}",
+        "check": f"0x{check:x}",
+        "table_name": f"{crc_id.upper()}_TABLES",
+        "table_rows": [
+            _make_text_from_table(table, value_width=_get_datatype_bits(width) // 4,
+                                  indent_width=8, number_suffix="")
+            for table in tables
+        ],
+        "result_mask": f"0x{(1 << width) - 1:x}",
+        "msb_shift": width - 8,
+        "word_lshift": 64 - width,
+        "narrow": narrow,
+        "gen_files": [_GenFile("py_template", f"{crc_id}.py")],
+    }
+    if not seed_parameter:
+        seed = bit_reverse_n(crc_params["seed"], width) if crc_params["ref_in"] else \
+            crc_params["seed"]
+        template_params["seed"] = f"0x{seed:x}"
+    if crc_params["xor_out"]:
+        template_params["xor_out"] = f"0x{crc_params['xor_out']:x}"
+    return template_params
+
+
+def generate_engine_source(params: CrcParams, table_name="TABLE"):
+    """Generate the source of python functions specialised for calculating the
+    CRC defined by `params`, as used by the "compiled" calculation engine.
+
+    The source defines ``INITIAL_REGISTER`` and the functions
+    ``crc_update(crc, data)``, ``crc_finalize(crc)`` and
+    ``crc_calculate(data)``. The parameters are written into it as constants
+    and operations that have no effect for them are left out. The lookup table
+    is not included, the functions refer to it as the global `table_name`,
+    which must hold the table for ``params.reflect_in`` and the global
+    ``bit_reverse_n`` is used when only one of reflect_in and reflect_out is
+    set
+
+    :param params: CRC parameters
+    :param table_name: name of the global holding the lookup table
+    :return: python source text
+    """
+    width = params.width
+    seed = bit_reverse_n(params.seed, width) if params.reflect_in else params.seed
+    template_params = {
+        "preamble": "# Auto-generated by CrcEngine",
+        "reflect": params.reflect_in,
+        "width": width,
+        "seed": f"0x{seed:x}",
+        "table_name": table_name,
+        "result_mask": f"0x{(1 << width) - 1:x}",
+        "msb_shift": width - 8,
+        "reverse_result": params.reflect_in != params.reflect_out,
+    }
+    if params.xor_out:
+        template_params["xor_out"] = f"0x{params.xor_out:x}"
+    template_file = _get_jinja_environment().get_template("py_engine_template")
+    return template_file.render(template_params)
+
+
+def generate_test(name, output_dir, strategy="table"):
     """Generate a Ceedling C-test wrapper for a given algorithm's generated code
 
+    The test compares the CRC of "123456789" with the algorithm's check value.
+    For strategies that process several bytes at once, it also checks a
+    longer message placed at every alignment within a buffer
+
     :param name: name of algorithm
     :param output_dir: directory into which output should be written
+    :param strategy: calculation strategy the code was generated with
     :return:
     """
     crc_params = get_algorithm_params(name, include_check=True)
     jinja_env = _get_jinja_environment()
-    template_params = _get_template_params(crc_params, output_dir, False, None, "C")
+    template_params = _get_template_params(crc_params, output_dir, False, None, "C", strategy)
     crc_id = crc_params["name"].replace("-", "_")
     template_params["test_name"] = crc_id
     template_params["check_string"] = '"123456789"'
     template_params["crc_function"] = crc_id
     template_params["comparison"] = f"TEST_ASSERT_EQUAL_HEX{template_params['datatype_bits']}"
     template_params["expected_value"] = f"0x{crc_params['check']:x}"
+    if _C_STRATEGIES[strategy] > 1:
+        repeats = 8
+        template_params["check_repeats"] = repeats
+        repeated_crc = table_crc(lookup_params(name))(b"123456789" * repeats)
+        template_params["repeated_expected_value"] = f"0x{repeated_crc:x}"
     _ensure_directory(output_dir)
     template_file = jinja_env.get_template("test_template")
     output_text = template_file.render(template_params)
@@ -163,22 +334,32 @@ def _get_datatype_bits(width):
     return datatype_bits
 
 
-def _generate_table_text(crc_params, datatype_bits):
-    """
+def _generate_table_text(crc_params, datatype_bits, num_slices=None, indent_width=4):
+    """Generate the text of the lookup table, or of `num_slices` slice tables
 
     :param crc_params:
     :param datatype_bits:
-    :return:
+    :param num_slices: number of slice tables, if given the result is a list
+                       with the rows of each table
+    :param indent_width:
+    :return: list of rows of table entry strings
     """
     # only support consistent combinations for now
     assert (
         crc_params["ref_in"] == crc_params["ref_out"]
     ), "Code generation only supported with ref_in==ref_out"
+    if num_slices is not None:
+        tables = create_slice_tables(crc_params["poly"], crc_params["width"],
+                                     crc_params["ref_in"], num_slices)
+        return [_make_text_from_table(table, value_width=datatype_bits // 4,
+                                      indent_width=indent_width)
+                for table in tables]
     if crc_params["ref_in"]:
         table = create_lsb_table(crc_params["poly"], crc_params["width"])
     else:
         table = create_msb_table(crc_params["poly"], crc_params["width"])
-    value_rows = _make_text_from_table(table, value_width=datatype_bits // 4)
+    value_rows = _make_text_from_table(table, value_width=datatype_bits // 4,
+                                       indent_width=indent_width)
     return value_rows
 
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Combination of CRCs calculated separately over consecutive pieces of data
+"""
+# This file is part of CrcEngine, a python library for CRC calculation
+#
+# Copyright 2021 Garden Tools software
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Dict, Iterable, List, Tuple, Union
+
+from .algorithms import CrcParams, lookup_params
+from .arith import bit_reverse_n, multiply_mod, xpow8n_mod
+from .calc import create_from_params
+
+
+def combine(params: Union[str, CrcParams], crc1: int, crc2: int, len2: int) -> int:
+    """Calculate the CRC of the concatenation of two pieces of data A and B
+    from their individual CRCs, in the manner of zlib's ``crc32_combine``.
+    The time taken is proportional to log(len2)
+
+    :param params: CRC parameters or the name of an algorithm
+    :param crc1: CRC of A
+    :param crc2: CRC of B
+    :param len2: length of B in bytes
+    :return: CRC of A followed by B
+    """
+    if len2 < 0:
+        raise ValueError("len2 must be non-negative")
+    if isinstance(params, str):
+        params = lookup_params(params)
+    register1 = _unfinalize(params, crc1)
+    register2 = _unfinalize(params, crc2)
+    # The register after processing A and then B is the register after A
+    # advanced by len2 bytes of zeros, plus the contribution of B itself.
+    # register2 also contains the seed advanced by len2 zero bytes, which
+    # the register after A already accounts for, so it is cancelled here
+    register = _shift(params, register1 ^ params.seed, len2) ^ register2
+    return _finalize(params, register)
+
+
+def append_zeros(params: Union[str, CrcParams], crc: int, num_bytes: int) -> int:
+    """Calculate the CRC of some data followed by `num_bytes` zero bytes from
+    the CRC of the data alone. The time taken is proportional to
+    log(num_bytes)
+
+    :param params: CRC parameters or the name of an algorithm
+    :param crc: CRC of the data
+    :param num_bytes: number of zero bytes to append
+    :return: CRC of the data followed by the zero bytes
+    """
+    if num_bytes < 0:
+        raise ValueError("num_bytes must be non-negative")
+    if isinstance(params, str):
+        params = lookup_params(params)
+    register = _shift(params, _unfinalize(params, crc), num_bytes)
+    return _finalize(params, register)
+
+
+def calculate_variants(algorithms: Iterable[Union[str, CrcParams]], data,
+                       calc_engine="table") -> Dict[Union[str, CrcParams], int]:
+    """Calculate the CRC of `data` for several algorithms, processing the
+    data once for each distinct polynomial, width and input reflection.
+    Algorithms that differ only in their seed, output reflection and xor
+    share one pass, for example the five CCITT variants of crc16 need two
+    passes, one for the reflected variants and one for the others.
+
+    Each pass uses a seed of zero. Since the calculation is linear, the
+    register of each variant is then the register of that pass plus its seed
+    advanced over the length of the data, which takes time proportional to
+    log(len(data))
+
+    :param algorithms: names or parameters of the CRC algorithms
+    :param data: bytes-like object
+    :param calc_engine: calculation engine used for each pass
+    :return: dict of CRC values keyed by the items of `algorithms`
+    """
+    with memoryview(data) as view:
+        num_bytes = view.nbytes
+    results = {}
+    for (poly, width, reflect_in), members in _group_by_polynomial(algorithms).items():
+        # The unreflected register, without an xor, is the CRC result
+        raw_register = create_from_params(CrcParams(poly, width, 0, reflect_in, False, 0),
+                                          calc_engine)(data)
+        seed_shift = xpow8n_mod(poly, width, num_bytes)
+        for algorithm, params in members:
+            register = raw_register ^ multiply_mod(params.seed, seed_shift, poly, width)
+            results[algorithm] = _finalize(params, register)
+    return results
+
+
+def _group_by_polynomial(algorithms: Iterable[Union[str, CrcParams]]) \
+        -> Dict[Tuple[int, int, bool], List[Tuple[Union[str, CrcParams], CrcParams]]]:
+    """Group algorithms by polynomial, width and input reflection
+
+    :return: lists of (algorithm, parameters) keyed by (polynomial, width, reflect_in)
+    """
+    groups: Dict[Tuple[int, int, bool], List[Tuple[Union[str, CrcParams], CrcParams]]] = {}
+    for algorithm in algorithms:
+        params = lookup_params(algorithm) if isinstance(algorithm, str) else algorithm
+        groups.setdefault((params.polynomial, params.width, params.reflect_in), []).append(
+            (algorithm, params))
+    return groups
+
+
+def _unfinalize(params: CrcParams, crc: int) -> int:
+    """Recover the most-significant-bit-first calculation register from a
+    CRC result"""
+    register = crc ^ params.xor_out
+    if params.reflect_out:
+        register = bit_reverse_n(register, params.width)
+    return register
+
+
+def _finalize(params: CrcParams, register: int) -> int:
+    if params.reflect_out:
+        register = bit_reverse_n(register, params.width)
+    return register ^ params.xor_out
+
+
+def _shift(params: CrcParams, register: int, num_bytes: int) -> int:
+    """Advance a most-significant-bit-first calculation register over
+    `num_bytes` zero bytes. This is multiplication by x^(8 * num_bytes)
+    modulo the polynomial"""
+    return multiply_mod(register, xpow8n_mod(params.polynomial, params.width, num_bytes),
+                        params.polynomial, params.width)
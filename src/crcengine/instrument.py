@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+"""
+Optional instrumentation of the calculation engines, recording the number of
+calls, the bytes processed and the time taken for each algorithm and engine.
+
+Instrumentation is enabled with :func:`enable`, after which the engines
+returned by :func:`crcengine.new` and :func:`crcengine.create_from_params` are
+wrapped so that each calculation, and each update of a
+:class:`crcengine.CrcStream` using them, is recorded. Engines obtained before
+instrumentation was enabled are not recorded, and while it is disabled no
+wrapping is done, so the engines run at full speed.
+
+The totals are read with :func:`snapshot`, and functions added with
+:func:`add_callback` are called with the details of each calculation, for
+example to feed a metrics system or a log.
+"""
+# This file is part of CrcEngine, a python library for CRC calculation
+#
+# Copyright 2021 Garden Tools software
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+
+from bisect import bisect_left
+import threading
+from time import perf_counter_ns
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from . import calc
+
+# Upper bounds, inclusive, of the message sizes counted by each element of a
+# size histogram. The last element of a histogram counts the larger messages
+SIZE_BUCKETS = (16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Called with the algorithm, engine, number of bytes and time taken in ns
+Callback = Callable[[str, str, int, int], None]
+
+_lock = threading.Lock()
+_enabled = False  # pylint: disable=invalid-name
+_callbacks: Tuple[Callback, ...] = ()
+# Counters for each (algorithm, engine) pair
+_counters: Dict[Tuple[str, str], "_Counters"] = {}
+
+
+class CallStats(NamedTuple):
+    """Totals recorded for one algorithm and engine"""
+    calls: int
+    bytes: int
+    total_ns: int
+    # Number of calls for each range of message sizes, see SIZE_BUCKETS
+    size_histogram: Tuple[int, ...]
+
+
+class _Counters:
+    """Mutable totals for one algorithm and engine, updated under _lock"""
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.bytes = 0
+        self.total_ns = 0
+        self.size_histogram: List[int] = [0] * (len(SIZE_BUCKETS) + 1)
+
+
+def enable() -> None:
+    """Instrument the engines subsequently returned by :func:`crcengine.new`
+    and :func:`crcengine.create_from_params`"""
+    global _enabled  # pylint: disable=global-statement
+    _enabled = True
+    calc._engine_wrapper = InstrumentedCrc  # pylint: disable=protected-access
+
+
+def disable() -> None:
+    """Stop instrumenting new engines and recording calls of the engines
+    that are already instrumented. The recorded totals are kept"""
+    global _enabled  # pylint: disable=global-statement
+    _enabled = False
+    calc._engine_wrapper = None  # pylint: disable=protected-access
+
+
+def is_enabled() -> bool:
+    """Return True if instrumentation is enabled"""
+    return _enabled
+
+
+def snapshot() -> Dict[Tuple[str, str], CallStats]:
+    """Return the totals recorded so far
+
+    :return: dict of :class:`CallStats` keyed by (algorithm, engine), where
+        the algorithm is the name given to :func:`crcengine.new`, or the
+        parameters for engines from :func:`crcengine.create_from_params`
+    """
+    with _lock:
+        return {
+            key: CallStats(counters.calls, counters.bytes, counters.total_ns,
+                           tuple(counters.size_histogram))
+            for key, counters in _counters.items()
+        }
+
+
+def reset() -> None:
+    """Discard the totals recorded so far"""
+    with _lock:
+        _counters.clear()
+
+
+def add_callback(callback: Callback) -> None:
+    """Add a function to be called after each recorded calculation with the
+    algorithm, the engine, the number of bytes processed and the time taken
+    in nanoseconds. Callbacks are called in the thread doing the calculation
+    and should return quickly"""
+    global _callbacks  # pylint: disable=global-statement
+    with _lock:
+        _callbacks = _callbacks + (callback,)
+
+
+def remove_callback(callback: Callback) -> None:
+    """Remove a function added by :func:`add_callback`"""
+    global _callbacks  # pylint: disable=global-statement
+    with _lock:
+        callbacks = list(_callbacks)
+        callbacks.remove(callback)
+        _callbacks = tuple(callbacks)
+
+
+class InstrumentedCrc(calc._CrcEngine):  # pylint: disable=protected-access
+    """Wrapper recording the calculations of an engine. Attributes other
+    than those of the calculation interface are those of the wrapped engine
+    """
+
+    def __init__(self, engine, calc_engine: str) -> None:
+        """
+        :param engine: engine to instrument
+        :param calc_engine: name of the engine's calculation engine
+        """
+        self._engine = engine
+        self.params = engine.params
+        self.name = engine.name
+        self._key = (engine.name or str(engine.params), calc_engine)
+
+    def calculate(self, data, *args, **kwargs):
+        """Calculate the CRC of data, accepting the same arguments as the
+        wrapped engine's ``calculate()``"""
+        if not _enabled:
+            return self._engine.calculate(data, *args, **kwargs)
+        start = perf_counter_ns()
+        result = self._engine.calculate(data, *args, **kwargs)
+        self._record(data, perf_counter_ns() - start)
+        return result
+
+    def calculate_ranges(self, data, ranges, *args, **kwargs):
+        """Calculate the CRC of several ranges of bits, accepting the same
+        arguments as the wrapped engine's ``calculate_ranges()``. The bytes
+        recorded are those needed to hold the bits of the ranges"""
+        if not _enabled:
+            return self._engine.calculate_ranges(data, ranges, *args, **kwargs)
+        # The ranges are read twice, so they cannot be an iterator
+        ranges = list(ranges)
+        start = perf_counter_ns()
+        result = self._engine.calculate_ranges(data, ranges, *args, **kwargs)
+        elapsed_ns = perf_counter_ns() - start
+        num_bits = sum(window[-1] for window in ranges)
+        self._record_bytes((num_bits + 7) // 8, elapsed_ns)
+        return result
+
+    def _init_register(self):
+        return self._engine._init_register()  # pylint: disable=protected-access
+
+    def _update(self, register, data):
+        if not _enabled:
+            return self._engine._update(register, data)  # pylint: disable=protected-access
+        start = perf_counter_ns()
+        register = self._engine._update(register, data)  # pylint: disable=protected-access
+        self._record(data, perf_counter_ns() - start)
+        return register
+
+    def _finalize(self, register):
+        return self._engine._finalize(register)  # pylint: disable=protected-access
+
+    def __getattr__(self, name):
+        if name == "_engine":
+            # Not yet set, e.g. while unpickling
+            raise AttributeError(name)
+        return getattr(self._engine, name)
+
+    def _record(self, data, elapsed_ns: int) -> None:
+        try:
+            num_bytes = memoryview(data).nbytes
+        except TypeError:
+            # Engines such as "generic" also accept sequences of ints
+            num_bytes = len(data)
+        self._record_bytes(num_bytes, elapsed_ns)
+
+    def _record_bytes(self, num_bytes: int, elapsed_ns: int) -> None:
+        with _lock:
+            counters = _counters.get(self._key)
+            if counters is None:
+                counters = _counters[self._key] = _Counters()
+            counters.calls += 1
+            counters.bytes += num_bytes
+            counters.total_ns += elapsed_ns
+            counters.size_histogram[bisect_left(SIZE_BUCKETS, num_bytes)] += 1
+        for callback in _callbacks:
+            callback(self._key[0], self._key[1], num_bytes, elapsed_ns)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Calculation of the CRC of a single large file or buffer using multiple processes
+"""
+# This file is part of CrcEngine, a python library for CRC calculation
+#
+# Copyright 2021 Garden Tools software
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+from .algorithms import CrcParams, lookup_params
+from .calc import _DEFAULT_ENGINE, create_from_params
+from .combine import combine
+
+# Ranges smaller than this are not worth the cost of a separate process
+_MIN_RANGE_SIZE = 1 << 20
+
+
+def parallel_crc(params: Union[str, CrcParams], source, jobs: Optional[int] = None,
+                 calc_engine=_DEFAULT_ENGINE, min_range_size=_MIN_RANGE_SIZE) -> int:
+    """Calculate the CRC of a file or buffer by splitting it into ranges that
+    are processed by a pool of worker processes, the partial CRCs are then
+    merged with :func:`crcengine.combine`. The result is identical to that of
+    calculating the CRC of the whole data in one go.
+
+    Each worker reads its own range directly from the file (or, for a buffer,
+    from a single shared memory copy), so the data itself is never pickled.
+
+    :param params: CRC parameters or the name of an algorithm
+    :param source: path of the file to process, or a bytes-like object
+    :param jobs: number of worker processes, defaults to the number of CPUs
+    :param calc_engine: back-end calculation engine used by the workers
+    :param min_range_size: smallest number of bytes given to a worker
+    :return: calculated CRC
+    """
+    if isinstance(params, str):
+        params = lookup_params(params)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    is_file = isinstance(source, (str, os.PathLike))
+    size = os.path.getsize(source) if is_file else memoryview(source).nbytes
+    ranges = _split_ranges(size, jobs, min_range_size)
+
+    if len(ranges) <= 1:
+        # Not enough data to make use of any more processes
+        if is_file:
+            return _file_range_crc(params, calc_engine, source, 0, size)
+        return create_from_params(params, calc_engine)(source)
+
+    if is_file:
+        crcs = _map_ranges(jobs, _file_range_crc, params, calc_engine, source, ranges)
+    else:
+        crcs = _buffer_crcs(jobs, params, calc_engine, source, ranges)
+
+    result = crcs[0]
+    for crc, (_, length) in zip(crcs[1:], ranges[1:]):
+        result = combine(params, result, crc, length)
+    return result
+
+
+def _split_ranges(size: int, jobs: int, min_range_size: int) -> List[Tuple[int, int]]:
+    """Divide `size` bytes into at most `jobs` (offset, length) ranges of
+    nearly equal length"""
+    num_ranges = max(1, min(jobs, size // max(min_range_size, 1)))
+    range_size = -(-size // num_ranges) if size else 0
+    return [(offset, min(range_size, size - offset))
+            for offset in range(0, size, range_size or 1)]
+
+
+def _map_ranges(jobs, worker, params, calc_engine, source, ranges):
+    count = len(ranges)
+    with ProcessPoolExecutor(max_workers=min(jobs, count)) as executor:
+        return list(executor.map(worker, [params] * count, [calc_engine] * count,
+                                 [source] * count, *zip(*ranges)))
+
+
+def _buffer_crcs(jobs, params, calc_engine, source, ranges):
+    try:
+        from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        # python 3.7 has no shared memory, so the ranges have to be sent to the
+        # workers
+        view = memoryview(source).cast("B")
+        data_ranges = [bytes(view[offset:offset + length]) for offset, length in ranges]
+        count = len(ranges)
+        with ProcessPoolExecutor(max_workers=min(jobs, count)) as executor:
+            return list(executor.map(_data_crc, [params] * count, [calc_engine] * count,
+                                     data_ranges))
+    size = memoryview(source).nbytes
+    shared = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        shared.buf[:size] = memoryview(source).cast("B")
+        return _map_ranges(jobs, _shared_range_crc, params, calc_engine, shared.name, ranges)
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def _file_range_crc(params, calc_engine, path, offset, length):
+    """Worker calculating the CRC of `length` bytes of a file from `offset`"""
+    crc_stream = create_from_params(params, calc_engine).stream()
+    if length:
+        with open(path, "rb") as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view, \
+                view[offset:offset + length] as piece:
+            crc_stream.update(piece)
+    return crc_stream.crcvalue
+
+
+def _shared_range_crc(params, calc_engine, name, offset, length):
+    """Worker calculating the CRC of a range of a shared memory block"""
+    from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        with shared.buf[offset:offset + length] as piece:
+            return create_from_params(params, calc_engine)(piece)
+    finally:
+        shared.close()
+
+
+def _data_crc(params, calc_engine, data):
+    return create_from_params(params, calc_engine)(data)
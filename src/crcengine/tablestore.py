@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+Storage of precomputed lookup tables.
+
+Tables for the algorithms in the built-in catalogue are shipped with the
+package in the ``tables`` directory and loaded when first used. Tables for
+other parameters can optionally be saved to a cache directory so that later
+processes do not have to calculate them again, this is enabled by
+:func:`set_table_cache_dir` or the ``CRCENGINE_TABLE_CACHE_DIR`` environment
+variable.
+"""
+# This file is part of CrcEngine, a python library for CRC calculation
+#
+# Copyright 2021 Garden Tools software
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import struct
+from typing import Optional, Sequence, Set, Tuple
+
+_CACHE_DIR_ENV = "CRCENGINE_TABLE_CACHE_DIR"
+# Number of slice tables stored for each catalogue polynomial, enough for the
+# slice16 engine
+_CATALOGUE_SLICES = 16
+_TABLE_ENTRIES = 256
+
+_TablesT = Tuple[Tuple[int, ...], ...]
+
+_catalogue_files: Optional[Set[str]] = None  # pylint: disable=invalid-name
+# None means the environment variable has not yet been consulted, "" that
+# caching is disabled
+_cache_dir: Optional[str] = None  # pylint: disable=invalid-name
+
+
+def load_tables(poly: int, width: int, reflect: bool, num_slices: int) -> Optional[_TablesT]:
+    """Load `num_slices` stored lookup tables for a polynomial, looking first
+    in the tables shipped for the catalogue then in the cache directory
+
+    :return: tuple of tables, or None if they have not been stored
+    """
+    filename = _table_filename(poly, width, reflect)
+    if filename in _get_catalogue_files():
+        tables = _read_tables(os.path.join(_catalogue_dir(), filename), width, num_slices)
+        if tables is not None:
+            return tables
+    cache_dir = get_table_cache_dir()
+    if cache_dir:
+        return _read_tables(os.path.join(cache_dir, filename), width, num_slices)
+    return None
+
+
+def save_tables(poly: int, width: int, reflect: bool, tables: Sequence[Sequence[int]]) -> None:
+    """Save calculated tables to the cache directory, if one is enabled and
+    it does not already hold at least as many tables for the polynomial"""
+    cache_dir = get_table_cache_dir()
+    if not cache_dir:
+        return
+    filename = _table_filename(poly, width, reflect)
+    if _read_tables(os.path.join(cache_dir, filename), width, len(tables)) is not None:
+        return
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_tables(os.path.join(cache_dir, filename), width, tables)
+    except OSError:
+        # The cache is only an optimisation, failing to write to it is not an
+        # error for the calculation
+        pass
+
+
+def set_table_cache_dir(path: Optional[str]) -> None:
+    """Set the directory in which lookup tables calculated for parameters
+    outside the built-in catalogue are saved, overriding the
+    ``CRCENGINE_TABLE_CACHE_DIR`` environment variable
+
+    :param path: cache directory, or None to disable the cache
+    """
+    global _cache_dir  # pylint: disable=global-statement
+    _cache_dir = os.fspath(path) if path else ""
+
+
+def get_table_cache_dir() -> Optional[str]:
+    """Return the lookup table cache directory, or None if caching is
+    disabled"""
+    global _cache_dir  # pylint: disable=global-statement
+    if _cache_dir is None:
+        _cache_dir = os.environ.get(_CACHE_DIR_ENV, "")
+    return _cache_dir or None
+
+
+def generate_catalogue_tables(output_dir: Optional[str] = None) -> None:
+    """Calculate and write the tables for every polynomial in the built-in
+    catalogue. This is used to produce the tables shipped with the package
+    when the catalogue changes
+
+    :param output_dir: directory to write to, by default the package's
+                       ``tables`` directory
+    """
+    # calc loads the stored tables, so it is only needed here
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from .algorithms import _ALGORITHMS, CrcParams
+    from .calc import calculate_tables
+
+    output_dir = output_dir or _catalogue_dir()
+    os.makedirs(output_dir, exist_ok=True)
+    for raw_params in _ALGORITHMS.values():
+        params = CrcParams(*raw_params[:6])
+        tables = calculate_tables(params.polynomial, params.width, params.reflect_in,
+                                  _CATALOGUE_SLICES)
+        filename = _table_filename(params.polynomial, params.width, params.reflect_in)
+        _write_tables(os.path.join(output_dir, filename), params.width, tables)
+
+
+def _read_tables(path: str, width: int, num_slices: int) -> Optional[_TablesT]:
+    entry_format = _entry_format(width)
+    num_entries = num_slices * _TABLE_ENTRIES
+    num_bytes = num_entries * struct.calcsize(entry_format)
+    try:
+        with open(path, "rb") as file:
+            data = file.read(num_bytes)
+    except OSError:
+        return None
+    if len(data) != num_bytes:
+        return None
+    values = struct.unpack(f"<{num_entries}{entry_format}", data)
+    return tuple(values[start:start + _TABLE_ENTRIES]
+                 for start in range(0, num_entries, _TABLE_ENTRIES))
+
+
+def _write_tables(path: str, width: int, tables: Sequence[Sequence[int]]) -> None:
+    entry_format = _entry_format(width)
+    data = b"".join(struct.pack(f"<{_TABLE_ENTRIES}{entry_format}", *table) for table in tables)
+    # Write to a temporary file first, so that another process never reads a
+    # partially written file
+    # tempfile is slow to import and only needed when writing
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _table_filename(poly: int, width: int, reflect: bool) -> str:
+    return f"{'lsb' if reflect else 'msb'}_{width}_{poly:x}.bin"
+
+
+def _entry_format(width: int) -> str:
+    return "B" if width <= 8 else "H" if width <= 16 else "I" if width <= 32 else "Q"
+
+
+def _catalogue_dir() -> str:
+    return os.path.join(os.path.dirname(__file__), "tables")
+
+
+def _get_catalogue_files() -> Set[str]:
+    global _catalogue_files  # pylint: disable=global-statement
+    if _catalogue_files is None:
+        try:
+            _catalogue_files = set(os.listdir(_catalogue_dir()))
+        except OSError:
+            _catalogue_files = set()
+    return _catalogue_files
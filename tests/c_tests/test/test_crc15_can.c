@@ -17,4 +17,32 @@ void test_crc15_can(void)
   size_t check_length = strlen(check_string);
   uint16_t result = crc15_can((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX16(0x59e, result);
+}
+
+void test_crc15_can_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint16_t crc = crc15_can_init();
+  crc = crc15_can_update(crc, check_data, 4u);
+  crc = crc15_can_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX16(0x59e, crc15_can_final(crc));
+}
+
+void test_crc15_can_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint16_t crc1 = crc15_can(check_data, 4u);
+  uint16_t crc2 = crc15_can(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX16(0x59e, crc15_can_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc15_can_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint16_t expected = crc15_can(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX16(expected, crc15_can_zeros(0x59e, sizeof buffer - check_length));
 }
\ No newline at end of file
@@ -17,4 +17,32 @@ void test_crc16_autosar(void)
   size_t check_length = strlen(check_string);
   uint16_t result = crc16_autosar((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX16(0x29b1, result);
+}
+
+void test_crc16_autosar_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint16_t crc = crc16_autosar_init();
+  crc = crc16_autosar_update(crc, check_data, 4u);
+  crc = crc16_autosar_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX16(0x29b1, crc16_autosar_final(crc));
+}
+
+void test_crc16_autosar_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint16_t crc1 = crc16_autosar(check_data, 4u);
+  uint16_t crc2 = crc16_autosar(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX16(0x29b1, crc16_autosar_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc16_autosar_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint16_t expected = crc16_autosar(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX16(expected, crc16_autosar_zeros(0x29b1, sizeof buffer - check_length));
 }
\ No newline at end of file
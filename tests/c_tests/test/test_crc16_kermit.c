@@ -17,4 +17,32 @@ void test_crc16_kermit(void)
   size_t check_length = strlen(check_string);
   uint16_t result = crc16_kermit((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX16(0x2189, result);
+}
+
+void test_crc16_kermit_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint16_t crc = crc16_kermit_init();
+  crc = crc16_kermit_update(crc, check_data, 4u);
+  crc = crc16_kermit_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX16(0x2189, crc16_kermit_final(crc));
+}
+
+void test_crc16_kermit_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint16_t crc1 = crc16_kermit(check_data, 4u);
+  uint16_t crc2 = crc16_kermit(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX16(0x2189, crc16_kermit_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc16_kermit_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint16_t expected = crc16_kermit(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX16(expected, crc16_kermit_zeros(0x2189, sizeof buffer - check_length));
 }
\ No newline at end of file
@@ -17,4 +17,32 @@ void test_crc16_xmodem(void)
   size_t check_length = strlen(check_string);
   uint16_t result = crc16_xmodem((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX16(0x31c3, result);
+}
+
+void test_crc16_xmodem_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint16_t crc = crc16_xmodem_init();
+  crc = crc16_xmodem_update(crc, check_data, 4u);
+  crc = crc16_xmodem_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX16(0x31c3, crc16_xmodem_final(crc));
+}
+
+void test_crc16_xmodem_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint16_t crc1 = crc16_xmodem(check_data, 4u);
+  uint16_t crc2 = crc16_xmodem(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX16(0x31c3, crc16_xmodem_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc16_xmodem_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint16_t expected = crc16_xmodem(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX16(expected, crc16_xmodem_zeros(0x31c3, sizeof buffer - check_length));
 }
\ No newline at end of file
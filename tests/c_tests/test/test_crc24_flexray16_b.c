@@ -17,4 +17,32 @@ void test_crc24_flexray16_b(void)
   size_t check_length = strlen(check_string);
   uint32_t result = crc24_flexray16_b((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX32(0x1f23b8, result);
+}
+
+void test_crc24_flexray16_b_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint32_t crc = crc24_flexray16_b_init();
+  crc = crc24_flexray16_b_update(crc, check_data, 4u);
+  crc = crc24_flexray16_b_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX32(0x1f23b8, crc24_flexray16_b_final(crc));
+}
+
+void test_crc24_flexray16_b_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint32_t crc1 = crc24_flexray16_b(check_data, 4u);
+  uint32_t crc2 = crc24_flexray16_b(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX32(0x1f23b8, crc24_flexray16_b_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc24_flexray16_b_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint32_t expected = crc24_flexray16_b(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX32(expected, crc24_flexray16_b_zeros(0x1f23b8, sizeof buffer - check_length));
 }
\ No newline at end of file
@@ -17,4 +17,32 @@ void test_crc32_c(void)
   size_t check_length = strlen(check_string);
   uint32_t result = crc32_c((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX32(0xe3069283, result);
+}
+
+void test_crc32_c_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint32_t crc = crc32_c_init();
+  crc = crc32_c_update(crc, check_data, 4u);
+  crc = crc32_c_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX32(0xe3069283, crc32_c_final(crc));
+}
+
+void test_crc32_c_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint32_t crc1 = crc32_c(check_data, 4u);
+  uint32_t crc2 = crc32_c(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX32(0xe3069283, crc32_c_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc32_c_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint32_t expected = crc32_c(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX32(expected, crc32_c_zeros(0xe3069283, sizeof buffer - check_length));
 }
\ No newline at end of file
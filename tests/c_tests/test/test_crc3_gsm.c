@@ -0,0 +1,48 @@
+#include "unity.h"
+#include <string.h>
+
+#include "crc3_gsm.h"
+
+void setUp(void)
+{
+}
+
+void tearDown(void)
+{
+}
+
+void test_crc3_gsm(void)
+{
+  const char* check_string = "123456789";
+  size_t check_length = strlen(check_string);
+  uint8_t result = crc3_gsm((const uint8_t*)check_string, check_length);
+  TEST_ASSERT_EQUAL_HEX8(0x4, result);
+}
+
+void test_crc3_gsm_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = crc3_gsm_init();
+  crc = crc3_gsm_update(crc, check_data, 4u);
+  crc = crc3_gsm_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x4, crc3_gsm_final(crc));
+}
+
+void test_crc3_gsm_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = crc3_gsm(check_data, 4u);
+  uint8_t crc2 = crc3_gsm(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x4, crc3_gsm_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc3_gsm_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = crc3_gsm(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, crc3_gsm_zeros(0x4, sizeof buffer - check_length));
+}
\ No newline at end of file
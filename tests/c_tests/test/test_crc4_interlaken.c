@@ -0,0 +1,48 @@
+#include "unity.h"
+#include <string.h>
+
+#include "crc4_interlaken.h"
+
+void setUp(void)
+{
+}
+
+void tearDown(void)
+{
+}
+
+void test_crc4_interlaken(void)
+{
+  const char* check_string = "123456789";
+  size_t check_length = strlen(check_string);
+  uint8_t result = crc4_interlaken((const uint8_t*)check_string, check_length);
+  TEST_ASSERT_EQUAL_HEX8(0xb, result);
+}
+
+void test_crc4_interlaken_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = crc4_interlaken_init();
+  crc = crc4_interlaken_update(crc, check_data, 4u);
+  crc = crc4_interlaken_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0xb, crc4_interlaken_final(crc));
+}
+
+void test_crc4_interlaken_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = crc4_interlaken(check_data, 4u);
+  uint8_t crc2 = crc4_interlaken(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0xb, crc4_interlaken_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc4_interlaken_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = crc4_interlaken(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, crc4_interlaken_zeros(0xb, sizeof buffer - check_length));
+}
\ No newline at end of file
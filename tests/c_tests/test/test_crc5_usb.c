@@ -17,4 +17,32 @@ void test_crc5_usb(void)
   size_t check_length = strlen(check_string);
   uint8_t result = crc5_usb((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX8(0x19, result);
+}
+
+void test_crc5_usb_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = crc5_usb_init();
+  crc = crc5_usb_update(crc, check_data, 4u);
+  crc = crc5_usb_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x19, crc5_usb_final(crc));
+}
+
+void test_crc5_usb_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = crc5_usb(check_data, 4u);
+  uint8_t crc2 = crc5_usb(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x19, crc5_usb_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc5_usb_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = crc5_usb(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, crc5_usb_zeros(0x19, sizeof buffer - check_length));
 }
\ No newline at end of file
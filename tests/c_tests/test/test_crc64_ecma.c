@@ -17,4 +17,32 @@ void test_crc64_ecma(void)
   size_t check_length = strlen(check_string);
   uint64_t result = crc64_ecma((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX64(0x6c40df5f0b497347, result);
+}
+
+void test_crc64_ecma_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint64_t crc = crc64_ecma_init();
+  crc = crc64_ecma_update(crc, check_data, 4u);
+  crc = crc64_ecma_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX64(0x6c40df5f0b497347, crc64_ecma_final(crc));
+}
+
+void test_crc64_ecma_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint64_t crc1 = crc64_ecma(check_data, 4u);
+  uint64_t crc2 = crc64_ecma(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX64(0x6c40df5f0b497347, crc64_ecma_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc64_ecma_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint64_t expected = crc64_ecma(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX64(expected, crc64_ecma_zeros(0x6c40df5f0b497347, sizeof buffer - check_length));
 }
\ No newline at end of file
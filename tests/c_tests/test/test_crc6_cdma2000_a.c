@@ -0,0 +1,48 @@
+#include "unity.h"
+#include <string.h>
+
+#include "crc6_cdma2000_a.h"
+
+void setUp(void)
+{
+}
+
+void tearDown(void)
+{
+}
+
+void test_crc6_cdma2000_a(void)
+{
+  const char* check_string = "123456789";
+  size_t check_length = strlen(check_string);
+  uint8_t result = crc6_cdma2000_a((const uint8_t*)check_string, check_length);
+  TEST_ASSERT_EQUAL_HEX8(0xd, result);
+}
+
+void test_crc6_cdma2000_a_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = crc6_cdma2000_a_init();
+  crc = crc6_cdma2000_a_update(crc, check_data, 4u);
+  crc = crc6_cdma2000_a_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0xd, crc6_cdma2000_a_final(crc));
+}
+
+void test_crc6_cdma2000_a_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = crc6_cdma2000_a(check_data, 4u);
+  uint8_t crc2 = crc6_cdma2000_a(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0xd, crc6_cdma2000_a_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc6_cdma2000_a_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = crc6_cdma2000_a(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, crc6_cdma2000_a_zeros(0xd, sizeof buffer - check_length));
+}
\ No newline at end of file
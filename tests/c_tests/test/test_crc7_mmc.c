@@ -0,0 +1,48 @@
+#include "unity.h"
+#include <string.h>
+
+#include "crc7_mmc.h"
+
+void setUp(void)
+{
+}
+
+void tearDown(void)
+{
+}
+
+void test_crc7_mmc(void)
+{
+  const char* check_string = "123456789";
+  size_t check_length = strlen(check_string);
+  uint8_t result = crc7_mmc((const uint8_t*)check_string, check_length);
+  TEST_ASSERT_EQUAL_HEX8(0x75, result);
+}
+
+void test_crc7_mmc_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = crc7_mmc_init();
+  crc = crc7_mmc_update(crc, check_data, 4u);
+  crc = crc7_mmc_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x75, crc7_mmc_final(crc));
+}
+
+void test_crc7_mmc_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = crc7_mmc(check_data, 4u);
+  uint8_t crc2 = crc7_mmc(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x75, crc7_mmc_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc7_mmc_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = crc7_mmc(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, crc7_mmc_zeros(0x75, sizeof buffer - check_length));
+}
\ No newline at end of file
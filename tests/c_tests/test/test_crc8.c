@@ -17,4 +17,32 @@ void test_crc8(void)
   size_t check_length = strlen(check_string);
   uint8_t result = crc8((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX8(0xbc, result);
+}
+
+void test_crc8_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = crc8_init();
+  crc = crc8_update(crc, check_data, 4u);
+  crc = crc8_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0xbc, crc8_final(crc));
+}
+
+void test_crc8_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = crc8(check_data, 4u);
+  uint8_t crc2 = crc8(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0xbc, crc8_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc8_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = crc8(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, crc8_zeros(0xbc, sizeof buffer - check_length));
 }
\ No newline at end of file
@@ -17,4 +17,32 @@ void test_crc8_ccitt(void)
   size_t check_length = strlen(check_string);
   uint8_t result = crc8_ccitt((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX8(0xa1, result);
+}
+
+void test_crc8_ccitt_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = crc8_ccitt_init();
+  crc = crc8_ccitt_update(crc, check_data, 4u);
+  crc = crc8_ccitt_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0xa1, crc8_ccitt_final(crc));
+}
+
+void test_crc8_ccitt_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = crc8_ccitt(check_data, 4u);
+  uint8_t crc2 = crc8_ccitt(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0xa1, crc8_ccitt_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc8_ccitt_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = crc8_ccitt(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, crc8_ccitt_zeros(0xa1, sizeof buffer - check_length));
 }
\ No newline at end of file
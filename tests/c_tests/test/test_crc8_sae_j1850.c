@@ -17,4 +17,32 @@ void test_crc8_sae_j1850(void)
   size_t check_length = strlen(check_string);
   uint8_t result = crc8_sae_j1850((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX8(0x4b, result);
+}
+
+void test_crc8_sae_j1850_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = crc8_sae_j1850_init();
+  crc = crc8_sae_j1850_update(crc, check_data, 4u);
+  crc = crc8_sae_j1850_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x4b, crc8_sae_j1850_final(crc));
+}
+
+void test_crc8_sae_j1850_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = crc8_sae_j1850(check_data, 4u);
+  uint8_t crc2 = crc8_sae_j1850(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x4b, crc8_sae_j1850_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_crc8_sae_j1850_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = crc8_sae_j1850(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, crc8_sae_j1850_zeros(0x4b, sizeof buffer - check_length));
 }
\ No newline at end of file
@@ -17,4 +17,32 @@ void test_myreverse8(void)
   size_t check_length = strlen(check_string);
   uint8_t result = myreverse8((const uint8_t*)check_string, check_length);
   TEST_ASSERT_EQUAL_HEX8(0x80, result);
+}
+
+void test_myreverse8_incremental(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc = myreverse8_init();
+  crc = myreverse8_update(crc, check_data, 4u);
+  crc = myreverse8_update(crc, &check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x80, myreverse8_final(crc));
+}
+
+void test_myreverse8_combine(void)
+{
+  const uint8_t* check_data = (const uint8_t*)"123456789";
+  size_t check_length = strlen("123456789");
+  uint8_t crc1 = myreverse8(check_data, 4u);
+  uint8_t crc2 = myreverse8(&check_data[4], check_length - 4u);
+  TEST_ASSERT_EQUAL_HEX8(0x80, myreverse8_combine(crc1, crc2, check_length - 4u));
+}
+
+void test_myreverse8_zeros(void)
+{
+  uint8_t buffer[16] = {0};
+  size_t check_length = strlen("123456789");
+  memcpy(buffer, "123456789", check_length);
+  uint8_t expected = myreverse8(buffer, sizeof buffer);
+  TEST_ASSERT_EQUAL_HEX8(expected, myreverse8_zeros(0x80, sizeof buffer - check_length));
 }
\ No newline at end of file
@@ -22,3 +22,13 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "needs_ceedling" in item.keywords:
                 item.add_marker(skip_ceedling)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _cc_cache_dir(tmp_path_factory):
+    """Keep the libraries compiled by the "cc" engine out of the user's cache"""
+    from crcengine import cc  # pylint: disable=import-outside-toplevel
+
+    cc.set_cache_dir(str(tmp_path_factory.mktemp("cc_cache")))
+    yield
+    cc.set_cache_dir(None)
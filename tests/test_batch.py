@@ -0,0 +1,66 @@
+"""Unit tests for NumPy batch calculation"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+import crcengine
+from crcengine import CrcParams
+from crcengine.batch import calculate_batch
+
+# pylint: disable=missing-function-docstring,invalid-name
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def messages():
+    rng = np.random.default_rng(12345)
+    return rng.integers(0, 256, (50, 37), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("algorithm_name", crcengine.algorithms_available())
+def test_batch_algorithms(algorithm_name, messages):
+    algorithm = crcengine.new(algorithm_name)
+    result = algorithm.calculate_batch(messages)
+    assert result.shape == (50,)
+    assert [int(crc) for crc in result] == [algorithm(bytes(row)) for row in messages]
+
+
+@pytest.mark.parametrize("params", [
+    CrcParams(0x07, 8, 0x55, True, False, 0x12),
+    CrcParams(0x4599, 15, 0x1234, False, True, 0x7FFF),
+    CrcParams(0x05, 5, 0x03, True, False, 0x01),
+])
+def test_batch_params(params, messages):
+    algorithm = crcengine.generic_crc(params)
+    result = calculate_batch(params, messages)
+    assert [int(crc) for crc in result] == [algorithm(bytes(row)) for row in messages]
+
+
+@pytest.mark.parametrize("algorithm_name, dtype", [
+    ("crc5-usb", "uint8"),
+    ("crc15-can", "uint16"),
+    ("crc24-flexray16-a", "uint32"),
+    ("crc64-ecma", "uint64"),
+])
+def test_batch_dtype(algorithm_name, dtype):
+    result = calculate_batch(algorithm_name, np.frombuffer(b"123456789", np.uint8).reshape(1, 9))
+    assert result.dtype == np.dtype(dtype)
+    assert int(result[0]) == crcengine.get_algorithm_params(algorithm_name, True)["check"]
+
+
+def test_batch_shape():
+    with pytest.raises(ValueError):
+        calculate_batch("crc32", np.zeros(10, dtype=np.uint8))
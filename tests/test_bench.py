@@ -0,0 +1,85 @@
+"""Tests of the engine benchmarks"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import json
+
+import pytest
+
+import crcengine
+from crcengine import bench, calc
+
+# pylint: disable=missing-function-docstring
+
+
+def test_run_benchmarks():
+    reported = []
+    results = bench.run_benchmarks(["crc32", "crc16-xmodem"], ["table", "generic"],
+                                   [4096, 16], min_time=0.001, max_call_time=1e-9,
+                                   report=lambda entry, result: reported.append(result))
+    # The results can be saved as JSON
+    json.dumps(results)
+    assert "python_version" in results["metadata"]
+    entries = results["results"]
+    assert [(entry["algorithm"], entry["engine"]) for entry in entries] == [
+        ("crc32", "table"), ("crc32", "generic"), ("crc16-xmodem", "table"),
+        ("crc16-xmodem", "generic")]
+    assert len(reported) == 4 + 2 * 4
+    for entry in entries:
+        assert entry["create_ns"] > 0
+        small, large = entry["sizes"]
+        assert small["size"] == 16
+        assert small["mb_per_s"] == pytest.approx(16 / small["ns_per_call"] * 1e3)
+        # The larger size is estimated to exceed max_call_time
+        assert large == {"size": 4096, "skipped": True}
+    assert len(bench.format_results(results)) == 1 + 4 + 2 * 4
+
+
+def test_run_benchmarks_keeps_caches():
+    crcengine.clear_caches()
+    engine = crcengine.new("crc32")
+    get_table = calc.get_table
+    bench.run_benchmarks(["crc32", "crc16-xmodem"], ["table"], [16], min_time=0.001)
+    # The caller's cached entries are still there, and the creation of the
+    # benchmarked engines did not add to them
+    assert calc.get_table is get_table
+    assert calc.cache_info()["tables"].currsize == 1
+    assert crcengine.new("crc32") is engine
+
+
+def test_run_benchmarks_skipped_data(monkeypatch):
+    made = []
+    make_data = bench._make_data  # pylint: disable=protected-access
+    monkeypatch.setattr(bench, "_make_data",
+                        lambda pattern, size: made.append(size) or make_data(pattern, size))
+    results = bench.run_benchmarks(["crc32"], ["table", "generic"], [16, 1 << 30],
+                                   min_time=0.001, max_call_time=1e-9)
+    # The data for a size that every engine skips is never made
+    assert made == [16]
+    for entry in results["results"]:
+        assert entry["sizes"][1] == {"size": 1 << 30, "skipped": True}
+
+
+@pytest.mark.parametrize("text, size", [("16", 16), ("4K", 4096), ("1mb", 1 << 20),
+                                        ("2G", 2 << 30)])
+def test_parse_size(text, size):
+    assert bench.parse_size(text) == size
+    assert bench.parse_size(bench.format_size(size)) == size
+
+
+def test_parse_size_invalid():
+    with pytest.raises(ValueError):
+        bench.parse_size("0")
+    with pytest.raises(ValueError):
+        bench.parse_size("1T")
@@ -0,0 +1,127 @@
+"""Tests of the "cc" engine, which compiles generated C code"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import mmap
+import os
+
+import pytest
+
+import crcengine
+from crcengine import CrcParams, cc, lookup_params
+from crcengine.calc import _NativeCrc
+
+# pylint: disable=missing-function-docstring,redefined-outer-name,protected-access
+
+needs_compiler = pytest.mark.skipif(cc.find_compiler() is None, reason="no C compiler available")
+
+DATA = bytes(range(256)) * 5 + b"123"
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    path = tmp_path_factory.mktemp("cc")
+    previous = cc.get_cache_dir()
+    cc.set_cache_dir(str(path))
+    cc.get_update_func.cache_clear()
+    crcengine.clear_caches()
+    yield path
+    cc.set_cache_dir(previous)
+    cc.get_update_func.cache_clear()
+    crcengine.clear_caches()
+
+
+@needs_compiler
+@pytest.mark.parametrize("params", [
+    *(lookup_params(name) for name in crcengine.algorithms_available()),
+    CrcParams(0x1021, 16, 0x1D0F, True, False, 0xFFFF),
+    CrcParams(0x1021, 16, 0x1D0F, False, True, 0),
+])
+def test_cc_engine(cache_dir, params):
+    engine = crcengine.create_from_params(params, "cc")
+    assert isinstance(engine, _NativeCrc)
+    expected = crcengine.generic_crc(params)(DATA)
+    assert engine(DATA) == expected
+    assert engine(bytearray(DATA)) == expected
+    assert engine(memoryview(DATA)[5:]) == crcengine.generic_crc(params)(DATA[5:])
+    crc_stream = engine.stream(DATA[:3])
+    crc_stream.update(DATA[3:])
+    assert crc_stream.crcvalue == expected
+    assert os.listdir(str(cache_dir))
+
+
+@needs_compiler
+@pytest.mark.usefixtures("cache_dir")
+def test_cc_engine_read_only_buffer(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    engine = crcengine.new("crc32", "cc")
+    with open(str(path), "rb") as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert engine(mapped) == crcengine.new("crc32")(DATA)
+
+
+@needs_compiler
+@pytest.mark.usefixtures("cache_dir")
+def test_cc_engine_strided_buffer():
+    engine = crcengine.new("crc32", "cc")
+    # Buffers that are not contiguous are copied
+    assert engine(memoryview(DATA)[::2]) == crcengine.new("crc32")(DATA[::2])
+    crc_stream = engine.stream(memoryview(DATA)[::-3])
+    assert crc_stream.crcvalue == crcengine.new("crc32")(DATA[::-3])
+
+
+@needs_compiler
+def test_cc_engine_cached_library(cache_dir):
+    crcengine.new("crc16-xmodem", "cc")
+    libraries = set(os.listdir(str(cache_dir)))
+    # Variants of the same polynomial share the library
+    crcengine.new("crc16-ccitt-false", "cc")
+    cc.get_update_func.cache_clear()
+    crcengine.clear_caches()
+    assert crcengine.new("crc16-xmodem", "cc")(b"123456789") == 0x31C3
+    assert set(os.listdir(str(cache_dir))) == libraries
+
+
+@needs_compiler
+def test_cc_engine_library_follows_source(cache_dir, monkeypatch):
+    crcengine.new("crc16-xmodem", "cc")
+    libraries = set(os.listdir(str(cache_dir)))
+    # A change in the generated code, e.g. from a change to codegen, builds a
+    # new library rather than loading the old one
+    generate_code = cc.codegen.generate_code
+
+    def generate_changed_code(params, output_dir, **kwargs):
+        generate_code(params, output_dir, **kwargs)
+        with open(os.path.join(output_dir, f"{params['name']}.c"), "a", encoding="utf-8") as file:
+            file.write("/* changed */\n")
+
+    monkeypatch.setattr(cc.codegen, "generate_code", generate_changed_code)
+    cc.get_update_func.cache_clear()
+    crcengine.clear_caches()
+    assert crcengine.new("crc16-xmodem", "cc")(b"123456789") == 0x31C3
+    assert len(set(os.listdir(str(cache_dir))) - libraries) == 1
+    cc.get_update_func.cache_clear()
+    crcengine.clear_caches()
+
+
+def test_cc_engine_fallback(monkeypatch):
+    monkeypatch.setattr(cc, "find_compiler", lambda: None)
+    cc.get_update_func.cache_clear()
+    crcengine.clear_caches()
+    engine = crcengine.new("crc32", "cc")
+    assert not isinstance(engine, _NativeCrc)
+    assert engine(b"123456789") == 0xCBF43926
+    cc.get_update_func.cache_clear()
+    crcengine.clear_caches()
@@ -0,0 +1,96 @@
+"""Tests compiling the generated C code, these are skipped if there is no C
+compiler. The full set of generated code is tested with Ceedling by
+test_code_gen.py"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import shutil
+import subprocess
+
+import pytest
+
+import crcengine
+
+# pylint: disable=missing-function-docstring
+
+CC = shutil.which("gcc") or shutil.which("cc")
+
+pytestmark = pytest.mark.skipif(CC is None, reason="no C compiler available")
+
+ALGORITHMS = list(crcengine.algorithms_available())
+DATA = bytes((i * 37 + 11) & 0xFF for i in range(300))
+# Lengths covering every combination of unaligned head and partial tail
+LENGTHS = [*range(40), 100, 299, 300]
+OFFSETS = range(8)
+
+
+def _build(tmp_path, strategy, body):
+    """Generate code for every algorithm and compile it into a program that
+    reads DATA from stdin and runs `body` for each algorithm, with CRC
+    replaced by the algorithm's function name"""
+    crc_ids = [name.replace("-", "_") for name in ALGORITHMS]
+    for name in ALGORITHMS:
+        crcengine.generate_code(name, str(tmp_path), strategy=strategy)
+    main = (
+        "#include <stdio.h>\n#include <stdint.h>\n#include <string.h>\n"
+        + "".join(f'#include "{crc_id}.h"\n' for crc_id in crc_ids)
+        + "#define PRINT(x) printf(\"%llx\\n\", (unsigned long long)(x))\n"
+        + "int main(void)\n{\n"
+        + f"    static uint8_t src[{len(DATA)}];\n"
+        + "    if (fread(src, 1, sizeof src, stdin) != sizeof src) return 1;\n"
+        + "".join("    {" + body.replace("CRC", crc_id) + "    }\n" for crc_id in crc_ids)
+        + "    return 0;\n}\n"
+    )
+    (tmp_path / "main.c").write_text(main)
+    executable = str(tmp_path / "crc_test")
+    subprocess.run([CC, "-std=c99", "-O2", "-Wall", "-Wextra", "-Werror", "-o", executable,
+                    "main.c", *(f"{crc_id}.c" for crc_id in crc_ids)],
+                   cwd=str(tmp_path), check=True)
+    output = subprocess.run([executable], input=DATA, stdout=subprocess.PIPE,
+                            check=True).stdout.split()
+    return [int(value, 16) for value in output]
+
+
+@pytest.mark.parametrize("strategy", ["table", "slice8", "nibble"])
+def test_c_code(tmp_path, strategy):
+    lengths = ", ".join(str(length) for length in LENGTHS)
+    body = f"""
+    static const size_t lengths[] = {{{lengths}}};
+    static uint8_t buf[{len(DATA) + 8}];
+    /* The CRC of each length of DATA placed at each offset of a buffer */
+    for (size_t off = 0; off < 8; off++)
+    for (size_t i = 0; i < sizeof lengths / sizeof lengths[0]; i++) {{
+        memcpy(buf + off, src, lengths[i]);
+        PRINT(CRC(buf + off, lengths[i]));
+    }}
+    /* Incremental calculation, combination and appending zeros */
+    PRINT(CRC_final(CRC_update(CRC_update(CRC_init(), src, 5), src + 5, 295)));
+    PRINT(CRC_combine(CRC(src, 100), CRC(src + 100, 200), 200));
+    PRINT(CRC_combine(CRC(src, 300), CRC(src, 0), 0));
+    PRINT(CRC_zeros(CRC(src, 100), 1000));
+    PRINT(CRC_zeros(CRC(src, 100), 0));
+"""
+    results = _build(tmp_path, strategy, body)
+    expected = []
+    for name in ALGORITHMS:
+        crc = crcengine.new(name)
+        expected += [crc(DATA[:length]) for _ in OFFSETS for length in LENGTHS]
+        expected += [crc(DATA), crc(DATA), crc(DATA), crc(DATA[:100] + bytes(1000)),
+                     crc(DATA[:100])]
+    assert results == expected
+
+
+def test_c_strategy_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        crcengine.generate_code("crc32", str(tmp_path), strategy="slice4")
@@ -0,0 +1,67 @@
+"""Tests of the generated python code"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import importlib.util
+
+import pytest
+
+import crcengine
+from crcengine import CrcParams
+
+# pylint: disable=missing-function-docstring
+
+
+def _import_generated(path):
+    spec = importlib.util.spec_from_file_location(path.stem, str(path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("algorithm", crcengine.algorithms_available())
+def test_python_code_gen(tmp_path, algorithm):
+    crcengine.codegen.generate_code(algorithm, str(tmp_path), language="Python")
+    crc_id = algorithm.replace("-", "_")
+    module = _import_generated(tmp_path / f"{crc_id}.py")
+    assert module.self_check()
+    data = bytes(range(256)) * 2 + b"12345"
+    expected = crcengine.new(algorithm)(data)
+    assert getattr(module, crc_id)(data) == expected
+    assert getattr(module, crc_id)(memoryview(bytearray(data))) == expected
+    # Widths under 8 bits are processed a byte at a time rather than by slice-by-8
+    assert hasattr(module, "_update_slice8") == (crcengine.lookup_params(algorithm).width >= 8)
+    # incremental calculation, splitting the data within a word
+    update = getattr(module, f"{crc_id}_update")
+    register = update(getattr(module, f"{crc_id}_init")(), data[:13])
+    register = update(register, data[13:])
+    assert getattr(module, f"{crc_id}_final")(register) == expected
+
+
+def test_python_code_gen_options(tmp_path):
+    params = CrcParams(0x1021, 16, 0x1D0F, True, False, 0x55)
+    algorithm = crcengine.get_algorithm_params("crc16-kermit")
+    algorithm.update(seed=params.seed, ref_out=params.reflect_out, xor_out=params.xor_out)
+    crcengine.codegen.generate_code(algorithm, str(tmp_path), language="Python",
+                                    seed_parameter=True, func_name="my_crc")
+    module = _import_generated(tmp_path / "crc16_kermit.py")
+    assert module.self_check()
+    data = bytes(range(100))
+    assert module.my_crc(data, 0x1D0F) == crcengine.generic_crc(params)(data)
+    assert module.my_crc(data, 0) == crcengine.generic_crc(params._replace(seed=0))(data)
+
+
+def test_code_gen_language(tmp_path):
+    with pytest.raises(ValueError):
+        crcengine.codegen.generate_code("crc32", str(tmp_path), language="Rust")
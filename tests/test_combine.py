@@ -0,0 +1,86 @@
+"""Unit tests for the combine module"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import zlib
+
+import pytest
+
+import crcengine
+from crcengine import CrcParams
+
+# pylint: disable=missing-function-docstring
+
+_DATA = bytes(range(256)) * 3 + b"123456789"
+
+
+@pytest.mark.parametrize("algorithm_name", crcengine.algorithms_available())
+def test_combine_algorithms(algorithm_name):
+    algorithm = crcengine.new(algorithm_name)
+    expected = algorithm(_DATA)
+    for split in (0, 1, 8, 100, len(_DATA) - 1, len(_DATA)):
+        crc1 = algorithm(_DATA[:split])
+        crc2 = algorithm(_DATA[split:])
+        assert crcengine.combine(algorithm_name, crc1, crc2, len(_DATA) - split) == expected
+
+
+@pytest.mark.parametrize("params", [
+    # reflect_in != reflect_out, with a seed and xor_out
+    CrcParams(0x07, 8, 0x55, True, False, 0x12),
+    CrcParams(0x4599, 15, 0x1234, False, True, 0x7FFF),
+    # sub-byte widths
+    CrcParams(0x03, 3, 0x5, False, True, 0x2),
+    CrcParams(0x01, 1, 1, False, False, 1),
+])
+def test_combine_params(params):
+    algorithm = crcengine.generic_crc(params)
+    expected = algorithm(_DATA)
+    for split in (0, 5, 300):
+        crc1 = algorithm(_DATA[:split])
+        crc2 = algorithm(_DATA[split:])
+        assert crcengine.combine(params, crc1, crc2, len(_DATA) - split) == expected
+
+
+def test_combine_zlib():
+    crc1 = zlib.crc32(_DATA[:123])
+    crc2 = zlib.crc32(_DATA[123:])
+    assert crcengine.combine("crc32", crc1, crc2, len(_DATA) - 123) == zlib.crc32(_DATA)
+
+
+@pytest.mark.parametrize("algorithm_name", ["crc8-autosar", "crc24-flexray16-a", "crc32",
+                                            "crc64-ecma"])
+def test_append_zeros(algorithm_name):
+    algorithm = crcengine.new(algorithm_name)
+    for num_bytes in (0, 1, 1000):
+        assert (crcengine.append_zeros(algorithm_name, algorithm(_DATA), num_bytes)
+                == algorithm(_DATA + bytes(num_bytes)))
+
+
+def test_negative_length():
+    with pytest.raises(ValueError, match="len2 must be non-negative"):
+        crcengine.combine("crc32", 0, 0, -1)
+    with pytest.raises(ValueError, match="num_bytes must be non-negative"):
+        crcengine.append_zeros("crc32", 0, -1)
+
+
+@pytest.mark.parametrize("engine", ["table", "cc"])
+@pytest.mark.parametrize("data", [b"", _DATA])
+def test_calculate_variants(engine, data):
+    names = list(crcengine.algorithms_available())
+    params = CrcParams(0x1021, 16, 0x1D0F, True, False, 0x00FF)
+    results = crcengine.calculate_variants(names + [params], data, engine)
+    assert results == {
+        **{name: crcengine.new(name)(data) for name in names},
+        params: crcengine.create_from_params(params)(data),
+    }
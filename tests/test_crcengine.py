@@ -163,6 +163,18 @@ def test_tables_crosscheck():
         assert val1 == val2, "Mismatch for entry {}".format(n)
 
 
+@pytest.mark.parametrize("width, poly", [(1, 0x1), (3, 0x3), (5, 0x9), (7, 0x09)])
+def test_narrow_msb_table(width, poly):
+    """Entries of MSB-first tables for widths under 8 bits are the CRC of the
+    byte with a zero seed, held in the low bits"""
+    table = crcengine.create_msb_table(poly, width)
+    generic = crcengine.generic_crc(CrcParams(poly, width, 0, False, False, 0))
+    assert table == [generic(bytes([value])) for value in range(256)]
+    # The table engine is used rather than falling back to the generic one
+    table_alg = crcengine.create_from_params(CrcParams(poly, width, 0, False, False, 0))
+    assert isinstance(table_alg, crcengine.calc._CrcMsbfTable)  # pylint: disable=protected-access
+
+
 def test_crc16_kermit(crc16_kermit):
     assert crc16_kermit(b"123456789") == 0x2189
     # confirm that this does behave as a CRC should this is an LSB-first CRC
@@ -320,6 +332,12 @@ def test_bug_325_3():
 def test_available_engines():
     engines = available_calculation_engines()
     assert "table" in engines
+    assert "slice8" in engines
+    assert "slice16" in engines
+    assert "nibble" in engines
+    assert "native" in engines
+    assert "compiled" in engines
+    assert "cc" in engines
     assert "generic" in engines
     assert "generic_msbf" in engines
     assert "generic_lsbf" in engines
@@ -327,4 +345,146 @@ def test_available_engines():
 
     params = lookup_params("crc16-xmodem")
     for engine in engines:
-        create_from_params(params, engine)
\ No newline at end of file
+        create_from_params(params, engine)
+
+
+@pytest.mark.parametrize("engine", ["slice8", "slice16"])
+@pytest.mark.parametrize("algorithm_name", crcengine.algorithms_available())
+def test_slice_engines(algorithm_name, engine):
+    """The slice-by-N engines must agree with the table engine for every length
+    of trailing partial word"""
+    data = bytes(range(256)) * 2
+    table_alg = crcengine.new(algorithm_name)
+    slice_alg = crcengine.new(algorithm_name, engine)
+    for length in range(0, 50):
+        assert slice_alg(data[:length]) == table_alg(data[:length])
+    assert slice_alg(data) == table_alg(data)
+
+
+@pytest.mark.parametrize("engine", ["slice8", "slice16"])
+def test_slice_engines_narrow(engine, monkeypatch):
+    """MSB-first widths under 8 bits are processed a byte at a time, which is
+    quicker than slicing"""
+    slice_alg = crcengine.new("crc7-mmc", engine)
+    assert isinstance(slice_alg, crcengine.calc._CrcMsbfSlice)  # pylint: disable=protected-access
+
+    def update_words(crc, view):
+        raise AssertionError("sliced update used for a narrow width")
+
+    monkeypatch.setattr(slice_alg, "_update_words", update_words)
+    data = bytes(range(256)) * 2
+    assert slice_alg(data) == crcengine.new("crc7-mmc")(data)
+    assert slice_alg(b"123456789") == 0x75
+
+
+def test_slice_tables():
+    tables = crcengine.calc.create_slice_tables(_CRC32_POLY, 32, True, 8)
+    assert len(tables) == 8
+    assert tables[0] == crcengine.create_lsb_table(_CRC32_POLY, 32)
+    # Standard slice-by-8 values for CRC32
+    assert tables[1][1] == 0x191B3141
+    assert tables[7][1] == 0xCCAA009E
+
+
+@pytest.mark.parametrize("params", [
+    *(lookup_params(name) for name in crcengine.algorithms_available()),
+    CrcParams(0x1021, 16, 0x1D0F, True, False, 0xFFFF),
+    CrcParams(0x1021, 16, 0x1D0F, False, True, 0),
+    CrcParams(0x3, 3, 0x0, False, False, 0x7),
+    CrcParams(0x3, 4, 0xF, False, False, 0xF),
+    CrcParams(0x3, 4, 0x0, True, True, 0x0),
+])
+def test_nibble_engine(params):
+    data = bytes(range(256)) * 2
+    nibble = crcengine.create_from_params(params, "nibble")
+    generic = crcengine.generic_crc(params)
+    for length in range(0, 10):
+        assert nibble(data[:length]) == generic(data[:length])
+    assert nibble(data) == generic(data)
+
+
+def test_nibble_table():
+    table = crcengine.calc.get_nibble_table(_CRC32_POLY, 32, True)
+    assert len(table) == 16
+    # The reflected table is every 16th entry of the 256 entry table
+    assert table == tuple(crcengine.create_lsb_table(_CRC32_POLY, 32)[::16])
+    assert table[1] == 0x1DB71064
+    # The MSB-first table is the first 16 entries
+    assert crcengine.calc.get_nibble_table(0x1021, 16, False) == \
+        tuple(crcengine.create_msb_table(0x1021, 16)[:16])
+
+
+@pytest.mark.parametrize("params", [
+    lookup_params("crc32"),
+    lookup_params("crc16-xmodem"),
+    lookup_params("crc16-autosar"),
+    # Seed, xor_out and output reflection variants of the native polynomials
+    CrcParams(_CRC32_POLY, 32, 0x12345678, True, False, 0x55),
+    CrcParams(0x1021, 16, 0x1D0F, False, True, 0xFFFF),
+])
+def test_native_engine(params):
+    data = bytes(range(256)) * 3
+    native = crcengine.create_from_params(params, "native")
+    assert isinstance(native, crcengine.calc._NativeCrc)  # pylint: disable=protected-access
+    assert native(data) == crcengine.generic_crc(params)(data)
+
+
+def test_native_engine_fallback():
+    native = crcengine.new("crc32-c", "native")
+    assert native(b"123456789") == 0xE3069283
+    assert not isinstance(native, crcengine.calc._NativeCrc)  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize("params", [
+    *(lookup_params(name) for name in crcengine.algorithms_available()),
+    CrcParams(0x1021, 16, 0x1D0F, True, False, 0xFFFF),
+    CrcParams(0x1021, 16, 0x1D0F, False, True, 0),
+    CrcParams(0x3, 4, 0xF, False, False, 0xF),
+])
+def test_compiled_engine(params):
+    data = bytes(range(256)) * 3
+    compiled = crcengine.create_from_params(params, "compiled")
+    assert compiled(data) == crcengine.generic_crc(params)(data)
+    crc_stream = compiled.stream(data[:100])
+    crc_stream.update(data[100:])
+    assert crc_stream.crcvalue == compiled(data)
+
+
+def test_compiled_engine_cache():
+    crcengine.clear_caches()
+    params = lookup_params("crc32")
+    crcengine.create_from_params(params, "compiled")
+    crcengine.new("crc32", "compiled")
+    info = crcengine.cache_info()["compiled"]
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_engine_cache():
+    crcengine.clear_caches()
+    first = crcengine.new("crc32-c")
+    assert crcengine.new("crc32-c") is first
+    info = crcengine.cache_info()
+    assert info["engines"].hits == 1
+    assert info["tables"].misses == 1
+    # Algorithms sharing parameters keep their own names
+    assert crcengine.new("crc16-kermit").name == "crc16-kermit"
+    assert crcengine.new("crc16-ccitt-true").name == "crc16-ccitt-true"
+    # Tables are shared between engines
+    crcengine.new("crc32-c", "generic")
+    crcengine.create_from_params(lookup_params("crc32-c"))
+    assert crcengine.cache_info()["tables"].misses == 2
+    table = crcengine.create_lsb_table(0x1EDC6F41, 32)
+    table[1] = 0
+    assert crcengine.create_lsb_table(0x1EDC6F41, 32)[1] != 0
+
+
+def test_engine_cache_registration():
+    crcengine.register_algorithm_params("mycrc8", CrcParams(0x07, 8, 0, False, False, 0))
+    assert crcengine.new("mycrc8")(b"123456789") == 0xF4
+    crcengine.register_algorithm_params("mycrc8", CrcParams(0x07, 8, 0, False, False, 0x55))
+    assert crcengine.cache_info()["engines"].currsize == 0
+    assert crcengine.new("mycrc8")(b"123456789") == 0xA1
+    crcengine.unregister_algorithm("mycrc8")
+    with pytest.raises(crcengine.AlgorithmNotFoundError):
+        crcengine.new("mycrc8")
@@ -0,0 +1,66 @@
+"""Tests that importing the package stays lightweight"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import subprocess
+import sys
+
+import pytest
+
+import crcengine
+
+# pylint: disable=missing-function-docstring
+
+# Modules that must not be loaded by "import crcengine" alone
+DEFERRED_MODULES = [
+    "jinja2",
+    "crcengine.codegen",
+    "crcengine.parallel",
+    "concurrent.futures",
+    "importlib.metadata",
+    "importlib_metadata",
+    "tempfile",
+]
+
+
+def _modules_after(statement):
+    """Names of the modules loaded by a fresh interpreter after executing
+    `statement`"""
+    output = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint(' '.join(sys.modules))"],
+        check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy():
+    loaded = _modules_after("import crcengine")
+    assert "crcengine.calc" in loaded
+    assert loaded.isdisjoint(DEFERRED_MODULES)
+
+
+def test_calculation_is_lazy():
+    loaded = _modules_after("import crcengine\ncrcengine.new('crc32')(b'123456789')")
+    assert loaded.isdisjoint(DEFERRED_MODULES)
+
+
+@pytest.mark.parametrize("name", ["codegen", "generate_code", "generate_test", "parallel_crc",
+                                  "__version__"])
+def test_lazy_attributes(name):
+    assert getattr(crcengine, name) is not None
+    assert name in dir(crcengine)
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        crcengine.not_an_attribute  # pylint: disable=pointless-statement,no-member
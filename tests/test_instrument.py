@@ -0,0 +1,108 @@
+"""Tests of the instrumentation of the calculation engines"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+import crcengine
+from crcengine import instrument
+
+# pylint: disable=missing-function-docstring
+
+
+@pytest.fixture(autouse=True)
+def _instrumentation():
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled():
+    assert not instrument.is_enabled()
+    crc32 = crcengine.new("crc32")
+    assert not isinstance(crc32, instrument.InstrumentedCrc)
+    crc32(b"123456789")
+    assert instrument.snapshot() == {}
+
+
+@pytest.mark.parametrize("engine", ["table", "cc", "generic", "windowed"])
+def test_counters(engine):
+    expected = crcengine.new("crc16-xmodem")(bytes(5000))
+    instrument.enable()
+    crc16 = crcengine.new("crc16-xmodem", engine)
+    assert crc16(b"123456789") == 0x31C3
+    assert crc16.calculate(bytes(5000)) == expected
+    params = crcengine.lookup_params("crc32")
+    assert crcengine.create_from_params(params, engine)(b"123456789") == 0xCBF43926
+    stats = instrument.snapshot()
+    assert set(stats) == {("crc16-xmodem", engine), (str(params), engine)}
+    crc16_stats = stats[("crc16-xmodem", engine)]
+    assert crc16_stats.calls == 2
+    assert crc16_stats.bytes == 5009
+    assert crc16_stats.total_ns > 0
+    # 9 bytes are counted up to 16, 5000 up to 16384
+    assert crc16_stats.size_histogram == (1, 0, 0, 0, 0, 1, 0, 0, 0, 0)
+
+
+def test_calculate_ranges():
+    frame = b"12\xff3456789"
+    expected = crcengine.new("crc16-xmodem", "windowed").calculate(frame, 4, 12)
+    instrument.enable()
+    windowed = crcengine.new("crc16-xmodem", "windowed")
+    assert isinstance(windowed, instrument.InstrumentedCrc)
+    assert windowed.calculate_ranges(frame, iter([(0, 16), (24, 56)])) == 0x31C3
+    assert windowed.calculate_ranges(None, [(frame, 4, 12)]) == expected
+    stats = instrument.snapshot()[("crc16-xmodem", "windowed")]
+    # The bytes holding the bits of the ranges, 9 and then 2 for 12 bits
+    assert (stats.calls, stats.bytes) == (2, 11)
+
+
+def test_stream():
+    instrument.enable()
+    crc_stream = crcengine.stream("crc32")
+    crc_stream.update(b"1234")
+    crc_stream.update(memoryview(b"56789"))
+    assert crc_stream.crcvalue == 0xCBF43926
+    assert crc_stream.name == "crc32"
+    stats = instrument.snapshot()[("crc32", "table")]
+    assert (stats.calls, stats.bytes) == (2, 9)
+
+
+def test_callbacks():
+    calls = []
+
+    def callback(*args):
+        calls.append(args)
+
+    instrument.enable()
+    instrument.add_callback(callback)
+    try:
+        crc32 = crcengine.new("crc32")
+        crc32(b"123456789")
+    finally:
+        instrument.remove_callback(callback)
+    crc32(b"1234")
+    assert len(calls) == 1
+    assert calls[0][:3] == ("crc32", "table", 9)
+    assert calls[0][3] >= 0
+
+
+def test_disable():
+    instrument.enable()
+    crc32 = crcengine.new("crc32")
+    instrument.disable()
+    crc32(b"123456789")
+    assert not isinstance(crcengine.new("crc32"), instrument.InstrumentedCrc)
+    assert instrument.snapshot() == {}
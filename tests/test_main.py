@@ -0,0 +1,158 @@
+"""Tests of the command line interface"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import io
+import json
+import sys
+
+import pytest
+
+import crcengine
+from crcengine import __main__ as cli
+
+# pylint: disable=missing-function-docstring
+
+# Not valid UTF-8, so this would be corrupted by reading it as text
+DATA = bytes(range(256)) * 40 + b"\xff\xfe"
+
+
+def _run(*args):
+    return cli.process_cmdline(cli.make_arg_parser(), list(args))
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Read input in chunks smaller than DATA"""
+    monkeypatch.setattr(cli, "_CHUNK_SIZE", 1000)
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_calculate_file(tmp_path, capsys):
+    path = tmp_path / "data.bin"
+    path.write_bytes(DATA)
+    _run("calculate", "-a", "crc32", "-f", str(path))
+    assert capsys.readouterr().out == f"{crcengine.new('crc32')(DATA):x}\n"
+
+
+def test_calculate_empty_file(tmp_path, capsys):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    _run("calculate", "-a", "crc32", "--hex-prefix", "-f", str(path))
+    assert capsys.readouterr().out == "0x0\n"
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_calculate_stdin(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(DATA)))
+    _run("calculate", "-a", "crc16-xmodem", "--stdin")
+    assert capsys.readouterr().out == f"{crcengine.new('crc16-xmodem')(DATA):x}\n"
+
+
+@pytest.mark.parametrize("source", [["-s", "123456789"], ["--stdin"]])
+def test_calculate_jobs_rejected(capsys, source):
+    with pytest.raises(SystemExit) as excinfo:
+        _run("calculate", "-a", "crc32", "--jobs", "2", *source)
+    assert excinfo.value.code == 2
+    assert "--jobs cannot be used with -s or --stdin" in capsys.readouterr().err
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_read_chunks_pipe():
+    """Chunks of a file that can't be mapped share one buffer"""
+    chunks = [bytes(chunk) for chunk in cli._read_chunks(io.BytesIO(DATA))]  # pylint: disable=protected-access
+    assert b"".join(chunks) == DATA
+    assert len(chunks) == 11
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "a.bin").write_bytes(DATA)
+    (tmp_path / "sub" / "b.txt").write_bytes(b"123456789")
+    (tmp_path / "sub" / "deeper" / "c.txt").write_bytes(b"")
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", ["1", "3"])
+def test_calculate_paths(tree, capsys, jobs):
+    crc32 = crcengine.new("crc32")
+    status = _run(
+        "calculate", "-a", "crc32", "--jobs", jobs, str(tree / "a.bin"), str(tree / "sub"),
+        str(tree / "*.bin"))
+    assert status == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f"{crc32(DATA):08x}  {tree / 'a.bin'}",
+        f"cbf43926  {tree / 'sub' / 'b.txt'}",
+        # CRCs are padded to the width of the algorithm
+        f"00000000  {tree / 'sub' / 'deeper' / 'c.txt'}",
+        f"{crc32(DATA):08x}  {tree / 'a.bin'}",
+    ]
+
+
+def test_calculate_paths_missing(tree, capsys):
+    status = _run("calculate", "-a", "crc32", str(tree / "missing"), str(tree / "sub" / "b.txt"))
+    assert status == 1
+    captured = capsys.readouterr()
+    assert captured.out == f"cbf43926  {tree / 'sub' / 'b.txt'}\n"
+    assert "missing" in captured.err
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_check_manifest(tree, capsys, jobs):
+    _run("calculate", "-a", "crc32", str(tree))
+    manifest = tree / "manifest"
+    manifest.write_text(capsys.readouterr().out)
+    # The padded form of an empty file's CRC is accepted
+    assert f"00000000  {tree / 'sub' / 'deeper' / 'c.txt'}" in manifest.read_text()
+    status = _run("calculate", "-a", "crc32", "--jobs", jobs, "--check", str(manifest))
+    assert status == 0
+    assert capsys.readouterr().out.count(": OK\n") == 3
+    # A changed file and a missing one
+    (tree / "sub" / "b.txt").write_bytes(b"12345678")
+    (tree / "a.bin").unlink()
+    status = _run("calculate", "-a", "crc32", "--jobs", jobs, "--check", str(manifest))
+    assert status == 1
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        f"{tree / 'a.bin'}: FAILED open or read",
+        f"{tree / 'sub' / 'b.txt'}: FAILED",
+        f"{tree / 'sub' / 'deeper' / 'c.txt'}: OK",
+    ]
+    assert "1 computed checksum did NOT match" in captured.err
+
+
+def test_calculate_multi(tree, capsys):
+    names = ["crc32", "crc32-c", "crc64-ecma"]
+    _run("calculate", "-a", ",".join(names), "-s", "123456789")
+    assert capsys.readouterr().out.splitlines() == [
+        "crc32 = cbf43926", "crc32-c = e3069283", "crc64-ecma = 6c40df5f0b497347"]
+    path = tree / "a.bin"
+    _run("calculate", "-a", ",".join(names), "--hex-prefix", str(path))
+    widths = {name: crcengine.lookup_params(name).width // 4 for name in names}
+    assert capsys.readouterr().out.splitlines() == [
+        f"{name} ({path}) = 0x{crcengine.new(name)(DATA):0{widths[name]}x}" for name in names
+    ]
+    assert _run("calculate", "-a", "crc32,crc32-c", "--check", str(path)) == 2
+
+
+def test_bench(tmp_path, capsys):
+    path = tmp_path / "bench.json"
+    status = _run("bench", "-a", "crc32", "--engines", "table,nibble", "--sizes", "16,1K",
+                  "--min-time", "0.001", "--json", str(path))
+    assert status == 0
+    assert len(capsys.readouterr().out.splitlines()) == 1 + 2 + 2 * 2
+    results = json.loads(path.read_text())
+    assert [result["size"] for result in results["results"][1]["sizes"]] == [16, 1024]
+    assert _run("bench", "--engines", "table,turbo") == 2
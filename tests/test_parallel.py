@@ -0,0 +1,54 @@
+"""Unit tests for multi-process calculation"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+import crcengine
+from crcengine.parallel import _split_ranges
+
+# pylint: disable=missing-function-docstring
+
+_DATA = bytes(range(256)) * 40 + b"123456789"
+
+
+def test_split_ranges():
+    assert not _split_ranges(0, 4, 10)
+    assert _split_ranges(5, 4, 10) == [(0, 5)]
+    assert _split_ranges(100, 4, 10) == [(0, 25), (25, 25), (50, 25), (75, 25)]
+    assert _split_ranges(103, 4, 10) == [(0, 26), (26, 26), (52, 26), (78, 25)]
+    assert _split_ranges(30, 4, 10) == [(0, 10), (10, 10), (20, 10)]
+
+
+@pytest.mark.parametrize("algorithm_name", ["crc5-usb", "crc15-can", "crc32", "crc64-ecma"])
+def test_parallel_file(tmp_path, algorithm_name):
+    path = tmp_path / "data.bin"
+    path.write_bytes(_DATA)
+    expected = crcengine.new(algorithm_name)(_DATA)
+    assert crcengine.parallel_crc(algorithm_name, path, jobs=3, min_range_size=1000) == expected
+    assert crcengine.parallel_crc(algorithm_name, str(path), jobs=1) == expected
+
+
+def test_parallel_empty_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert crcengine.parallel_crc("crc32", path, jobs=2) == 0
+
+
+def test_parallel_buffer():
+    params = crcengine.CrcParams(0x07, 8, 0x55, True, False, 0x12)
+    expected = crcengine.create_from_params(params)(_DATA)
+    assert crcengine.parallel_crc(params, _DATA, jobs=3, min_range_size=1000) == expected
+    assert crcengine.parallel_crc(params, bytearray(_DATA), jobs=3,
+                                  min_range_size=1000) == expected
@@ -50,3 +50,84 @@ def test_crc5_range_window(start_bit, check_stream):
     # Compare with hand-calculated result
     assert crc_alg.calculate(check_stream.to_bytes(2, byteorder='big'), start_bit=start_bit,
                              length_bits=9) == 0b01111
+
+
+def _reference_window_crc(params, data, start_bit, length_bits):
+    """Bit at a time calculation of the windowed CRC"""
+    return _reference_ranges_crc(params, [(data, start_bit, length_bits)])
+
+
+def _reference_ranges_crc(params, ranges):
+    """Bit at a time calculation of the CRC of the concatenated ranges"""
+    bits = []
+    for data, start_bit, length_bits in ranges:
+        data_bits = []
+        for byte in data:
+            byte_bits = [(byte >> (7 - n)) & 1 for n in range(8)]
+            data_bits.extend(reversed(byte_bits) if params.reflect_in else byte_bits)
+        bits.extend(data_bits[start_bit:start_bit + length_bits])
+    register = params.seed
+    msbit = 1 << (params.width - 1)
+    for bit in bits:
+        feedback = bool(register & msbit) ^ bit
+        register = (register << 1) & ((1 << params.width) - 1)
+        if feedback:
+            register ^= params.polynomial
+    if params.reflect_out:
+        register = crcengine.bit_reverse_n(register, params.width)
+    return register ^ params.xor_out
+
+
+@pytest.mark.parametrize(
+    "params", [
+        crcengine.CrcParams(0x3, 3, 0x0, False, False, 0x7),
+        crcengine.CrcParams(0x3, 4, 0x0, True, True, 0x0),
+        crcengine.CrcParams(0x9, 7, 0x0, False, True, 0x0),
+        crcengine.CrcParams(0x7, 8, 0x5A, True, False, 0x0),
+        crcengine.CrcParams(0x4599, 15, 0x0, False, False, 0x0),
+        crcengine.CrcParams(0x1021, 16, 0x1D0F, True, False, 0x55),
+        crcengine.lookup_params("crc32"),
+    ]
+)
+def test_windowed_matches_bitwise(params):
+    """The interior of the window is processed using a table, the result must
+    match processing each bit in turn"""
+    data = bytes(range(0x35, 0x35 + 7 * 13, 7))
+    crc_alg = crcengine.calc.windowed_crc(params)
+    num_bits = 8 * len(data)
+    for start_bit in range(0, 20):
+        for length_bits in list(range(0, 26)) + [num_bits - 9 - start_bit, num_bits - start_bit]:
+            assert crc_alg.calculate(data, start_bit, length_bits) == _reference_window_crc(
+                params, data, start_bit, length_bits
+            ), (start_bit, length_bits)
+
+
+@pytest.mark.parametrize(
+    "params", [
+        crcengine.CrcParams(0x3, 3, 0x0, False, False, 0x7),
+        crcengine.CrcParams(0x1021, 16, 0x1D0F, True, False, 0x55),
+        crcengine.lookup_params("crc32"),
+    ]
+)
+def test_windowed_ranges(params):
+    data = bytes(range(0x35, 0x35 + 7 * 13, 7))
+    other = bytearray(b"\x5a\xc3\x0f")
+    crc_alg = crcengine.calc.windowed_crc(params)
+    ranges = [(3, 13), (20, 0), (17, 40), (other, 5, 11), (64, 9), (memoryview(other), 0, 24)]
+    expected = _reference_ranges_crc(
+        params, [r if len(r) == 3 else (data, *r) for r in ranges]
+    )
+    assert crc_alg.calculate_ranges(data, ranges) == expected
+    assert crc_alg.calculate_ranges(None, [(data, 0, 8 * len(data))]) == crc_alg.calculate(data)
+    assert crc_alg.calculate_ranges(data, [(0, 12), (12, 8 * len(data) - 12)]) == \
+        crc_alg.calculate(data)
+    assert crc_alg.calculate_ranges(data, []) == crc_alg.calculate(data, 0, 0)
+    assert crc_alg.calculate_ranges(data, [(3, 5)], seed=1) == crc_alg.calculate(data, 3, 5, 1)
+
+
+def test_windowed_ranges_invalid():
+    crc_alg = crcengine.calc.windowed_crc(crcengine.lookup_params("crc32"))
+    with pytest.raises(ValueError):
+        crc_alg.calculate_ranges(b"ab", [(0, 8), (9, 8)])
+    with pytest.raises(ValueError):
+        crc_alg.calculate_ranges(None, [(0, 8)])
@@ -0,0 +1,87 @@
+"""Unit tests for incremental calculation with CrcStream"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+import crcengine
+
+# pylint: disable=missing-function-docstring
+
+_DATA = bytes(range(256)) + b"123456789"
+
+
+@pytest.mark.parametrize("engine", crcengine.available_calculation_engines())
+@pytest.mark.parametrize("algorithm_name", crcengine.algorithms_available())
+def test_stream_pieces(algorithm_name, engine):
+    """Data supplied in pieces must give the same result as all at once"""
+    algorithm = crcengine.new(algorithm_name, engine)
+    expected = algorithm(_DATA)
+    crc_stream = algorithm.stream()
+    for start in range(0, len(_DATA), 37):
+        crc_stream.update(_DATA[start:start + 37])
+    assert crc_stream.crcvalue == expected
+
+
+@pytest.mark.parametrize("engine", crcengine.available_calculation_engines())
+def test_stream_empty(engine):
+    algorithm = crcengine.new("crc16-autosar", engine)
+    crc_stream = algorithm.stream()
+    crc_stream.update(b"")
+    assert crc_stream.crcvalue == 0xFFFF
+
+
+def test_stream_copy():
+    crc_stream = crcengine.stream("crc32", b"1234")
+    clone = crc_stream.copy()
+    clone.update(b"56789")
+    assert clone.crcvalue == 0xCBF43926
+    assert crc_stream.crcvalue == crcengine.new("crc32")(b"1234")
+    crc_stream.update(b"56789")
+    assert crc_stream.crcvalue == 0xCBF43926
+
+
+def test_stream_digest():
+    crc32 = crcengine.stream("crc32", b"123456789")
+    assert crc32.name == "crc32"
+    assert crc32.digest_size == 4
+    # Reflected algorithms produce little-endian digests
+    assert crc32.digest() == bytes.fromhex("2639f4cb")
+    assert crc32.hexdigest() == "2639f4cb"
+    xmodem = crcengine.stream("crc16-xmodem", b"123456789")
+    assert xmodem.digest() == bytes.fromhex("31c3")
+    # Appending the digest to the data results in a zero residue
+    assert crcengine.new("crc16-xmodem")(b"123456789" + xmodem.digest()) == 0
+    crc5 = crcengine.stream("crc5-usb", b"123456789")
+    assert crc5.digest_size == 1
+    assert crc5.hexdigest() == "19"
+
+
+@pytest.mark.parametrize("engine", ["table", "cc"])
+def test_calculate_multi(engine, monkeypatch):
+    names = ["crc32", "crc32-c", "crc64-ecma", "crc16-xmodem", "crc5-usb"]
+    # Chunks that do not divide the data evenly
+    monkeypatch.setattr(crcengine.calc, "_MULTI_CHUNK_SIZE", 100)
+    results = crcengine.calculate_multi(names, memoryview(_DATA), engine)
+    assert list(results) == names
+    assert results == {name: crcengine.new(name)(_DATA) for name in names}
+
+
+def test_multi_stream_copy():
+    names = ["crc32", "crc16-ibm"]
+    multi = crcengine.MultiCrcStream(names, b"1234")
+    clone = multi.copy()
+    clone.update(b"56789")
+    assert clone.crcvalues == crcengine.calculate_multi(names, b"123456789")
+    assert multi.crcvalues == crcengine.calculate_multi(names, b"1234")
@@ -0,0 +1,68 @@
+"""Unit tests for the stored lookup tables"""
+# This file is part of crcengine.
+#
+# crcengine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# crcengine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with crcengine.  If not, see <https://www.gnu.org/licenses/>.
+import os
+
+import pytest
+
+import crcengine
+from crcengine import tablestore
+from crcengine.calc import calculate_tables
+
+# pylint: disable=missing-function-docstring
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    tablestore.set_table_cache_dir(tmp_path)
+    crcengine.clear_caches()
+    yield tmp_path
+    tablestore.set_table_cache_dir(None)
+    crcengine.clear_caches()
+
+
+@pytest.mark.parametrize("algorithm_name", crcengine.algorithms_available())
+def test_catalogue_tables(algorithm_name):
+    """The shipped tables must match freshly calculated ones, if this fails
+    the tables need regenerating with tablestore.generate_catalogue_tables()"""
+    params = crcengine.lookup_params(algorithm_name)
+    stored = tablestore.load_tables(params.polynomial, params.width, params.reflect_in, 16)
+    assert stored == calculate_tables(params.polynomial, params.width, params.reflect_in, 16)
+
+
+def test_missing_tables():
+    assert tablestore.load_tables(0x1234567, 32, True, 1) is None
+
+
+def test_table_cache_dir(cache_dir):
+    params = crcengine.CrcParams(0x864CFB, 24, 0xB704CE, False, False, 0)
+    expected = crcengine.create_from_params(params, "generic")(b"123456789")
+    assert crcengine.create_from_params(params, "slice8")(b"123456789") == expected
+    assert os.listdir(cache_dir) == ["msb_24_864cfb.bin"]
+    assert tablestore.load_tables(0x864CFB, 24, False, 8) == calculate_tables(0x864CFB, 24,
+                                                                              False, 8)
+    # The cached tables are used by a new engine
+    crcengine.clear_caches()
+    assert crcengine.create_from_params(params, "slice8")(b"123456789") == expected
+    # Asking for more tables than were cached replaces the cached file
+    assert crcengine.create_from_params(params, "slice16")(b"123456789") == expected
+    assert tablestore.load_tables(0x864CFB, 24, False, 16) is not None
+
+
+def test_table_cache_disabled(tmp_path):
+    tablestore.set_table_cache_dir(None)
+    crcengine.clear_caches()
+    crcengine.create_from_params(crcengine.CrcParams(0x864CFB, 24, 0, True, True, 0), "slice8")
+    assert not os.listdir(tmp_path)